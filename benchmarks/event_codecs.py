@@ -0,0 +1,106 @@
+import argparse
+import dataclasses
+import datetime
+import json
+import time
+import typing
+import uuid
+
+from domain.events.base import BaseEvent
+from domain.events.categories import CategoryUpdated
+from domain.events.tasks import NewTaskCreated, TaskCompleted, TaskUpdated
+from domain.events.users import UserDeleted
+from infrastructure.codecs.events import EventCodec
+
+EVENT_TYPES = {
+    i.__name__: i
+    for i in (NewTaskCreated, TaskCompleted, TaskUpdated, CategoryUpdated, UserDeleted)
+}
+# Разбор поля JSON по его аннотации: uuid и даты приходят строками
+DECODERS = {
+    name: {
+        key: uuid.UUID if uuid.UUID in types else datetime.datetime.fromisoformat
+        for key, hint in typing.get_type_hints(event_type).items()
+        if {uuid.UUID, datetime.datetime}
+        & set(types := typing.get_args(hint) or (hint,))
+    }
+    for name, event_type in EVENT_TYPES.items()
+}
+
+
+def json_encode(event: BaseEvent) -> bytes:
+    fields = dataclasses.asdict(event)
+    fields["type"] = event.__class__.__name__
+    return json.dumps(fields, default=str, separators=(",", ":")).encode()
+
+
+def json_decode(payload: bytes) -> BaseEvent:
+    fields = json.loads(payload)
+    name = fields.pop("type")
+    for key, decoder in DECODERS[name].items():
+        if fields[key] is not None:
+            fields[key] = decoder(fields[key])
+    return EVENT_TYPES[name](**fields)
+
+
+def sample_events(count: int) -> list[BaseEvent]:
+    now = datetime.datetime.now(datetime.UTC)
+    factories = (
+        lambda i: NewTaskCreated(
+            user_oid=uuid.uuid4(),
+            category_oid=uuid.uuid4() if i % 2 else None,
+            name=f"задача {i}",
+            is_complete=False,
+            deadline=now if i % 3 else None,
+        ),
+        lambda i: TaskCompleted(task_oid=uuid.uuid4(), user_oid=uuid.uuid4()),
+        lambda i: TaskUpdated(
+            task_oid=uuid.uuid4(),
+            user_oid=uuid.uuid4(),
+            category_oid=None,
+            name=f"task {i}",
+            deadline=now,
+        ),
+        lambda i: CategoryUpdated(
+            category_oid=uuid.uuid4(), user_oid=uuid.uuid4(), title=f"category {i}"
+        ),
+        lambda i: UserDeleted(uuid.uuid4()),
+    )
+    return [factories[i % len(factories)](i) for i in range(count)]
+
+
+def measure(name: str, events: list[BaseEvent], rounds: int, encode, decode) -> None:
+    payloads = [encode(event) for event in events]
+    assert [decode(payload) for payload in payloads] == events
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for event in events:
+            encode(event)
+    encoded = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for payload in payloads:
+            decode(payload)
+    decoded = time.perf_counter() - started
+    total = len(events) * rounds
+    size = sum(len(i) for i in payloads)
+    print(
+        f"{name:<8} {total / encoded:10.0f} encode/с {total / decoded:10.0f} decode/с "
+        f"{size / len(events):8.1f} байт/событие"
+    )
+
+
+def main(count: int, rounds: int) -> None:
+    events = sample_events(count)
+    measure("json", events, rounds, json_encode, json_decode)
+    measure("binary", events, rounds, EventCodec.encode, EventCodec.decode)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Пропускная способность кодеков событий: JSON и двоичного"
+    )
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    main(args.events, args.rounds)
@@ -0,0 +1,62 @@
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+
+from starlette.concurrency import run_in_threadpool
+
+from application.api.dependencies import get_mediator
+from logic import init_container
+from logic.commands.base import BaseCommand, CommandHandler
+from logic.mediator.base import Mediator
+
+
+@dataclass(frozen=True)
+class NoopCommand(BaseCommand):
+    pass
+
+
+@dataclass(frozen=True)
+class NoopCommandHandler(CommandHandler[NoopCommand, None]):
+    async def handle(self, command: NoopCommand) -> None:
+        return None
+
+
+async def before() -> Mediator:
+    """
+    Как было: синхронная зависимость init_container уходит в пул потоков,
+    а медиатор со всеми обработчиками собирается заново на каждый запрос
+    """
+    container = await run_in_threadpool(init_container)
+    (registration,) = container.registrations[Mediator]
+    mediator = registration.builder()
+    mediator.register_command(NoopCommand, [NoopCommandHandler()])
+    return mediator
+
+
+async def after() -> Mediator:
+    return await get_mediator()
+
+
+async def measure(name: str, rounds: int, dependency) -> None:
+    await dependency()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        mediator = await dependency()
+        await mediator.handle_command(NoopCommand())
+    elapsed = time.perf_counter() - started
+    print(f"{name:<8} {elapsed / rounds * 1_000_000:10.1f} мкс/запрос")
+
+
+async def main(rounds: int) -> None:
+    (await get_mediator()).register_command(NoopCommand, [NoopCommandHandler()])
+    await measure("before", rounds, before)
+    await measure("after", rounds, after)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Накладные расходы на получение медиатора и диспетчеризацию"
+    )
+    parser.add_argument("--rounds", type=int, default=2000)
+    asyncio.run(main(parser.parse_args().rounds))
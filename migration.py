@@ -1,24 +1,28 @@
+import argparse
 import asyncio
 
-from infrastructure.repositories.models import Base
-from infrastructure.repositories.base_sqlalchemy_repository import (
-    BaseSQLAlchemyRepository,
-)
+from infrastructure.database import Database
+from infrastructure.migrations.runner import MigrationRunner
 from src.configs.config import ConfigSettings
 
 
-async def create_schema():
+async def create_schema(concurrently: bool):
     config = ConfigSettings()
     print(config)
-    async with BaseSQLAlchemyRepository(
-            _db_host=config.db_host,
-            _db_port=config.db_port,
-            _db_username=config.db_username,
-            _db_password=config.db_password,
-            _db_database=config.db_database,
-    ).async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    database = Database.from_config(config)
+    try:
+        applied = await MigrationRunner(database).upgrade(concurrently=concurrently)
+    finally:
+        await database.dispose()
+    for migration in applied:
+        print(f"applied {migration.version:04d}_{migration.name}")
 
 
 if __name__ == "__main__":
-    asyncio.run(create_schema())
+    parser = argparse.ArgumentParser(description="Применение миграций схемы")
+    parser.add_argument(
+        "--concurrently",
+        action="store_true",
+        help="строить индексы через CREATE INDEX CONCURRENTLY на работающей базе",
+    )
+    asyncio.run(create_schema(parser.parse_args().concurrently))
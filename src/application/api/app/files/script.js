@@ -29,15 +29,30 @@ document.addEventListener('DOMContentLoaded', () => {
     showLoginLink.addEventListener('click', showLoginForm);
     logoutButton.addEventListener('click', logOut);
 
+    async function fetchAllPages(url, key) {
+        const items = [];
+        let cursor = null;
+        do {
+            const pageUrl = cursor ? `${url}?cursor=${encodeURIComponent(cursor)}` : url;
+            const response = await fetch(pageUrl, {
+                method: 'get'
+            });
+            if (!response.ok) {
+                return null;
+            }
+            const page = await response.json();
+            items.push(...page[key]);
+            cursor = page.next_cursor;
+        } while (cursor);
+        return items;
+    }
+
     async function renderTodos() {
         todoListElement.innerHTML = '';
-        let response = await fetch('http://localhost:80/task/get-all', {
-            method: 'get'
-        });
-        if (!response.ok) {
+        const userTodos = await fetchAllPages('http://localhost:80/task/get-all', 'tasks');
+        if (userTodos === null) {
             showLoginForm();
         } else {
-            const userTodos = (await response.json()).tasks;
             todoCountElement.textContent = userTodos.length;
             userTodos.forEach(todo => {
                 const li = document.createElement('li');
@@ -94,14 +109,11 @@ document.addEventListener('DOMContentLoaded', () => {
 
     async function renderCategories() {
     categoryListElement.innerHTML = '';
-    let response = await fetch('http://localhost:80/category/get-all', {
-        method: 'get'
-    });
-    if (!response.ok) {
+    const userCategories = await fetchAllPages('http://localhost:80/category/get-all', 'categories');
+    if (userCategories === null) {
         showLoginForm()
     } else {
-        const data = await response.json();
-        data.categories.forEach(category => {
+        userCategories.forEach(category => {
             categories[category.oid] = category.title; // Записываем в объект categories
             const li = document.createElement('li');
             li.textContent = category.title;
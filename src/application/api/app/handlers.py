@@ -1,7 +1,13 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import FileResponse
+from joserfc.jwt import Token
 import sys
 
+from application.api.app.schemas import CacheStatsResponseSchema
+from application.api.categories.dependencies import user_auth
+from application.api.dependencies import get_list_cache
+from infrastructure.cache.user_scoped import UserScopedCache
+
 
 router = APIRouter(tags=["app"])
 
@@ -11,6 +17,19 @@ async def root():
     return FileResponse(path=r"app/files/index.html")
 
 
+@router.get(
+    "/cache/stats",
+    response_model=CacheStatsResponseSchema,
+    description="Попадания, промахи и вытеснения кэша ответов со списками",
+)
+async def cache_stats(
+    list_cache: UserScopedCache = Depends(get_list_cache),
+    authenticated: Token = Depends(user_auth),
+) -> CacheStatsResponseSchema:
+    stats = await list_cache.stats()
+    return CacheStatsResponseSchema.from_model(stats)
+
+
 @router.get("/{file}")
 async def file_get(file: str):
     try:
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+from infrastructure.cache.base import CacheStats
+
+
+class CacheStatsResponseSchema(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+
+    @classmethod
+    def from_model(cls, stats: CacheStats) -> "CacheStatsResponseSchema":
+        return CacheStatsResponseSchema(
+            hits=stats.hits, misses=stats.misses, evictions=stats.evictions
+        )
@@ -1,21 +1,22 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from joserfc.jwt import Token
-from punq import Container
 
 from application.api.categories.dependencies import user_auth
+from application.api.dependencies import get_list_cache, get_mediator
 from application.api.schemas import ErrorSchema
 import application.api.categories.schemas as categories_schemas
 from domain.exceptions.base import ApplicationException
-from logic import init_container
+from infrastructure.cache.user_scoped import UserScopedCache
 from logic.commands.categories import (
     CreateCategoryCommand,
-    GetAllCategoriesCommand,
     DeleteCategoryCommand,
     UpdateCategoryCommand,
 )
 from logic.mediator.base import Mediator
+from logic.queries.categories import GetAllCategoriesQuery
 
 
 router = APIRouter(tags=["categories"], prefix="/category")
@@ -23,33 +24,46 @@ router = APIRouter(tags=["categories"], prefix="/category")
 
 @router.get("/get-all", response_model=categories_schemas.GetAllResponseSchema)
 async def get_all_categories(
-    container: Container = Depends(init_container),
+    limit: int = Query(default=100, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+    mediator: Mediator = Depends(get_mediator),
+    list_cache: UserScopedCache = Depends(get_list_cache),
     authenticated: Token = Depends(user_auth),
-) -> categories_schemas.GetAllResponseSchema:
+) -> Response:
+    user_oid = uuid.UUID(authenticated.claims["sub"])
+
+    async def load() -> bytes:
+        categories = await mediator.handle_query(
+            GetAllCategoriesQuery(user_oid=user_oid, limit=limit, cursor=cursor)
+        )
+        return (
+            categories_schemas.GetAllResponseSchema.from_model(categories=categories)
+            .model_dump_json()
+            .encode()
+        )
+
     try:
-        mediator: Mediator = container.resolve(Mediator)
-        categories, *_ = await mediator.handle_command(
-            GetAllCategoriesCommand(user_oid=authenticated.claims["sub"])
+        content = await list_cache.get_or_load(
+            user_oid, f"categories:{limit}:{cursor}", load
         )
     except ApplicationException as exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={"error": exception.message},
         )
-    return categories_schemas.GetAllResponseSchema.from_model(categories=categories)
+    return Response(content=content, media_type="application/json")
 
 
 @router.post("/create", response_model=categories_schemas.CreateCategoryResponseSchema)
 async def create_category(
     schema: categories_schemas.CreateCategoryRequestSchema,
-    container: Container = Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
     authenticated: Token = Depends(user_auth),
 ):
     try:
-        mediator: Mediator = container.resolve(Mediator)
         category, *_ = await mediator.handle_command(
             CreateCategoryCommand(
-                user_oid=authenticated.claims["sub"], title=schema.title
+                user_oid=uuid.UUID(authenticated.claims["sub"]), title=schema.title
             )
         )
     except ApplicationException as exception:
@@ -65,11 +79,10 @@ async def create_category(
 )
 async def delete_category(
     schema: categories_schemas.DeleteCategoryRequestSchema,
-    container: Container = Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
     authenticated: Token = Depends(user_auth),
 ):
     try:
-        mediator: Mediator = container.resolve(Mediator)
         await mediator.handle_command(
             DeleteCategoryCommand(category_oid=schema.category_oid)
         )
@@ -84,11 +97,10 @@ async def delete_category(
 @router.patch("/update", response_model=categories_schemas.UpdateCategoryResponseSchema)
 async def update_category(
     schema: categories_schemas.UpdateCategoryRequestSchema,
-    container: Container = Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
     authenticated: Token = Depends(user_auth),
 ):
     try:
-        mediator: Mediator = container.resolve(Mediator)
         category, *_ = await mediator.handle_command(
             UpdateCategoryCommand(
                 category_oid=schema.category_oid, new_title=schema.title
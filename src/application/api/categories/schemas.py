@@ -2,17 +2,18 @@ import uuid
 from pydantic import BaseModel
 
 from domain.models.category import Category
+from infrastructure.repositories.read_models import CategoryReadModel
+from logic.pagination import Page
 
 
 class GetAllResponseSchema(BaseModel):
-    categories: list[dict[str, str | uuid.UUID]]
+    categories: list[CategoryReadModel]
+    next_cursor: str | None = None
 
     @classmethod
-    def from_model(cls, categories: list[Category]) -> "GetAllResponseSchema":
+    def from_model(cls, categories: Page[CategoryReadModel]) -> "GetAllResponseSchema":
         return GetAllResponseSchema(
-            categories=[
-                {"oid": i.oid, "title": i.title.as_generic_type()} for i in categories
-            ],
+            next_cursor=categories.next_cursor, categories=categories.items
         )
 
 
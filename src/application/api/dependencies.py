@@ -0,0 +1,22 @@
+from functools import lru_cache
+
+from infrastructure.cache.user_scoped import UserScopedCache
+from logic import init_container
+from logic.mediator.base import Mediator
+
+
+@lru_cache(None)
+def _resolve[T](service: type[T]) -> T:
+    return init_container().resolve(service)
+
+
+async def get_mediator() -> Mediator:
+    """
+    Медиатор собирается один раз на процесс, зависимость асинхронная,
+    чтобы FastAPI не уводил ее в пул потоков
+    """
+    return _resolve(Mediator)
+
+
+async def get_list_cache() -> UserScopedCache:
+    return _resolve(UserScopedCache)
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 import uvicorn
 
@@ -5,10 +7,30 @@ from application.api.users import handlers as users_router
 from application.api.categories import handlers as categories_handlers
 from application.api.tasks import handlers as tasks_handlers
 from application.api.app import handlers as app_handlers
+from application.api.dependencies import get_mediator
+from infrastructure.cache.base import BaseCacheBackend
+from infrastructure.database import Database
+from infrastructure.invalidation.base import BaseInvalidationBus
+from infrastructure.password_hashing.base import BasePasswordHasher
 from logic import init_container
 from configs.config import ConfigSettings
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Граф обработчиков собирается при старте, а не на первом запросе
+    mediator = await get_mediator()
+    await init_container().resolve(BaseInvalidationBus).start()
+    yield
+    # Фоновые события дообрабатываются, пока соединения с базой еще живы
+    config: ConfigSettings = init_container().resolve(ConfigSettings)
+    await mediator.close(timeout=config.event_handler_timeout)
+    await init_container().resolve(BaseInvalidationBus).stop()
+    await init_container().resolve(BaseCacheBackend).close()
+    await init_container().resolve(BasePasswordHasher).shutdown()
+    await init_container().resolve(Database).dispose()
+
+
 def start_app() -> FastAPI:
     app = FastAPI(
         title="todo",
@@ -16,6 +38,7 @@ def start_app() -> FastAPI:
         version="0.1.0",
         docs_url="/api/docs",
         redoc_url="/api/redoc",
+        lifespan=lifespan,
     )
     app.include_router(users_router.router)
     app.include_router(categories_handlers.router)
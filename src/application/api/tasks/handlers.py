@@ -1,24 +1,33 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
 from joserfc.jwt import Token
-from punq import Container
 
 from application.api.categories.dependencies import user_auth
+from application.api.dependencies import get_list_cache, get_mediator
 from application.api.schemas import ErrorSchema
 import application.api.tasks.schemas as tasks_schemas
+from application.api.tasks.importers import parse_csv, parse_ndjson
 from domain.exceptions.base import ApplicationException
-from logic import init_container
+from infrastructure.cache.user_scoped import UserScopedCache
 from logic.commands.tasks import (
     CreateTaskCommand,
-    GetAllTasksCommand,
+    ExportTasksCommand,
     DeleteTaskCommand,
     CompleteTaskCommand,
     UnCompleteTaskCommand,
     ChangeCategoryTaskCommand,
     UpdateTaskCommand,
+    BatchCreateTaskItem,
+    BatchCreateTasksCommand,
+    BatchCompleteTasksCommand,
+    BatchUnCompleteTasksCommand,
+    BatchDeleteTasksCommand,
+    ImportTasksCommand,
 )
 from logic.mediator.base import Mediator
+from logic.queries.tasks import GetAllTasksQuery, GetTasksByCategoryQuery
 
 
 router = APIRouter(tags=["tasks"], prefix="/task")
@@ -26,33 +35,108 @@ router = APIRouter(tags=["tasks"], prefix="/task")
 
 @router.get("/get-all", response_model=tasks_schemas.GetAllResponseSchema)
 async def get_all_tasks(
-    container: Container = Depends(init_container),
+    limit: int = Query(default=100, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+    mediator: Mediator = Depends(get_mediator),
+    list_cache: UserScopedCache = Depends(get_list_cache),
     authenticated: Token = Depends(user_auth),
-) -> tasks_schemas.GetAllResponseSchema:
+) -> Response:
+    user_oid = uuid.UUID(authenticated.claims["sub"])
+
+    async def load() -> bytes:
+        tasks = await mediator.handle_query(
+            GetAllTasksQuery(user_oid=user_oid, limit=limit, cursor=cursor)
+        )
+        return (
+            tasks_schemas.GetAllResponseSchema.from_model(tasks=tasks)
+            .model_dump_json()
+            .encode()
+        )
+
+    try:
+        content = await list_cache.get_or_load(
+            user_oid, f"tasks:{limit}:{cursor}", load
+        )
+    except ApplicationException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"error": exception.message},
+        )
+    return Response(content=content, media_type="application/json")
+
+
+@router.get("/get-by-category", response_model=tasks_schemas.GetAllResponseSchema)
+async def get_tasks_by_category(
+    category_oid: uuid.UUID,
+    limit: int = Query(default=100, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+    mediator: Mediator = Depends(get_mediator),
+    list_cache: UserScopedCache = Depends(get_list_cache),
+    authenticated: Token = Depends(user_auth),
+) -> Response:
+    user_oid = uuid.UUID(authenticated.claims["sub"])
+
+    async def load() -> bytes:
+        tasks = await mediator.handle_query(
+            GetTasksByCategoryQuery(
+                user_oid=user_oid,
+                category_oid=category_oid,
+                limit=limit,
+                cursor=cursor,
+            )
+        )
+        return (
+            tasks_schemas.GetAllResponseSchema.from_model(tasks=tasks)
+            .model_dump_json()
+            .encode()
+        )
+
+    try:
+        content = await list_cache.get_or_load(
+            user_oid, f"tasks_by_category:{category_oid}:{limit}:{cursor}", load
+        )
+    except ApplicationException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"error": exception.message},
+        )
+    return Response(content=content, media_type="application/json")
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    description="Все задачи пользователя в формате NDJSON, по одной на строку",
+)
+async def export_tasks(
+    mediator: Mediator = Depends(get_mediator),
+    authenticated: Token = Depends(user_auth),
+) -> StreamingResponse:
     try:
-        mediator: Mediator = container.resolve(Mediator)
         tasks, *_ = await mediator.handle_command(
-            GetAllTasksCommand(user_oid=authenticated.claims["sub"])
+            ExportTasksCommand(user_oid=uuid.UUID(authenticated.claims["sub"]))
         )
     except ApplicationException as exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={"error": exception.message},
         )
-    return tasks_schemas.GetAllResponseSchema.from_model(tasks=tasks)
+    return StreamingResponse(
+        tasks_schemas.ExportTaskSchema.to_ndjson(tasks),
+        media_type="application/x-ndjson",
+    )
 
 
 @router.post("/create", response_model=tasks_schemas.CreatTaskResponseSchema)
 async def create_tasks(
     schema: tasks_schemas.CreateTaskRequestSchema,
-    container: Container = Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
     authenticated: Token = Depends(user_auth),
 ):
     try:
-        mediator: Mediator = container.resolve(Mediator)
         task, *_ = await mediator.handle_command(
             CreateTaskCommand(
-                user_oid=authenticated.claims["sub"],
+                user_oid=uuid.UUID(authenticated.claims["sub"]),
                 category_oid=schema.category_oid,
                 name=schema.name,
                 is_complete=False,
@@ -67,15 +151,49 @@ async def create_tasks(
     return tasks_schemas.CreatTaskResponseSchema.from_model(task=task)
 
 
+@router.post("/import", response_model=tasks_schemas.ImportTasksResponseSchema)
+async def import_tasks(
+    request: Request,
+    mediator: Mediator = Depends(get_mediator),
+    authenticated: Token = Depends(user_auth),
+):
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type == "text/csv":
+        rows = parse_csv(request.stream())
+    elif content_type in ("application/x-ndjson", "application/jsonl"):
+        rows = parse_ndjson(request.stream())
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail={"error": "Ожидается text/csv или application/x-ndjson"},
+        )
+    try:
+        result, *_ = await mediator.handle_command(
+            ImportTasksCommand(
+                user_oid=uuid.UUID(authenticated.claims["sub"]), rows=rows
+            )
+        )
+    except ApplicationException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"error": exception.message},
+        )
+    return tasks_schemas.ImportTasksResponseSchema.from_model(result=result)
+
+
 @router.delete("/delete", response_model=tasks_schemas.DeleteTaskResponseSchema)
 async def delete_task(
     schema: tasks_schemas.DeleteTaskRequestSchema,
-    container: Container = Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
     authenticated: Token = Depends(user_auth),
 ):
     try:
-        mediator: Mediator = container.resolve(Mediator)
-        await mediator.handle_command(DeleteTaskCommand(task_oid=schema.task_oid))
+        await mediator.handle_command(
+            DeleteTaskCommand(
+                task_oid=schema.task_oid,
+                user_oid=uuid.UUID(authenticated.claims["sub"]),
+            )
+        )
     except ApplicationException as exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -87,12 +205,16 @@ async def delete_task(
 @router.patch("/complete", response_model=tasks_schemas.IsCompleteTaskResponseSchema)
 async def complete_task(
     schema: tasks_schemas.IsCompleteTaskRequestSchema,
-    container: Container = Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
     authenticated: Token = Depends(user_auth),
 ):
     try:
-        mediator: Mediator = container.resolve(Mediator)
-        await mediator.handle_command(CompleteTaskCommand(task_oid=schema.task_oid))
+        await mediator.handle_command(
+            CompleteTaskCommand(
+                task_oid=schema.task_oid,
+                user_oid=uuid.UUID(authenticated.claims["sub"]),
+            )
+        )
     except ApplicationException as exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -106,12 +228,16 @@ async def complete_task(
 )
 async def uncomplete_task(
     schema: tasks_schemas.IsUnCompleteTaskRequestSchema,
-    container: Container = Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
     authenticated: Token = Depends(user_auth),
 ):
     try:
-        mediator: Mediator = container.resolve(Mediator)
-        await mediator.handle_command(UnCompleteTaskCommand(task_oid=schema.task_oid))
+        await mediator.handle_command(
+            UnCompleteTaskCommand(
+                task_oid=schema.task_oid,
+                user_oid=uuid.UUID(authenticated.claims["sub"]),
+            )
+        )
     except ApplicationException as exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -125,14 +251,15 @@ async def uncomplete_task(
 )
 async def change_category(
     schema: tasks_schemas.ChangeCategoryRequestSchema,
-    container: Container = Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
     authenticated: Token = Depends(user_auth),
 ):
     try:
-        mediator: Mediator = container.resolve(Mediator)
         await mediator.handle_command(
             ChangeCategoryTaskCommand(
-                task_oid=schema.task_oid, category_oid=schema.category_oid
+                task_oid=schema.task_oid,
+                category_oid=schema.category_oid,
+                user_oid=uuid.UUID(authenticated.claims["sub"]),
             )
         )
     except ApplicationException as exception:
@@ -146,17 +273,17 @@ async def change_category(
 @router.patch("/update", response_model=tasks_schemas.UpdateTaskResponseSchema)
 async def update_category(
     schema: tasks_schemas.UpdateTaskRequestSchema,
-    container: Container = Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
     authenticated: Token = Depends(user_auth),
 ):
     try:
-        mediator: Mediator = container.resolve(Mediator)
         category, *_ = await mediator.handle_command(
             UpdateTaskCommand(
                 task_oid=schema.task_oid,
                 category_oid=schema.category_oid,
                 name=schema.name,
                 deadline=schema.deadline,
+                user_oid=uuid.UUID(authenticated.claims["sub"]),
             )
         )
     except ApplicationException as exception:
@@ -165,3 +292,96 @@ async def update_category(
             detail={"error": exception.message},
         )
     return tasks_schemas.UpdateTaskResponseSchema.from_model()
+
+
+@router.post("/batch/create", response_model=tasks_schemas.BatchTasksResponseSchema)
+async def batch_create_tasks(
+    schema: tasks_schemas.BatchCreateTasksRequestSchema,
+    mediator: Mediator = Depends(get_mediator),
+    authenticated: Token = Depends(user_auth),
+):
+    try:
+        results, *_ = await mediator.handle_command(
+            BatchCreateTasksCommand(
+                user_oid=uuid.UUID(authenticated.claims["sub"]),
+                tasks=tuple(
+                    BatchCreateTaskItem(
+                        category_oid=i.category_oid, name=i.name, deadline=i.deadline
+                    )
+                    for i in schema.tasks
+                ),
+            )
+        )
+    except ApplicationException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"error": exception.message},
+        )
+    return tasks_schemas.BatchTasksResponseSchema.from_model(results=results)
+
+
+@router.patch(
+    "/batch/complete", response_model=tasks_schemas.BatchTasksResponseSchema
+)
+async def batch_complete_tasks(
+    schema: tasks_schemas.BatchTasksRequestSchema,
+    mediator: Mediator = Depends(get_mediator),
+    authenticated: Token = Depends(user_auth),
+):
+    try:
+        results, *_ = await mediator.handle_command(
+            BatchCompleteTasksCommand(
+                task_oids=tuple(schema.task_oids),
+                user_oid=uuid.UUID(authenticated.claims["sub"]),
+            )
+        )
+    except ApplicationException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"error": exception.message},
+        )
+    return tasks_schemas.BatchTasksResponseSchema.from_model(results=results)
+
+
+@router.patch(
+    "/batch/uncomplete", response_model=tasks_schemas.BatchTasksResponseSchema
+)
+async def batch_uncomplete_tasks(
+    schema: tasks_schemas.BatchTasksRequestSchema,
+    mediator: Mediator = Depends(get_mediator),
+    authenticated: Token = Depends(user_auth),
+):
+    try:
+        results, *_ = await mediator.handle_command(
+            BatchUnCompleteTasksCommand(
+                task_oids=tuple(schema.task_oids),
+                user_oid=uuid.UUID(authenticated.claims["sub"]),
+            )
+        )
+    except ApplicationException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"error": exception.message},
+        )
+    return tasks_schemas.BatchTasksResponseSchema.from_model(results=results)
+
+
+@router.delete("/batch/delete", response_model=tasks_schemas.BatchTasksResponseSchema)
+async def batch_delete_tasks(
+    schema: tasks_schemas.BatchTasksRequestSchema,
+    mediator: Mediator = Depends(get_mediator),
+    authenticated: Token = Depends(user_auth),
+):
+    try:
+        results, *_ = await mediator.handle_command(
+            BatchDeleteTasksCommand(
+                task_oids=tuple(schema.task_oids),
+                user_oid=uuid.UUID(authenticated.claims["sub"]),
+            )
+        )
+    except ApplicationException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"error": exception.message},
+        )
+    return tasks_schemas.BatchTasksResponseSchema.from_model(results=results)
@@ -0,0 +1,122 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterable, AsyncIterator
+
+from collections import deque
+
+from logic.commands.tasks import ImportTaskRow
+from logic.exceptions.tasks import (
+    ImportLineTooLongException,
+    ImportTooLargeException,
+)
+
+# Предел длины одной строки загрузки в символах
+MAX_LINE_LENGTH = 1024 * 1024
+# Предел размера всей загрузки в байтах
+MAX_IMPORT_SIZE = 32 * 1024 * 1024
+
+
+async def iter_lines(
+    chunks: AsyncIterable[bytes],
+    max_line_length: int = MAX_LINE_LENGTH,
+    max_size: int = MAX_IMPORT_SIZE,
+) -> AsyncIterator[tuple[int, str]]:
+    """
+    Режет поток тела запроса на строки по мере поступления, не собирая
+    загрузку целиком в памяти. Строка длиннее max_line_length прерывает
+    загрузку, иначе файл без переводов строк копился бы в буфере целиком.
+    Загрузка больше max_size байт прерывается целиком
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    number = 0
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if size > max_size:
+            raise ImportTooLargeException(max_size)
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            number += 1
+            if len(line) > max_line_length:
+                raise ImportLineTooLongException(number, max_line_length)
+            yield number, line.rstrip("\r")
+        if len(buffer) > max_line_length:
+            raise ImportLineTooLongException(number + 1, max_line_length)
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield number + 1, buffer.rstrip("\r")
+
+
+async def parse_csv(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportTaskRow]:
+    """
+    CSV с заголовком по RFC 4180: поле в кавычках может занимать несколько
+    строк. Один csv.reader читает все строки подряд, но запись у него
+    забирается только когда строки в очереди заканчиваются вне кавычек,
+    иначе он принял бы конец очереди за конец данных
+    """
+    pending: deque[str] = deque()
+    reader = csv.reader(iter(pending.popleft, None))
+    header: list[str] | None = None
+    # Номер первой строки записи, ее длина и открыта ли кавычка в конце
+    start: int | None = None
+    length = 0
+    quoted = False
+    async for number, line in iter_lines(chunks):
+        if start is None:
+            if not line.strip():
+                continue
+            start, length = number, 0
+        length += len(line)
+        if length > MAX_LINE_LENGTH:
+            raise ImportLineTooLongException(start, MAX_LINE_LENGTH)
+        pending.append(line + "\n")
+        quoted ^= line.count('"') % 2 == 1
+        if quoted:
+            continue
+        record_line, start = start, None
+        values = next(reader)
+        if header is None:
+            header = [i.strip() for i in values]
+            continue
+        record = dict(zip(header, values))
+        yield ImportTaskRow(
+            line=record_line,
+            name=record.get("name"),
+            category_oid=record.get("category_oid") or None,
+            is_complete=record.get("is_complete"),
+            deadline=record.get("deadline") or None,
+        )
+    if start is not None and header is not None:
+        # Кавычка так и не закрылась до конца файла
+        yield ImportTaskRow(line=start, name=None, malformed=True)
+
+
+async def parse_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportTaskRow]:
+    async for number, line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            yield ImportTaskRow(line=number, name=None, malformed=True)
+            continue
+        yield ImportTaskRow(
+            line=number,
+            name=_as_str(record.get("name")),
+            category_oid=_as_str(record.get("category_oid")),
+            is_complete=(
+                record.get("is_complete")
+                if isinstance(record.get("is_complete"), bool)
+                else _as_str(record.get("is_complete"))
+            ),
+            deadline=_as_str(record.get("deadline")),
+        )
+
+
+def _as_str(value: object) -> str | None:
+    return None if value is None else str(value)
@@ -1,28 +1,57 @@
 import datetime
 import uuid
+from typing import AsyncIterable, AsyncIterator
 from pydantic import BaseModel, Field
 
 from domain.models.task import Task
+from infrastructure.repositories.read_models import TaskReadModel
+from logic.commands.tasks import BatchTaskResult, ImportTasksResult
+from logic.pagination import Page
 
 
 class GetAllResponseSchema(BaseModel):
-    tasks: list[dict[str, str | uuid.UUID | datetime.datetime | bool | None]]
+    tasks: list[TaskReadModel]
+    next_cursor: str | None = None
 
     @classmethod
-    def from_model(cls, tasks: list[Task]) -> "GetAllResponseSchema":
-        return GetAllResponseSchema(
-            tasks=[
-                {
-                    "oid": i.oid,
-                    "name": i.name.as_generic_type(),
-                    "category_oid": i.category_oid,
-                    "is_complete": i.is_complete,
-                    "deadline": i.deadline,
-                }
-                for i in tasks
-            ],
+    def from_model(cls, tasks: Page[TaskReadModel]) -> "GetAllResponseSchema":
+        # Модели чтения сериализуются как есть, без промежуточных словарей
+        return GetAllResponseSchema(next_cursor=tasks.next_cursor, tasks=tasks.items)
+
+
+class ExportTaskSchema(BaseModel):
+    oid: uuid.UUID
+    name: str
+    category_oid: uuid.UUID | None
+    is_complete: bool
+    deadline: datetime.datetime | None
+
+    @classmethod
+    def from_model(cls, task: Task) -> "ExportTaskSchema":
+        return ExportTaskSchema(
+            oid=task.oid,
+            name=task.name.as_generic_type(),
+            category_oid=task.category_oid,
+            is_complete=task.is_complete,
+            deadline=task.deadline,
         )
 
+    @classmethod
+    async def to_ndjson(
+        cls, tasks: AsyncIterable[Task], chunk_size: int = 500
+    ) -> AsyncIterator[bytes]:
+        """
+        Сериализует задачи в NDJSON, по chunk_size строк на кусок ответа
+        """
+        lines: list[str] = []
+        async for task in tasks:
+            lines.append(cls.from_model(task).model_dump_json())
+            if len(lines) >= chunk_size:
+                yield ("\n".join(lines) + "\n").encode("utf8")
+                lines.clear()
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf8")
+
 
 class CreateTaskRequestSchema(BaseModel):
     category_oid: uuid.UUID | None = Field(default=None)
@@ -30,6 +59,54 @@ class CreateTaskRequestSchema(BaseModel):
     deadline: datetime.datetime | None = Field(default=None)
 
 
+class BatchCreateTasksRequestSchema(BaseModel):
+    tasks: list[CreateTaskRequestSchema] = Field(min_length=1, max_length=500)
+
+
+class BatchTasksRequestSchema(BaseModel):
+    task_oids: list[uuid.UUID] = Field(min_length=1, max_length=500)
+
+
+class BatchTaskResultSchema(BaseModel):
+    task_oid: uuid.UUID | None
+    error: str | None
+
+
+class BatchTasksResponseSchema(BaseModel):
+    results: list[BatchTaskResultSchema]
+
+    @classmethod
+    def from_model(cls, results: list[BatchTaskResult]) -> "BatchTasksResponseSchema":
+        return BatchTasksResponseSchema(
+            results=[
+                BatchTaskResultSchema(task_oid=i.task_oid, error=i.error)
+                for i in results
+            ]
+        )
+
+
+class ImportTaskRejectionSchema(BaseModel):
+    line: int
+    error: str
+
+
+class ImportTasksResponseSchema(BaseModel):
+    imported: int
+    rejected_count: int
+    rejected: list[ImportTaskRejectionSchema]
+
+    @classmethod
+    def from_model(cls, result: ImportTasksResult) -> "ImportTasksResponseSchema":
+        return ImportTasksResponseSchema(
+            imported=result.imported,
+            rejected_count=result.rejected_count,
+            rejected=[
+                ImportTaskRejectionSchema(line=i.line, error=i.error)
+                for i in result.rejected
+            ],
+        )
+
+
 class CreatTaskResponseSchema(BaseModel):
     task_oid: uuid.UUID
     category_oid: uuid.UUID | None
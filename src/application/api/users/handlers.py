@@ -1,8 +1,8 @@
 import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status, Response
-from punq import Container
 
+from application.api.dependencies import get_mediator
 from application.api.schemas import ErrorSchema
 from application.api.users.schemas import (
     SignUpRequestSchema,
@@ -11,7 +11,6 @@ from application.api.users.schemas import (
     SignInResponseSchema,
 )
 from domain.exceptions.base import ApplicationException
-from logic import init_container
 from logic.commands.users import CreateUserCommand, SignInUserCommand
 from logic.mediator.base import Mediator
 
@@ -35,16 +34,15 @@ async def root():
     },
 )
 async def sign_up(
-    schema: SignUpRequestSchema, container: Container = Depends(init_container)
+    schema: SignUpRequestSchema, mediator: Mediator = Depends(get_mediator)
 ) -> SignUpResponseSchema:
     """
     Регистрация нового пользователя
     :param schema: SignUpRequestSchema
-    :param container: None
+    :param mediator: Mediator
     :return: SignUpResponseSchema
     """
     try:
-        mediator: Mediator = container.resolve(Mediator)
         user, *_ = await mediator.handle_command(
             CreateUserCommand(email=schema.email, password=schema.password)
         )
@@ -68,16 +66,15 @@ async def sign_up(
 async def sign_in(
     schema: SignInRequestSchema,
     response: Response,
-    container: Container = Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
 ) -> Response:
     """
     Аутентификация пользователя
     :param schema:
-    :param container:
+    :param mediator:
     :return: SignInResponseSchema
     """
     try:
-        mediator: Mediator = container.resolve(Mediator)
         access_token, *_ = await mediator.handle_command(
             command=SignInUserCommand(email=schema.email, password=schema.password)
         )
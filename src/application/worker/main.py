@@ -0,0 +1,46 @@
+import asyncio
+import contextlib
+import signal
+
+from configs.config import ConfigSettings
+from domain.events.base import BaseEvent
+from infrastructure.cache.base import BaseCacheBackend
+from infrastructure.database import Database
+from infrastructure.outbox.base import BaseOutbox
+from logic import init_container
+from logic.mediator.base import Mediator
+
+
+async def run_outbox_worker() -> None:
+    """
+    Доставляет события из outbox обработчикам медиатора, пока не придет
+    SIGINT или SIGTERM. Пачка, которая уже доставляется, дорабатывается
+    """
+    container = init_container()
+    config: ConfigSettings = container.resolve(ConfigSettings)
+    mediator: Mediator = container.resolve(Mediator)
+    outbox: BaseOutbox = container.resolve(BaseOutbox)
+
+    async def deliver(events: list[BaseEvent]) -> list[BaseEvent]:
+        failed = []
+        await mediator.publish(events, failed=failed)
+        return failed
+
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, stopped.set)
+    try:
+        while not stopped.is_set():
+            if await outbox.dispatch_batch(deliver):
+                continue
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stopped.wait(), config.outbox_poll_interval)
+    finally:
+        await mediator.close(timeout=config.event_handler_timeout)
+        await container.resolve(BaseCacheBackend).close()
+        await container.resolve(Database).dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_outbox_worker())
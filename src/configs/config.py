@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,3 +22,87 @@ class ConfigSettings(BaseSettings):
     db_database: str = Field(
         "todo", alias="DB_DATABASE"
     )  # По умолчанию название базы данных сервера todo
+    db_pool_size: int = Field(
+        5, alias="DB_POOL_SIZE"
+    )  # Количество постоянных соединений в пуле на процесс
+    db_max_overflow: int = Field(
+        10, alias="DB_MAX_OVERFLOW"
+    )  # Сколько соединений можно открыть сверх db_pool_size под нагрузкой
+    db_pool_recycle: int = Field(
+        1800, alias="DB_POOL_RECYCLE"
+    )  # Через сколько секунд соединение пересоздается
+    db_pool_pre_ping: bool = Field(
+        True, alias="DB_POOL_PRE_PING"
+    )  # Проверять соединение перед выдачей из пула
+    db_statement_cache_size: int = Field(
+        100, alias="DB_STATEMENT_CACHE_SIZE"
+    )  # Размер кэша подготовленных выражений asyncpg на соединение
+    db_replica_dsns: list[str] = Field(
+        default_factory=list, alias="DB_REPLICA_DSNS"
+    )  # JSON-список DSN реплик для чтения, пустой - все читается с основного
+    db_replica_max_lag: float | None = Field(
+        1.0, alias="DB_REPLICA_MAX_LAG"
+    )  # Допустимое отставание реплики в секундах, None - не проверяется вовсе
+    db_replica_lag_check_interval: float = Field(
+        5.0, alias="DB_REPLICA_LAG_CHECK_INTERVAL"
+    )  # Как часто в секундах перепроверять отставание реплики
+    db_read_your_writes_window: float = Field(
+        5.0, alias="DB_READ_YOUR_WRITES_WINDOW"
+    )  # Сколько секунд после своей записи пользователь читает с основного
+    email_check_deliverability: bool = Field(
+        False, alias="EMAIL_CHECK_DELIVERABILITY"
+    )  # Проверять при регистрации, что домен почты принимает письма (DNS)
+    email_deliverability_cache_ttl: float = Field(
+        3600.0, alias="EMAIL_DELIVERABILITY_CACHE_TTL"
+    )  # Сколько секунд помнить результат проверки домена
+    email_deliverability_timeout: int = Field(
+        5, alias="EMAIL_DELIVERABILITY_TIMEOUT"
+    )  # Таймаут DNS-запроса проверки домена в секундах
+    password_scrypt_n: int = Field(
+        2**14, alias="PASSWORD_SCRYPT_N"
+    )  # Параметр стоимости scrypt для новых хэшей, степень двойки
+    password_hash_workers: int | None = Field(
+        None, alias="PASSWORD_HASH_WORKERS"
+    )  # Процессов для хэширования паролей, по умолчанию по числу ядер
+    cache_backend: Literal["memory", "redis"] = Field(
+        "memory", alias="CACHE_BACKEND"
+    )  # Где хранить кэш ответов: в памяти процесса или на сервере Redis
+    cache_redis_url: str = Field(
+        "redis://localhost:6379/0", alias="CACHE_REDIS_URL"
+    )  # Адрес сервера, совместимого с Redis, для CACHE_BACKEND=redis
+    list_cache_max_size: int = Field(
+        10000, alias="LIST_CACHE_MAX_SIZE"
+    )  # Сколько записей держать в кэше процесса для CACHE_BACKEND=memory
+    list_cache_ttl: float = Field(
+        30.0, alias="LIST_CACHE_TTL"
+    )  # Сколько секунд страница списка живет в кэше без инвалидации
+    known_users_cache_max_size: int = Field(
+        100000, alias="KNOWN_USERS_CACHE_MAX_SIZE"
+    )  # Сколько подтвержденных oid пользователей помнить
+    known_users_cache_ttl: float = Field(
+        60.0, alias="KNOWN_USERS_CACHE_TTL"
+    )  # Через сколько секунд существование пользователя проверяется заново
+    cache_invalidation_bus: Literal["postgres", "memory"] = Field(
+        "postgres", alias="CACHE_INVALIDATION_BUS"
+    )  # Инвалидация кэшей между воркерами через LISTEN/NOTIFY или в процессе
+    event_publish_concurrency: int = Field(
+        10, alias="EVENT_PUBLISH_CONCURRENCY"
+    )  # Сколько обработчиков событий выполнять одновременно
+    event_handler_timeout: float | None = Field(
+        5.0, alias="EVENT_HANDLER_TIMEOUT"
+    )  # Секунд на один обработчик события, дальше он считается сбойным
+    event_queue_size: int = Field(
+        1000, alias="EVENT_QUEUE_SIZE"
+    )  # Сколько событий держать в очереди фоновой публикации
+    event_delivery: Literal["outbox", "inline"] = Field(
+        "outbox", alias="EVENT_DELIVERY"
+    )  # Доставлять события через таблицу outbox воркером или сразу в процессе
+    outbox_batch_size: int = Field(
+        100, alias="OUTBOX_BATCH_SIZE"
+    )  # Сколько событий outbox воркер забирает за раз
+    outbox_poll_interval: float = Field(
+        1.0, alias="OUTBOX_POLL_INTERVAL"
+    )  # Пауза воркера в секундах, когда доставлять нечего
+    outbox_max_attempts: int = Field(
+        10, alias="OUTBOX_MAX_ATTEMPTS"
+    )  # После стольких неудачных попыток событие больше не доставляется
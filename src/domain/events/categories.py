@@ -13,9 +13,11 @@ class NewCategoryCreated(BaseEvent):
 @dataclass
 class CategoryUpdated(BaseEvent):
     category_oid: uuid.UUID
+    user_oid: uuid.UUID
     title: str
 
 
 @dataclass
 class CategoryDeleted(BaseEvent):
     category_oid: uuid.UUID
+    user_oid: uuid.UUID
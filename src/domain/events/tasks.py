@@ -17,27 +17,38 @@ class NewTaskCreated(BaseEvent):
 @dataclass
 class TaskDeleted(BaseEvent):
     task_oid: uuid.UUID
+    user_oid: uuid.UUID
 
 
 @dataclass
 class TasksCategoryChanged(BaseEvent):
     task_oid: uuid.UUID
+    user_oid: uuid.UUID
     category_oid: uuid.UUID
 
 
 @dataclass
 class TaskCompleted(BaseEvent):
     task_oid: uuid.UUID
+    user_oid: uuid.UUID
 
 
 @dataclass
 class TaskUnCompleted(BaseEvent):
     task_oid: uuid.UUID
+    user_oid: uuid.UUID
 
 
 @dataclass
 class TaskUpdated(BaseEvent):
     task_oid: uuid.UUID
-    category_oid: uuid.UUID
+    user_oid: uuid.UUID
+    category_oid: uuid.UUID | None
     name: str
-    deadline: datetime.datetime
+    deadline: datetime.datetime | None
+
+
+@dataclass
+class TasksImported(BaseEvent):
+    user_oid: uuid.UUID
+    count: int
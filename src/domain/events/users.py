@@ -7,7 +7,6 @@ from domain.events.base import BaseEvent
 @dataclass
 class NewUserCreated(BaseEvent):
     email: str
-    password: str
 
 
 @dataclass
@@ -4,7 +4,11 @@ import uuid
 from domain.models.base import Base
 from domain.models.task import Task
 from domain.values.category_title import CategoryTitle
-from domain.events.categories import CategoryUpdated
+from domain.events.categories import (
+    CategoryDeleted,
+    CategoryUpdated,
+    NewCategoryCreated,
+)
 
 
 @dataclasses.dataclass
@@ -13,11 +17,28 @@ class Category(Base):
     title: CategoryTitle
     tasks: set[Task] | None = dataclasses.field(default=None)
 
+    @classmethod
+    def create_category(cls, user_oid: uuid.UUID, title: CategoryTitle) -> "Category":
+        new_category = cls(user_oid=user_oid, title=title)
+        new_category.register_event(
+            NewCategoryCreated(user_oid=user_oid, title=title.as_generic_type())
+        )
+        return new_category
+
     def update_category(self, new_title: CategoryTitle):
         self.register_event(
-            CategoryUpdated(category_oid=self.oid, title=new_title.as_generic_type())
+            CategoryUpdated(
+                category_oid=self.oid,
+                user_oid=self.user_oid,
+                title=new_title.as_generic_type(),
+            )
         )
         self.title = new_title
 
+    def delete_category(self) -> None:
+        self.register_event(
+            CategoryDeleted(category_oid=self.oid, user_oid=self.user_oid)
+        )
+
     def __hash__(self):
         return hash(self.oid)
@@ -6,10 +6,12 @@ from domain.exceptions.deadline import DeadlineInThePastException
 from domain.models.base import Base
 from domain.values.task_name import TaskName
 from domain.events.tasks import (
+    NewTaskCreated,
     TasksCategoryChanged,
     TaskUpdated,
     TaskCompleted,
     TaskUnCompleted,
+    TaskDeleted,
 )
 
 
@@ -23,20 +25,52 @@ class Task(Base):
     valid: bool = dataclasses.field(default=True)
 
     def __post_init__(self):
+        if self.valid:
+            self.check_deadline(self.deadline)
+
+    @staticmethod
+    def check_deadline(deadline: datetime.datetime | None) -> None:
         if (
-            self.valid
-            and self.deadline is not None
-            and self.deadline.timestamp() <= datetime.datetime.now().timestamp()
+            deadline is not None
+            and deadline.timestamp() <= datetime.datetime.now().timestamp()
         ):
-            raise DeadlineInThePastException(self.deadline)
+            raise DeadlineInThePastException(deadline)
 
     def __hash__(self):
         return hash(self.user_oid)
 
+    @classmethod
+    def create_task(
+        cls,
+        user_oid: uuid.UUID,
+        name: TaskName,
+        is_complete: bool,
+        deadline: datetime.datetime | None,
+        category_oid: uuid.UUID | None,
+    ) -> "Task":
+        new_task = cls(
+            user_oid=user_oid,
+            name=name,
+            is_complete=is_complete,
+            deadline=deadline,
+            category_oid=category_oid,
+        )
+        new_task.register_event(
+            NewTaskCreated(
+                user_oid=user_oid,
+                name=name.as_generic_type(),
+                category_oid=category_oid,
+                is_complete=is_complete,
+                deadline=deadline,
+            )
+        )
+        return new_task
+
     def change_category(self, category_oid: uuid.UUID) -> None:
         self.register_event(
             TasksCategoryChanged(
                 task_oid=self.oid,
+                user_oid=self.user_oid,
                 category_oid=category_oid,
             )
         )
@@ -47,6 +81,7 @@ class Task(Base):
         self.register_event(
             TaskCompleted(
                 task_oid=self.oid,
+                user_oid=self.user_oid,
             )
         )
 
@@ -55,9 +90,13 @@ class Task(Base):
         self.register_event(
             TaskUnCompleted(
                 task_oid=self.oid,
+                user_oid=self.user_oid,
             )
         )
 
+    def delete_task(self) -> None:
+        self.register_event(TaskDeleted(task_oid=self.oid, user_oid=self.user_oid))
+
     def update_task(
         self,
         new_category: uuid.UUID | None,
@@ -72,6 +111,7 @@ class Task(Base):
         self.register_event(
             TaskUpdated(
                 task_oid=self.oid,
+                user_oid=self.user_oid,
                 category_oid=new_category,
                 name=new_name.as_generic_type(),
                 deadline=new_deadline,
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
+from typing import Self
 
 
 @dataclass(frozen=True)
@@ -9,6 +10,16 @@ class BaseValueObject[T](ABC):
     def __post_init__(self):
         self.validate()
 
+    @classmethod
+    def trusted(cls, value: T) -> Self:
+        """
+        Создает объект без validate() для данных, уже проверенных при
+        записи, например загруженных из базы
+        """
+        value_object = object.__new__(cls)
+        object.__setattr__(value_object, "value", value)
+        return value_object
+
     @abstractmethod
     def validate(self): ...
 
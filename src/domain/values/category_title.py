@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Self
 
 from domain.exceptions.category_title import EmptyTextException, TitleTooLongException
 from domain.values.base import BaseValueObject
@@ -8,6 +10,13 @@ from domain.values.base import BaseValueObject
 class CategoryTitle(BaseValueObject):
     value: str
 
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def trusted(cls, value: str) -> Self:
+        # Названия категорий часто повторяются у разных пользователей,
+        # поэтому одинаковые названия разделяют один неизменяемый объект
+        return super().trusted(value)
+
     def validate(self):
         if not self.value:
             raise EmptyTextException()
@@ -11,7 +11,9 @@ class Email(BaseValueObject):
 
     def validate(self):
         try:
-            email_validator.validate_email(self.value)
+            # Только синтаксис: DNS-проверка домена блокирует цикл событий
+            # и выполняется отдельно при регистрации
+            email_validator.validate_email(self.value, check_deliverability=False)
         except email_validator.EmailNotValidError:
             raise EmailValidationException(text=self.value)
 
@@ -1,6 +1,5 @@
 from dataclasses import dataclass
 import re
-import hashlib
 
 from domain.values.base import BaseValueObject
 from domain.exceptions.password import PasswordValidationException
@@ -23,7 +22,8 @@ class Password(BaseValueObject):
             raise PasswordValidationException("минимум 6 символов")
 
     def as_generic_type(self) -> str:
-        return hashlib.sha256(self.value.encode("utf8")).hexdigest()
+        # Открытый пароль: хранится только HashedPassword, полученный от хэшера
+        return self.value
 
 
 @dataclass(frozen=True)
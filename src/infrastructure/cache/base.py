@@ -0,0 +1,35 @@
+import abc
+import dataclasses
+from typing import ClassVar
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class CacheBackendError(Exception):
+    """
+    Хранилище кэша недоступно или ответило ошибкой
+    """
+
+
+@dataclasses.dataclass
+class BaseCacheBackend(abc.ABC):
+    # Хранилище общее для всех процессов, а не своя копия в каждом
+    shared: ClassVar[bool] = False
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> bytes | None: ...
+    @abc.abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None: ...
+    @abc.abstractmethod
+    async def clear(self) -> None: ...
+    @abc.abstractmethod
+    async def evictions(self) -> int: ...
+
+    async def close(self) -> None: ...
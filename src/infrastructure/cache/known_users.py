@@ -0,0 +1,34 @@
+import dataclasses
+import uuid
+
+from infrastructure.cache.lru import LRUCache
+from infrastructure.invalidation.base import Invalidation
+
+
+@dataclasses.dataclass
+class KnownUsersCache:
+    """
+    Oid пользователей, существование которых уже проверено. Запись живет
+    не дольше ttl, удаление пользователя убирает ее сразу
+    """
+
+    _max_size: int = 100000
+    _ttl: float = 60.0
+
+    def __post_init__(self):
+        self._entries: LRUCache[str, bool] = LRUCache(self._max_size, self._ttl)
+
+    def __contains__(self, user_oid: uuid.UUID | str) -> bool:
+        return self._entries.get(str(user_oid)) is not None
+
+    def add(self, user_oid: uuid.UUID | str) -> None:
+        self._entries.set(str(user_oid), True)
+
+    def discard(self, user_oid: uuid.UUID | str) -> None:
+        self._entries.delete(str(user_oid))
+
+    async def on_invalidation(self, invalidation: Invalidation | None) -> None:
+        if invalidation is None:
+            self._entries.clear()
+        elif invalidation.entity == "user":
+            self.discard(invalidation.user_oid)
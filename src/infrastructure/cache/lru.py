@@ -0,0 +1,74 @@
+import dataclasses
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+from infrastructure.cache.base import BaseCacheBackend
+
+
+@dataclasses.dataclass
+class LRUCache[K: Hashable, V]:
+    """
+    Кэш в памяти процесса с ограничением размера и временем жизни записей:
+    при переполнении вытесняется запись, к которой дольше всего не обращались
+    """
+
+    _max_size: int = 10000
+    _ttl: float = 30.0
+    evictions: int = dataclasses.field(default=0, init=False)
+
+    def __post_init__(self):
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        self._entries[key] = (
+            time.monotonic() + (self._ttl if ttl is None else ttl),
+            value,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclasses.dataclass
+class LRUCacheBackend(BaseCacheBackend):
+    _max_size: int = 10000
+
+    def __post_init__(self):
+        self._cache: LRUCache[str, bytes] = LRUCache(self._max_size)
+
+    async def get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._cache.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    async def evictions(self) -> int:
+        return self._cache.evictions
@@ -0,0 +1,83 @@
+import contextlib
+import dataclasses
+from typing import Iterator
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from infrastructure.cache.base import BaseCacheBackend, CacheBackendError
+
+
+@contextlib.contextmanager
+def _backend_errors() -> Iterator[None]:
+    try:
+        yield
+    except (RedisError, OSError) as exception:
+        raise CacheBackendError(str(exception)) from exception
+
+
+@dataclasses.dataclass
+class RedisCacheBackend(BaseCacheBackend):
+    """
+    Кэш на сервере Redis, общий для всех воркеров. Соединения берутся из
+    блокирующего пула клиента: одновременно открыто не больше
+    max_connections, остальные запросы ждут свободное соединение
+    """
+
+    shared = True
+    _client: redis.Redis
+    _prefix: str = "todo:"
+    _clear_batch_size: int = 1000
+
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        prefix: str = "todo:",
+        max_connections: int = 10,
+        timeout: float = 1.0,
+    ) -> "RedisCacheBackend":
+        pool = redis.BlockingConnectionPool.from_url(
+            url,
+            max_connections=max_connections,
+            timeout=timeout,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+        )
+        return cls(redis.Redis(connection_pool=pool), prefix)
+
+    async def get(self, key: str) -> bytes | None:
+        with _backend_errors():
+            return await self._client.get(self._prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        with _backend_errors():
+            await self._client.set(
+                self._prefix + key, value, px=max(1, int(ttl * 1000))
+            )
+
+    async def delete(self, key: str) -> None:
+        with _backend_errors():
+            await self._client.delete(self._prefix + key)
+
+    async def clear(self) -> None:
+        # Только свои ключи и пачками: FLUSHDB задел бы чужие данные
+        keys = []
+        with _backend_errors():
+            async for key in self._client.scan_iter(
+                match=self._prefix + "*", count=self._clear_batch_size
+            ):
+                keys.append(key)
+                if len(keys) >= self._clear_batch_size:
+                    await self._client.delete(*keys)
+                    keys.clear()
+            if keys:
+                await self._client.delete(*keys)
+
+    async def evictions(self) -> int:
+        with _backend_errors():
+            info = await self._client.info("stats")
+        return int(info.get("evicted_keys", 0))
+
+    async def close(self) -> None:
+        await self._client.aclose(close_connection_pool=True)
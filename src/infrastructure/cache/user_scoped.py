@@ -0,0 +1,82 @@
+import dataclasses
+import uuid
+from typing import Awaitable, Callable
+
+from infrastructure.cache.base import BaseCacheBackend, CacheBackendError, CacheStats
+from infrastructure.invalidation.base import Invalidation
+
+
+@dataclasses.dataclass
+class UserScopedCache:
+    """
+    Read-through кэш готовых ответов пользователя. Ключ записи включает
+    версию пользователя, а инвалидация просто выдает новую версию: старые
+    записи становятся недостижимы и истекают сами. Версия берется до
+    загрузки, поэтому ответ, собранный до инвалидации, не попадет под
+    новую версию. Недоступность хранилища не ломает запросы: данные
+    читаются из базы, а устаревание ограничено ttl
+    """
+
+    _backend: BaseCacheBackend
+    _ttl: float = 30.0
+    hits: int = dataclasses.field(default=0, init=False)
+    misses: int = dataclasses.field(default=0, init=False)
+
+    async def _version(self, user_oid: str) -> bytes:
+        version = await self._backend.get(f"version:{user_oid}")
+        return b"0" if version is None else version
+
+    async def get_or_load(
+        self,
+        user_oid: uuid.UUID | str,
+        key: str,
+        load: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        try:
+            version = await self._version(str(user_oid))
+            cache_key = f"{user_oid}:{version.decode()}:{key}"
+            value = await self._backend.get(cache_key)
+        except CacheBackendError:
+            self.misses += 1
+            return await load()
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = await load()
+        try:
+            await self._backend.set(cache_key, value, self._ttl)
+        except CacheBackendError:
+            pass
+        return value
+
+    async def invalidate(self, user_oid: uuid.UUID | str) -> None:
+        # Версия живет дольше записей: когда она истечет и пользователь
+        # вернется к версии 0, старых записей этой версии уже не останется
+        try:
+            await self._backend.set(
+                f"version:{user_oid}", uuid.uuid4().hex.encode(), self._ttl * 2
+            )
+        except CacheBackendError:
+            pass
+
+    async def clear(self) -> None:
+        try:
+            await self._backend.clear()
+        except CacheBackendError:
+            pass
+
+    async def on_invalidation(self, invalidation: Invalidation | None) -> None:
+        if invalidation is not None:
+            await self.invalidate(invalidation.user_oid)
+        elif not self._backend.shared:
+            # Общее хранилище получает инвалидации напрямую от пишущих
+            # процессов, пропущенные уведомления на нем не сказываются
+            await self.clear()
+
+    async def stats(self) -> CacheStats:
+        try:
+            evictions = await self._backend.evictions()
+        except CacheBackendError:
+            evictions = 0
+        return CacheStats(hits=self.hits, misses=self.misses, evictions=evictions)
@@ -0,0 +1,177 @@
+import math
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+from sqlalchemy import URL, make_url, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from configs.config import ConfigSettings
+from infrastructure.cache.lru import LRUCache
+from infrastructure.invalidation.base import Invalidation
+
+
+@dataclass
+class Replica:
+    async_engine: AsyncEngine
+    async_session_maker: async_sessionmaker
+    lag: float = 0.0
+    checked_at: float = field(default=-math.inf)
+
+
+@dataclass
+class Database:
+    _url: URL
+    _pool_size: int = 5
+    _max_overflow: int = 10
+    _pool_recycle: int = 1800
+    _pool_pre_ping: bool = True
+    _statement_cache_size: int = 100
+    _replica_urls: tuple[URL, ...] = ()
+    _replica_max_lag: float | None = 1.0
+    _replica_lag_check_interval: float = 5.0
+    # Окно чтения своих записей, должно быть не меньше _replica_max_lag
+    _read_your_writes_window: float = 5.0
+    _recent_writers_max_size: ClassVar[int] = 100000
+    lag_query: ClassVar[str] = (
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() "
+        "THEN 0 ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+    )
+
+    def __post_init__(self):
+        self._async_engine = self._create_engine(self._url)
+        self._async_session_maker = async_sessionmaker(
+            self._async_engine, expire_on_commit=False
+        )
+        self._replicas: list[Replica] = []
+        for url in self._replica_urls:
+            async_engine = self._create_engine(url)
+            self._replicas.append(
+                Replica(
+                    async_engine=async_engine,
+                    async_session_maker=async_sessionmaker(
+                        async_engine, expire_on_commit=False
+                    ),
+                )
+            )
+        self._next_replica = 0
+        # Пользователи, недавно писавшие данные: их чтения идут на основной
+        self._recent_writers: LRUCache[str, bool] = LRUCache(
+            self._recent_writers_max_size, self._read_your_writes_window
+        )
+        self._all_pinned_until = -math.inf
+
+    def _create_engine(self, url: URL) -> AsyncEngine:
+        return create_async_engine(
+            url,
+            pool_size=self._pool_size,
+            max_overflow=self._max_overflow,
+            pool_recycle=self._pool_recycle,
+            pool_pre_ping=self._pool_pre_ping,
+            connect_args={"prepared_statement_cache_size": self._statement_cache_size},
+        )
+
+    @classmethod
+    def from_config(cls, config: ConfigSettings) -> "Database":
+        return cls(
+            _url=URL.create(
+                drivername="postgresql+asyncpg",
+                host=config.db_host,
+                port=config.db_port,
+                username=config.db_username,
+                password=config.db_password,
+                database=config.db_database,
+            ),
+            _pool_size=config.db_pool_size,
+            _max_overflow=config.db_max_overflow,
+            _pool_recycle=config.db_pool_recycle,
+            _pool_pre_ping=config.db_pool_pre_ping,
+            _statement_cache_size=config.db_statement_cache_size,
+            _replica_urls=tuple(
+                make_url(dsn).set(drivername="postgresql+asyncpg")
+                for dsn in config.db_replica_dsns
+            ),
+            _replica_max_lag=config.db_replica_max_lag,
+            _replica_lag_check_interval=config.db_replica_lag_check_interval,
+            _read_your_writes_window=config.db_read_your_writes_window,
+        )
+
+    @property
+    def async_engine(self) -> AsyncEngine:
+        return self._async_engine
+
+    @property
+    def async_session_maker(self) -> async_sessionmaker:
+        return self._async_session_maker
+
+    async def read_session_maker(
+        self, user_oid: uuid.UUID | None = None
+    ) -> async_sessionmaker:
+        """
+        Фабрика сессий для чтения: реплики по кругу, пропуская отстающие
+        больше допустимого, а без подходящих реплик основной сервер.
+        Пользователь, недавно писавший данные, читает с основного, чтобы
+        увидеть свою запись
+        """
+        if self._replicas and self._reads_own_writes(user_oid):
+            return self._async_session_maker
+        for _ in range(len(self._replicas)):
+            replica = self._replicas[self._next_replica % len(self._replicas)]
+            self._next_replica += 1
+            if await self._is_fresh(replica):
+                return replica.async_session_maker
+        return self._async_session_maker
+
+    def _reads_own_writes(self, user_oid: uuid.UUID | None) -> bool:
+        if time.monotonic() < self._all_pinned_until:
+            return True
+        return (
+            user_oid is not None
+            and self._recent_writers.get(str(user_oid)) is not None
+        )
+
+    def track_writes(self, async_session: AsyncSession) -> None:
+        """
+        Вызывается после фиксации: пользователи, чьи данные изменила
+        транзакция (их инвалидации в async_session.info), на время окна
+        читают с основного сервера
+        """
+        for invalidation in async_session.info.get("invalidations", ()):
+            self._recent_writers.set(str(invalidation.user_oid), True)
+
+    async def on_invalidation(self, invalidation: Invalidation | None) -> None:
+        """
+        Записи в других процессах. None - уведомления могли потеряться,
+        поэтому на время окна все чтения идут на основной
+        """
+        if invalidation is None:
+            self._all_pinned_until = time.monotonic() + self._read_your_writes_window
+        else:
+            self._recent_writers.set(str(invalidation.user_oid), True)
+
+    async def _is_fresh(self, replica: Replica) -> bool:
+        if self._replica_max_lag is None:
+            return True
+        now = time.monotonic()
+        if now - replica.checked_at >= self._replica_lag_check_interval:
+            replica.checked_at = now
+            try:
+                async with replica.async_engine.connect() as connection:
+                    replica.lag = float(
+                        await connection.scalar(text(self.lag_query)) or 0.0
+                    )
+            except (OSError, SQLAlchemyError):
+                replica.lag = math.inf
+        return replica.lag <= self._replica_max_lag
+
+    async def dispose(self) -> None:
+        await self._async_engine.dispose()
+        for replica in self._replicas:
+            await replica.async_engine.dispose()
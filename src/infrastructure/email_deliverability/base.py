@@ -0,0 +1,14 @@
+import abc
+import dataclasses
+
+
+@dataclasses.dataclass
+class BaseEmailDeliverabilityChecker(abc.ABC):
+    @abc.abstractmethod
+    async def is_deliverable(self, email: str) -> bool: ...
+
+
+@dataclasses.dataclass
+class NoopEmailDeliverabilityChecker(BaseEmailDeliverabilityChecker):
+    async def is_deliverable(self, email: str) -> bool:
+        return True
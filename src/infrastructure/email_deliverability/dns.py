@@ -0,0 +1,63 @@
+import asyncio
+import dataclasses
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import email_validator
+
+from infrastructure.email_deliverability.base import BaseEmailDeliverabilityChecker
+
+
+@dataclasses.dataclass
+class DNSEmailDeliverabilityChecker(BaseEmailDeliverabilityChecker):
+    """
+    Проверяет MX/A записи домена в отдельном пуле потоков, чтобы медленный
+    DNS не блокировал цикл событий. Результат кэшируется по домену на
+    _cache_ttl секунд, одновременные запросы одного домена ждут одну проверку
+    """
+
+    _cache_ttl: float = 3600.0
+    _timeout: int = 5
+    _max_workers: int = 4
+    _cache: dict[str, tuple[float, bool]] = dataclasses.field(
+        default_factory=dict, init=False
+    )
+    _pending: dict[str, asyncio.Future[bool]] = dataclasses.field(
+        default_factory=dict, init=False
+    )
+
+    def __post_init__(self):
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="email-deliverability"
+        )
+
+    async def is_deliverable(self, email: str) -> bool:
+        domain = email.rpartition("@")[2].lower()
+        cached = self._cache.get(domain)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        pending = self._pending.get(domain)
+        if pending is not None:
+            return await pending
+        pending = asyncio.get_running_loop().run_in_executor(
+            self._executor, self._check, email
+        )
+        self._pending[domain] = pending
+        try:
+            deliverable = await pending
+        finally:
+            del self._pending[domain]
+        self._cache[domain] = (time.monotonic() + self._cache_ttl, deliverable)
+        return deliverable
+
+    def _check(self, email: str) -> bool:
+        try:
+            email_validator.validate_email(
+                email, check_deliverability=True, timeout=self._timeout
+            )
+        except email_validator.EmailUndeliverableError:
+            return False
+        except email_validator.EmailNotValidError:
+            # Синтаксис проверяется в Email, здесь важен только домен
+            return True
+        return True
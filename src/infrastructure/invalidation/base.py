@@ -0,0 +1,70 @@
+import abc
+import asyncio
+import dataclasses
+import uuid
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclasses.dataclass(frozen=True)
+class Invalidation:
+    """
+    Изменились данные вида entity (task, category, user) пользователя
+    """
+
+    entity: str
+    user_oid: uuid.UUID
+
+    def encode(self) -> str:
+        return f"{self.entity}:{self.user_oid}"
+
+    @classmethod
+    def decode(cls, payload: str) -> "Invalidation":
+        entity, _, user_oid = payload.partition(":")
+        return cls(entity=entity, user_oid=uuid.UUID(user_oid))
+
+
+# None - сбросить все: уведомления могли быть потеряны
+type InvalidationSubscriber = Callable[[Invalidation | None], Awaitable[None]]
+
+
+@dataclasses.dataclass
+class BaseInvalidationBus(abc.ABC):
+    """
+    Шина инвалидации кэшей между процессами. Репозитории публикуют
+    изменения внутри транзакции, подписчики получают их только после
+    фиксации
+    """
+
+    _subscribers: list[InvalidationSubscriber] = dataclasses.field(
+        default_factory=list, init=False
+    )
+    _deliveries: set[asyncio.Task] = dataclasses.field(
+        default_factory=set, init=False
+    )
+
+    def subscribe(self, subscriber: InvalidationSubscriber) -> None:
+        self._subscribers.append(subscriber)
+
+    def _dispatch(self, invalidation: Invalidation | None) -> None:
+        """
+        Вызывается из синхронных колбэков драйвера и сессии, поэтому
+        доставка подписчикам идет отдельной задачей
+        """
+        delivery = asyncio.create_task(self._deliver(invalidation))
+        self._deliveries.add(delivery)
+        delivery.add_done_callback(self._deliveries.discard)
+
+    async def _deliver(self, invalidation: Invalidation | None) -> None:
+        for subscriber in self._subscribers:
+            await subscriber(invalidation)
+
+    @abc.abstractmethod
+    async def publish(
+        self, async_session: AsyncSession, invalidation: Invalidation
+    ) -> None: ...
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
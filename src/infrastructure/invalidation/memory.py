@@ -0,0 +1,34 @@
+import dataclasses
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.invalidation.base import BaseInvalidationBus, Invalidation
+
+
+@dataclasses.dataclass
+class InMemoryInvalidationBus(BaseInvalidationBus):
+    """
+    Шина в пределах одного процесса, для тестов и запуска в один воркер
+    """
+
+    async def publish(
+        self, async_session: AsyncSession, invalidation: Invalidation
+    ) -> None:
+        # Как и NOTIFY, изменение доставляется только при фиксации: после
+        # отката оба слушателя снимаются, иначе сессия отдала бы его при
+        # следующей фиксации
+        session = async_session.sync_session
+
+        def on_commit(_) -> None:
+            event.remove(session, "after_soft_rollback", on_rollback)
+            self._dispatch(invalidation)
+
+        def on_rollback(_, previous_transaction) -> None:
+            if previous_transaction.nested:
+                return
+            event.remove(session, "after_commit", on_commit)
+            event.remove(session, "after_soft_rollback", on_rollback)
+
+        event.listen(session, "after_commit", on_commit, once=True)
+        event.listen(session, "after_soft_rollback", on_rollback)
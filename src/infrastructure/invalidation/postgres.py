@@ -0,0 +1,89 @@
+import asyncio
+import dataclasses
+from typing import ClassVar
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database import Database
+from infrastructure.invalidation.base import BaseInvalidationBus, Invalidation
+
+
+@dataclasses.dataclass
+class PostgresInvalidationBus(BaseInvalidationBus):
+    """
+    Публикация через pg_notify в транзакции изменения: Postgres доставит
+    уведомление только после COMMIT и схлопнет повторы внутри транзакции.
+    Каждый процесс слушает канал на отдельном соединении вне пула
+    """
+
+    _database: Database
+    _channel: str = "cache_invalidation"
+    _min_reconnect_delay: float = 0.5
+    _max_reconnect_delay: float = 30.0
+    _listener: asyncio.Task | None = dataclasses.field(default=None, init=False)
+    connect_errors: ClassVar[tuple[type[Exception], ...]] = (
+        OSError,
+        asyncio.TimeoutError,
+        asyncpg.PostgresError,
+        asyncpg.InterfaceError,
+    )
+
+    async def publish(
+        self, async_session: AsyncSession, invalidation: Invalidation
+    ) -> None:
+        await async_session.execute(
+            select(func.pg_notify(self._channel, invalidation.encode()))
+        )
+
+    async def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+
+    async def _listen(self) -> None:
+        url = self._database.async_engine.url
+        delay = self._min_reconnect_delay
+        while True:
+            try:
+                connection = await asyncpg.connect(
+                    host=url.host,
+                    port=url.port,
+                    user=url.username,
+                    password=url.password,
+                    database=url.database,
+                )
+            except self.connect_errors:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+                continue
+            delay = self._min_reconnect_delay
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _: closed.set())
+            try:
+                await connection.add_listener(self._channel, self._on_notify)
+                # Пока процесс не слушал канал, уведомления могли пройти мимо
+                self._dispatch(None)
+                await closed.wait()
+            except self.connect_errors:
+                pass
+            finally:
+                if not connection.is_closed():
+                    await connection.close()
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            invalidation = Invalidation.decode(payload)
+        except ValueError:
+            return
+        self._dispatch(invalidation)
@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class IndexDefinition:
+    name: str
+    table: str
+    columns: str
+    where: str | None = None
+
+    def create_statement(self, concurrently: bool) -> str:
+        return (
+            f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS "
+            f"{self.name} ON {self.table} ({self.columns})"
+            + (f" WHERE {self.where}" if self.where else "")
+        )
+
+    def drop_statement(self, concurrently: bool) -> str:
+        return (
+            f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}IF EXISTS "
+            f"public.{self.name}"
+        )
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    Версия схемы: statements выполняются в одной транзакции, indexes могут
+    строиться через CREATE INDEX CONCURRENTLY на работающей базе
+    """
+
+    version: int
+    name: str
+    statements: tuple[str, ...] = field(default=())
+    indexes: tuple[IndexDefinition, ...] = field(default=())
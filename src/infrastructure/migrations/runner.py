@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from infrastructure.database import Database
+from infrastructure.migrations.base import IndexDefinition, Migration
+from infrastructure.migrations.versions import MIGRATIONS
+
+
+@dataclass
+class MigrationRunner:
+    """
+    Применяет недостающие миграции по порядку версий и записывает их в
+    public.schema_migration. С concurrently=True индексы строятся через
+    CREATE INDEX CONCURRENTLY, не блокируя запись в таблицы
+    """
+
+    _database: Database
+    _migrations: tuple[Migration, ...] = MIGRATIONS
+    lock_key: ClassVar[int] = 7_106_409_226_331_603_826
+
+    async def upgrade(self, concurrently: bool = False) -> list[Migration]:
+        async with self._database.async_engine.connect() as connection:
+            connection = await connection.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            await connection.execute(
+                text("SELECT pg_advisory_lock(:key)"), {"key": self.lock_key}
+            )
+            try:
+                await connection.execute(
+                    text(
+                        "CREATE TABLE IF NOT EXISTS public.schema_migration ("
+                        "version INTEGER PRIMARY KEY, "
+                        "name VARCHAR NOT NULL, "
+                        "applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now())"
+                    )
+                )
+                applied = set(
+                    (
+                        await connection.scalars(
+                            text("SELECT version FROM public.schema_migration")
+                        )
+                    ).all()
+                )
+                pending = sorted(
+                    (i for i in self._migrations if i.version not in applied),
+                    key=lambda migration: migration.version,
+                )
+                for migration in pending:
+                    await self._apply(connection, migration, concurrently)
+            finally:
+                await connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": self.lock_key}
+                )
+        return pending
+
+    async def _apply(
+        self, connection: AsyncConnection, migration: Migration, concurrently: bool
+    ) -> None:
+        async with self._database.async_engine.begin() as transaction:
+            for statement in migration.statements:
+                await transaction.execute(text(statement))
+            if not concurrently:
+                for index in migration.indexes:
+                    await transaction.execute(text(index.create_statement(False)))
+                await self._record(transaction, migration)
+        if not concurrently:
+            return
+        # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+        for index in migration.indexes:
+            if await self._is_invalid(connection, index):
+                await connection.execute(text(index.drop_statement(True)))
+            await connection.execute(text(index.create_statement(True)))
+        await self._record(connection, migration)
+
+    @staticmethod
+    async def _is_invalid(connection: AsyncConnection, index: IndexDefinition) -> bool:
+        """
+        Прерванная сборка CONCURRENTLY оставляет невалидный индекс, который
+        IF NOT EXISTS пропустил бы
+        """
+        return bool(
+            await connection.scalar(
+                text(
+                    "SELECT NOT indisvalid FROM pg_index "
+                    "WHERE indexrelid = to_regclass(:name)"
+                ),
+                {"name": f"public.{index.name}"},
+            )
+        )
+
+    @staticmethod
+    async def _record(connection: AsyncConnection, migration: Migration) -> None:
+        await connection.execute(
+            text(
+                "INSERT INTO public.schema_migration (version, name) "
+                "VALUES (:version, :name)"
+            ),
+            {"version": migration.version, "name": migration.name},
+        )
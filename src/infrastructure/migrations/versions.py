@@ -0,0 +1,100 @@
+from infrastructure.migrations.base import IndexDefinition, Migration
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        version=1,
+        name="initial_schema",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS public."user" (
+                email VARCHAR NOT NULL,
+                password VARCHAR NOT NULL,
+                oid UUID NOT NULL,
+                PRIMARY KEY (oid),
+                UNIQUE (email)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS public.category (
+                user_oid UUID NOT NULL,
+                title VARCHAR NOT NULL,
+                oid UUID NOT NULL,
+                PRIMARY KEY (oid),
+                FOREIGN KEY(user_oid) REFERENCES public."user" (oid)
+                    ON DELETE cascade ON UPDATE cascade
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS public.task (
+                name VARCHAR NOT NULL,
+                is_complete BOOLEAN NOT NULL,
+                deadline TIMESTAMP WITH TIME ZONE,
+                user_oid UUID NOT NULL,
+                category_oid UUID,
+                oid UUID NOT NULL,
+                PRIMARY KEY (oid),
+                FOREIGN KEY(user_oid) REFERENCES public."user" (oid)
+                    ON DELETE cascade ON UPDATE cascade,
+                FOREIGN KEY(category_oid) REFERENCES public.category (oid)
+                    ON DELETE cascade ON UPDATE cascade
+            )
+            """,
+        ),
+    ),
+    Migration(
+        version=2,
+        name="hot_path_indexes",
+        indexes=(
+            # Keyset-пагинация списков и каскадное удаление пользователя
+            IndexDefinition("ix_task_user_oid_oid", "public.task", "user_oid, oid"),
+            IndexDefinition(
+                "ix_category_user_oid_oid", "public.category", "user_oid, oid"
+            ),
+            # Каскадное удаление и перенос задач при удалении категории
+            IndexDefinition("ix_task_category_oid", "public.task", "category_oid"),
+            # Выборки задач пользователя по статусу и сроку
+            IndexDefinition(
+                "ix_task_user_oid_is_complete_deadline",
+                "public.task",
+                "user_oid, is_complete, deadline",
+            ),
+            IndexDefinition(
+                "ix_task_incomplete_user_oid_deadline",
+                "public.task",
+                "user_oid, deadline",
+                where="NOT is_complete",
+            ),
+        ),
+    ),
+    Migration(
+        version=3,
+        name="task_category_listing_index",
+        indexes=(
+            # Keyset-пагинация задач одной категории пользователя
+            IndexDefinition(
+                "ix_task_user_oid_category_oid_oid",
+                "public.task",
+                "user_oid, category_oid, oid",
+            ),
+        ),
+    ),
+    Migration(
+        version=4,
+        name="event_outbox",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS public.event_outbox (
+                oid UUID NOT NULL,
+                position BIGINT GENERATED ALWAYS AS IDENTITY,
+                event_type VARCHAR NOT NULL,
+                payload BYTEA NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+                available_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+                PRIMARY KEY (oid),
+                UNIQUE (position)
+            )
+            """,
+        ),
+    ),
+)
@@ -0,0 +1,31 @@
+import abc
+import dataclasses
+from typing import Awaitable, Callable, Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.events.base import BaseEvent
+
+# Доставляет пачку событий и возвращает те, что доставить не удалось
+type OutboxHandler = Callable[[list[BaseEvent]], Awaitable[Iterable[BaseEvent]]]
+
+
+@dataclasses.dataclass
+class BaseOutbox(abc.ABC):
+    """
+    Исходящие события: пишутся в той же транзакции, что и изменение
+    состояния, и доставляются отдельным процессом хотя бы один раз
+    """
+
+    @abc.abstractmethod
+    async def add(
+        self, async_session: AsyncSession, events: Iterable[BaseEvent]
+    ) -> None: ...
+
+    @abc.abstractmethod
+    async def dispatch_batch(self, handler: OutboxHandler) -> int:
+        """
+        Забирает пачку готовых к доставке событий и передает ее handler.
+        Доставленные удаляются, остальные откладываются на повтор.
+        Возвращает размер пачки, 0 - доставлять нечего
+        """
@@ -0,0 +1,106 @@
+import dataclasses
+import struct
+from typing import Iterable
+
+from sqlalchemy import (
+    Uuid,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.events.base import BaseEvent
+from infrastructure.codecs.events import EventCodec, UnknownEventTypeError
+from infrastructure.database import Database
+from infrastructure.outbox.base import BaseOutbox, OutboxHandler
+from infrastructure.repositories.models import OutboxEvent
+
+
+@dataclasses.dataclass
+class SQLAlchemyOutbox(BaseOutbox):
+    """
+    Пачка забирается через FOR UPDATE SKIP LOCKED, поэтому воркеров можно
+    запускать несколько: строки, которые уже доставляет другой воркер,
+    пропускаются. Порядок событий соблюдается только внутри пачки.
+    Событие, не доставленное за max_attempts попыток, остается в таблице
+    и больше не забирается
+    """
+
+    _database: Database
+    _batch_size: int = 100
+    _max_attempts: int = 10
+    # Предел паузы между повторами в секундах, пауза растет как 2**attempts
+    _max_backoff: float = 300.0
+
+    async def add(
+        self, async_session: AsyncSession, events: Iterable[BaseEvent]
+    ) -> None:
+        rows = [
+            {
+                "oid": event.oid,
+                "event_type": event.__class__.__name__,
+                "payload": EventCodec.encode(event),
+            }
+            for event in events
+        ]
+        if rows:
+            await async_session.execute(insert(OutboxEvent), rows)
+
+    async def dispatch_batch(self, handler: OutboxHandler) -> int:
+        async with self._database.async_session_maker() as async_session:
+            async with async_session.begin():
+                rows = (
+                    await async_session.execute(
+                        select(OutboxEvent.oid, OutboxEvent.payload)
+                        .filter(
+                            OutboxEvent.available_at <= func.now(),
+                            OutboxEvent.attempts < self._max_attempts,
+                        )
+                        .order_by(OutboxEvent.position)
+                        .limit(self._batch_size)
+                        .with_for_update(skip_locked=True)
+                    )
+                ).all()
+                if not rows:
+                    return 0
+                events = []
+                failed = set()
+                for oid, payload in rows:
+                    try:
+                        events.append(EventCodec.decode(payload))
+                    except (UnknownEventTypeError, struct.error, TypeError, ValueError):
+                        failed.add(oid)
+                failed.update(event.oid for event in await handler(events))
+                delivered = [oid for oid, _ in rows if oid not in failed]
+                if delivered:
+                    await async_session.execute(
+                        delete(OutboxEvent)
+                        .filter(OutboxEvent.oid == any_(_oids("delivered", delivered)))
+                        .execution_options(synchronize_session=False)
+                    )
+                if failed:
+                    await async_session.execute(
+                        update(OutboxEvent)
+                        .filter(OutboxEvent.oid == any_(_oids("failed", failed)))
+                        .values(
+                            attempts=OutboxEvent.attempts + 1,
+                            available_at=func.now()
+                            + func.least(
+                                func.power(2, OutboxEvent.attempts), self._max_backoff
+                            )
+                            * literal_column("interval '1 second'"),
+                        )
+                        .execution_options(synchronize_session=False)
+                    )
+            return len(rows)
+
+
+def _oids(name: str, oids: Iterable) -> bindparam:
+    return bindparam(name, list(oids), type_=ARRAY(Uuid))
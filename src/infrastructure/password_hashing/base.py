@@ -0,0 +1,22 @@
+import abc
+import dataclasses
+
+
+@dataclasses.dataclass
+class BasePasswordHasher(abc.ABC):
+    @abc.abstractmethod
+    async def hash(self, password: str) -> str: ...
+    @abc.abstractmethod
+    async def verify(self, password: str, hashed_password: str) -> bool: ...
+    @property
+    @abc.abstractmethod
+    def dummy_hash(self) -> str:
+        """
+        Хэш с текущими параметрами, которому не подходит ни один пароль:
+        проверка по нему длится столько же, сколько по настоящему
+        """
+
+    @abc.abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool: ...
+    @abc.abstractmethod
+    async def shutdown(self) -> None: ...
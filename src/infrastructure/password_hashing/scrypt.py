@@ -0,0 +1,136 @@
+import asyncio
+import base64
+import dataclasses
+import hashlib
+import hmac
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import ClassVar
+
+from infrastructure.password_hashing.base import BasePasswordHasher
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int, dklen: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode("utf8"),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        dklen=dklen,
+        maxmem=256 * n * r + 1024 * 1024,
+    )
+
+
+def _encode(value: bytes) -> str:
+    return base64.urlsafe_b64encode(value).rstrip(b"=").decode("ascii")
+
+
+def _decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+@dataclasses.dataclass
+class ScryptPasswordHasher(BasePasswordHasher):
+    """
+    Хэши в формате scrypt$n$r$p$соль$ключ: параметры хранятся вместе с
+    хэшем, поэтому их можно усиливать, не ломая старые пароли. Вычисления
+    идут в пуле процессов, чтобы не занимать цикл событий, а число
+    ожидающих в очереди ограничено. Старые несоленые sha256-хэши
+    принимаются и помечаются для перехэширования
+    """
+
+    _n: int = 2**14
+    _r: int = 8
+    _p: int = 1
+    _max_workers: int | None = None
+    _max_pending: int | None = None
+    algorithm: ClassVar[str] = "scrypt"
+    salt_size: ClassVar[int] = 16
+    key_size: ClassVar[int] = 32
+
+    def __post_init__(self):
+        self._max_workers = self._max_workers or os.cpu_count() or 1
+        self._executor: ProcessPoolExecutor | None = None
+        self._semaphore = asyncio.Semaphore(self._max_pending or self._max_workers * 4)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: рабочие процессы не наследуют потоки и соединения сервера
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def _run_scrypt(
+        self, password: str, salt: bytes, n: int, r: int, p: int, dklen: int
+    ) -> bytes:
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), _scrypt, password, salt, n, r, p, dklen
+            )
+
+    async def hash(self, password: str) -> str:
+        salt = os.urandom(self.salt_size)
+        key = await self._run_scrypt(
+            password, salt, self._n, self._r, self._p, self.key_size
+        )
+        return "$".join(
+            (
+                self.algorithm,
+                str(self._n),
+                str(self._r),
+                str(self._p),
+                _encode(salt),
+                _encode(key),
+            )
+        )
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        if self._is_legacy(hashed_password):
+            return hmac.compare_digest(
+                hashlib.sha256(password.encode("utf8")).hexdigest(), hashed_password
+            )
+        try:
+            algorithm, n, r, p, salt, key = hashed_password.split("$")
+            expected = _decode(key)
+            if algorithm != self.algorithm:
+                return False
+            actual = await self._run_scrypt(
+                password, _decode(salt), int(n), int(r), int(p), len(expected)
+            )
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
+
+    @property
+    def dummy_hash(self) -> str:
+        # Нулевой ключ: scrypt выполняется полностью, но совпасть не может
+        return "$".join(
+            (
+                self.algorithm,
+                str(self._n),
+                str(self._r),
+                str(self._p),
+                _encode(bytes(self.salt_size)),
+                _encode(bytes(self.key_size)),
+            )
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        if self._is_legacy(hashed_password):
+            return True
+        return not hashed_password.startswith(
+            f"{self.algorithm}${self._n}${self._r}${self._p}$"
+        )
+
+    @staticmethod
+    def _is_legacy(hashed_password: str) -> bool:
+        return "$" not in hashed_password
+
+    async def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
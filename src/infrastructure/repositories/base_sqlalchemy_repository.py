@@ -1,32 +1,94 @@
 import abc
-from dataclasses import dataclass
-from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncEngine, create_async_engine
-from sqlalchemy import URL
+import uuid
+from dataclasses import dataclass, field
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import InstrumentedAttribute
+
+from infrastructure.database import Database
+from infrastructure.invalidation.base import BaseInvalidationBus, Invalidation
+from infrastructure.invalidation.memory import InMemoryInvalidationBus
+from infrastructure.unit_of_work.sqlalchemy import get_current_session
+
+
+def keyset_page(
+    query: Select,
+    key: InstrumentedAttribute,
+    limit: int,
+    after: uuid.UUID | None = None,
+) -> Select:
+    """
+    Страница по возрастанию key, начиная сразу после after: без OFFSET,
+    поэтому дальние страницы стоят столько же, сколько первая
+    """
+    if after is not None:
+        query = query.filter(key > after)
+    return query.order_by(key).limit(limit)
 
 
 @dataclass
-class BaseSQLAlchemyRepository(abc.ABC):
-    _db_host: str
-    _db_port: int
-    _db_username: str
-    _db_password: str
-    _db_database: str
-
-    def __post_init__(self):
-        self._async_engine: AsyncEngine = create_async_engine(
-            URL.create(
-                drivername="postgresql+asyncpg",
-                host=self._db_host,
-                port=self._db_port,
-                username=self._db_username,
-                password=self._db_password,
-                database=self._db_database,
-            )
-        )
-        self._async_session_maker = async_sessionmaker(
-            self._async_engine, expire_on_commit=False
+class RepositorySession:
+    """
+    Сессия текущего Unit of Work, если он открыт, иначе собственная
+    сессия, которая фиксируется при выходе
+    """
+
+    _database: Database
+    _read_only: bool = False
+    _own_session: AsyncSession | None = field(default=None, init=False)
+
+    async def __aenter__(self) -> AsyncSession:
+        async_session = get_current_session()
+        if async_session is not None:
+            return async_session
+        async_session_maker = (
+            await self._database.read_session_maker()
+            if self._read_only
+            else self._database.async_session_maker
         )
+        self._own_session = async_session_maker()
+        return self._own_session
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if self._own_session is None:
+            return
+        try:
+            if exc_type is None:
+                await self._own_session.commit()
+                self._database.track_writes(self._own_session)
+        finally:
+            await self._own_session.close()
+
+
+@dataclass
+class BaseSQLAlchemyRepository(abc.ABC):
+    _database: Database
+    _invalidation_bus: BaseInvalidationBus = field(
+        default_factory=InMemoryInvalidationBus
+    )
 
     @property
-    def async_engine(self):
-        return self._async_engine
+    def _async_session_maker(self) -> async_sessionmaker:
+        return self._database.async_session_maker
+
+    @property
+    def async_engine(self) -> AsyncEngine:
+        return self._database.async_engine
+
+    def _session(self, read_only: bool = False) -> RepositorySession:
+        return RepositorySession(self._database, read_only)
+
+    async def _invalidate(
+        self, async_session: AsyncSession, entity: str, user_oid: uuid.UUID
+    ) -> None:
+        """
+        Сообщает другим процессам об изменении данных пользователя, не
+        чаще одного раза на вид данных за транзакцию
+        """
+        invalidation = Invalidation(entity=entity, user_oid=user_oid)
+        published = async_session.info.setdefault("invalidations", set())
+        if invalidation in published:
+            return
+        published.add(invalidation)
+        await self._invalidation_bus.publish(async_session, invalidation)
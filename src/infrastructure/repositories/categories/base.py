@@ -4,6 +4,7 @@ import uuid
 from typing import Iterable
 
 from domain.models.category import Category
+from infrastructure.repositories.read_models import CategoryReadModel
 
 
 @dataclasses.dataclass
@@ -17,8 +18,14 @@ class BaseCategoryRepository(abc.ABC):
     @abc.abstractmethod
     async def delete_category(self, category_oid: uuid.UUID) -> None: ...
     @abc.abstractmethod
-    async def get_categories(
-        self, user_oid: uuid.UUID
-    ) -> Iterable[Category] | None: ...
+    async def get_category_read_models(
+        self, user_oid: uuid.UUID, limit: int, after_oid: uuid.UUID | None = None
+    ) -> list[CategoryReadModel]: ...
     @abc.abstractmethod
-    async def get_category_by_oid(self, category_oid: uuid.UUID) -> Category | None: ...
+    async def get_owned_category_oids(
+        self, category_oids: Iterable[uuid.UUID], user_oid: uuid.UUID
+    ) -> set[uuid.UUID]: ...
+    @abc.abstractmethod
+    async def get_category_by_oid(
+        self, category_oid: uuid.UUID, user_oid: uuid.UUID | None = None
+    ) -> Category | None: ...
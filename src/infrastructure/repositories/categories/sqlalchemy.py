@@ -2,34 +2,36 @@ import dataclasses
 import uuid
 from typing import Iterable
 
-from sqlalchemy import update, delete, select
+from sqlalchemy import Uuid, any_, bindparam, update, delete, select
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from domain.models.category import Category as DomainCategory
 from infrastructure.repositories.base_sqlalchemy_repository import (
     BaseSQLAlchemyRepository,
+    keyset_page,
 )
 from infrastructure.repositories.categories.base import BaseCategoryRepository
-from infrastructure.repositories.categories.converters import (
-    convert_sqlalchemy_category_to_model,
-)
 from infrastructure.repositories.converters import Converter
-from infrastructure.repositories.models import (
-    Category as SQLAlchemyCategory,
-    User as SQLAlchemyUser,
-)
+from infrastructure.repositories.models import Category as SQLAlchemyCategory
+from infrastructure.repositories.read_models import CategoryReadModel
+from infrastructure.unit_of_work.sqlalchemy import track_aggregates
+
+_category_to_model = Converter.to_model(DomainCategory)
 
 
 @dataclasses.dataclass
 class SQLAlchemyCategoryRepository(BaseSQLAlchemyRepository, BaseCategoryRepository):
     async def add_category(self, category: DomainCategory) -> None:
-        async with self._async_session_maker() as async_session:
+        async with self._session() as async_session:
             async_session.add(Converter.convert_from_model_to_sqlalchemy(category))
-            await async_session.commit()
+            await async_session.flush()
+            track_aggregates(async_session, category)
+            await self._invalidate(async_session, "category", category.user_oid)
 
     async def update_category(
         self, category_oid: uuid.UUID, title: str
     ) -> DomainCategory | None:
-        async with self._async_session_maker() as async_session:
+        async with self._session() as async_session:
             res = (
                 (
                     await async_session.scalars(
@@ -44,11 +46,13 @@ class SQLAlchemyCategoryRepository(BaseSQLAlchemyRepository, BaseCategoryReposit
             )
             if res is None:
                 return None
-            await async_session.commit()
-            return convert_sqlalchemy_category_to_model(res)
+            category = _category_to_model(res)
+            track_aggregates(async_session, category)
+            await self._invalidate(async_session, "category", category.user_oid)
+            return category
 
     async def delete_category(self, category_oid: uuid.UUID) -> None:
-        async with self._async_session_maker() as async_session:
+        async with self._session() as async_session:
             res = (
                 (
                     await async_session.scalars(
@@ -63,44 +67,54 @@ class SQLAlchemyCategoryRepository(BaseSQLAlchemyRepository, BaseCategoryReposit
             if res is None:
                 return None
             await async_session.delete(res)
-            await async_session.commit()
+            await async_session.flush()
+            await self._invalidate(async_session, "category", res.user_oid)
 
-    async def get_categories(
-        self, user_oid: uuid.UUID
-    ) -> Iterable[DomainCategory] | None:
-        async with self._async_session_maker() as async_session:
-            res = (
-                (
-                    await async_session.scalars(
-                        select(SQLAlchemyCategory)
-                        .select_from(SQLAlchemyUser)
-                        .join(
-                            SQLAlchemyCategory, SQLAlchemyCategory.user_oid == user_oid
+    async def get_category_read_models(
+        self, user_oid: uuid.UUID, limit: int, after_oid: uuid.UUID | None = None
+    ) -> list[CategoryReadModel]:
+        query = keyset_page(
+            select(SQLAlchemyCategory.oid, SQLAlchemyCategory.title).filter(
+                SQLAlchemyCategory.user_oid == user_oid
+            ),
+            SQLAlchemyCategory.oid,
+            limit,
+            after_oid,
+        )
+        async with self._session(read_only=True) as async_session:
+            connection = await async_session.connection()
+            res = await connection.execute(query)
+            return [CategoryReadModel(*row) for row in res]
+
+    async def get_owned_category_oids(
+        self, category_oids: Iterable[uuid.UUID], user_oid: uuid.UUID
+    ) -> set[uuid.UUID]:
+        async with self._session() as async_session:
+            res = await async_session.scalars(
+                select(SQLAlchemyCategory.oid).filter(
+                    SQLAlchemyCategory.oid
+                    == any_(
+                        bindparam(
+                            "category_oids", list(category_oids), type_=ARRAY(Uuid)
                         )
-                    )
+                    ),
+                    SQLAlchemyCategory.user_oid == user_oid,
                 )
-                .unique()
-                .all()
             )
-            if res is None:
-                return None
-            return [convert_sqlalchemy_category_to_model(i) for i in res]
+            return set(res.all())
 
     async def get_category_by_oid(
-        self, category_oid: uuid.UUID
+        self, category_oid: uuid.UUID, user_oid: uuid.UUID | None = None
     ) -> DomainCategory | None:
-        async with self._async_session_maker() as async_session:
-            res = (
-                (
-                    await async_session.scalars(
-                        select(SQLAlchemyCategory).filter(
-                            SQLAlchemyCategory.oid == category_oid
-                        )
-                    )
-                )
-                .unique()
-                .one_or_none()
-            )
+        query = select(SQLAlchemyCategory).filter(
+            SQLAlchemyCategory.oid == category_oid
+        )
+        if user_oid is not None:
+            query = query.filter(SQLAlchemyCategory.user_oid == user_oid)
+        async with self._session() as async_session:
+            res = (await async_session.scalars(query)).one_or_none()
             if res is None:
                 return None
-            return convert_sqlalchemy_category_to_model(res)
+            category = _category_to_model(res)
+            track_aggregates(async_session, category)
+            return category
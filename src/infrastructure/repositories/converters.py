@@ -1,4 +1,5 @@
-from typing import ForwardRef, Type
+import operator
+from typing import Any, Callable, Mapping
 
 import sqlalchemy.orm
 from sqlalchemy.orm import class_mapper
@@ -10,7 +11,7 @@ from domain.models.category import Category as DomainCategory
 from domain.values.base import BaseValueObject
 from domain.values.category_title import CategoryTitle
 from domain.values.email import Email
-from domain.values.password import Password
+from domain.values.password import HashedPassword
 from domain.values.task_name import TaskName
 from infrastructure.repositories.models import Base as SQLAlchemyBaseModel
 from infrastructure.repositories.models import User as SQLAlchemyUser
@@ -18,31 +19,90 @@ from infrastructure.repositories.models import Task as SQLAlchemyTask
 from infrastructure.repositories.models import Category as SQLAlchemyCategory
 
 
+def _tuple_getter(keys: tuple[str, ...]) -> Callable[[Any], tuple]:
+    getter = operator.attrgetter(*keys)
+    if len(keys) == 1:
+        return lambda obj: (getter(obj),)
+    return getter
+
+
 class Converter[TD: DomainBase, TQ: SQLAlchemyBaseModel]:
-    __converter_from_model = {
-        DomainUser: SQLAlchemyUser,
-        DomainTask: SQLAlchemyTask,
-        DomainCategory: SQLAlchemyCategory,
-    }
+    """
+    Реестр преобразований между доменными и ORM-моделями. Для каждой пары
+    при регистрации один раз вычисляются колонки и их attrgetter, так что
+    на каждый объект не остается ни обхода маппера, ни isinstance
+    """
+
+    __converter_from_model: dict[type, Callable[[Any], Any]] = {}
+    __converter_to_model: dict[type, Callable[[Any], Any]] = {}
 
     @classmethod
-    def convert_from_model_to_sqlalchemy(cls, model: TD) -> TQ:
-        converted_model = cls.__converter_from_model.get(model.__class__)
-        if converted_model is None:
-            raise
-        return converted_model(
-            **{
-                key: (
-                    value.as_generic_type()
-                    if isinstance(value, BaseValueObject)
-                    else value
-                )
-                for key, value in model.__dict__.items()
-                if key
-                in {
-                    prop.key
-                    for prop in class_mapper(converted_model).iterate_properties
-                    if isinstance(prop, sqlalchemy.orm.ColumnProperty)
-                }
-            }
+    def register(
+        cls,
+        domain_model: type[TD],
+        sqlalchemy_model: type[TQ],
+        value_objects: Mapping[str, type[BaseValueObject]] | None = None,
+        defaults: Mapping[str, Any] | None = None,
+    ) -> None:
+        """
+        value_objects - колонки, которые в доменной модели хранятся
+        объектами-значениями, defaults - константы для доменной модели.
+        Данные из базы уже проверены при записи, поэтому объекты-значения
+        собираются через trusted() без повторной валидации
+        """
+        value_objects = dict(value_objects or {})
+        defaults = dict(defaults or {})
+        columns = tuple(
+            prop.key
+            for prop in class_mapper(sqlalchemy_model).iterate_properties
+            if isinstance(prop, sqlalchemy.orm.ColumnProperty)
         )
+        get_columns = _tuple_getter(columns)
+        # Позиции колонок-объектов-значений в кортеже get_columns
+        wrapped = tuple(
+            (index, value_objects[key].trusted)
+            for index, key in enumerate(columns)
+            if key in value_objects
+        )
+
+        def from_model(model: TD) -> TQ:
+            values = dict(zip(columns, get_columns(model)))
+            for key in value_objects:
+                values[key] = values[key].as_generic_type()
+            return sqlalchemy_model(**values)
+
+        def to_model(row: Any) -> TD:
+            values = list(get_columns(row))
+            for index, trusted in wrapped:
+                values[index] = trusted(values[index])
+            return domain_model(**dict(zip(columns, values)), **defaults)
+
+        cls.__converter_from_model[domain_model] = from_model
+        cls.__converter_to_model[domain_model] = to_model
+
+    @classmethod
+    def convert_from_model_to_sqlalchemy(cls, model: TD) -> TQ:
+        return cls.__converter_from_model[model.__class__](model)
+
+    @classmethod
+    def to_model(cls, domain_model: type[TD]) -> Callable[[Any], TD]:
+        """
+        Функция сборки доменной модели из ORM-объекта
+        """
+        return cls.__converter_to_model[domain_model]
+
+
+Converter.register(
+    DomainUser,
+    SQLAlchemyUser,
+    value_objects={"email": Email, "password": HashedPassword},
+)
+Converter.register(
+    DomainTask,
+    SQLAlchemyTask,
+    value_objects={"name": TaskName},
+    defaults={"valid": False},
+)
+Converter.register(
+    DomainCategory, SQLAlchemyCategory, value_objects={"title": CategoryTitle}
+)
@@ -1,9 +1,13 @@
 import datetime
 import uuid
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey, TIMESTAMP
+from sqlalchemy import BigInteger, ForeignKey, Identity, Index, TIMESTAMP, text
 
 
+# Связи по умолчанию не загружаются: запрос, которому нужны связанные
+# объекты, подключает их явно через selectinload/joinedload в options().
+# Схема базы создается миграциями из infrastructure.migrations, индексы
+# здесь повторяют их для справки
 class Base(DeclarativeBase):
     __table_args__ = {"schema": "public"}
     oid: Mapped[uuid.UUID] = mapped_column(primary_key=True, comment="uuid элемента")
@@ -13,30 +17,62 @@ class User(Base):
     __tablename__ = "user"
     email: Mapped[str] = mapped_column(unique=True, nullable=False)
     password: Mapped[str] = mapped_column(nullable=False, unique=False)
-    tasks: Mapped["Task"] = relationship(
-        "Task", lazy="selectin", back_populates="user", cascade="all, delete"
+    tasks: Mapped[list["Task"]] = relationship(
+        "Task",
+        lazy="raise",
+        back_populates="user",
+        cascade="all, delete",
+        passive_deletes=True,
     )
-    categories: Mapped["Category"] = relationship(
-        "Category", lazy="selectin", back_populates="user", cascade="all, delete"
+    categories: Mapped[list["Category"]] = relationship(
+        "Category",
+        lazy="raise",
+        back_populates="user",
+        cascade="all, delete",
+        passive_deletes=True,
     )
 
 
 class Category(Base):
     __tablename__ = "category"
+    __table_args__ = (
+        Index("ix_category_user_oid_oid", "user_oid", "oid"),
+        {"schema": "public"},
+    )
     user_oid: Mapped[uuid.UUID] = mapped_column(
         ForeignKey(User.oid, ondelete="cascade", onupdate="cascade"), nullable=False
     )
     title: Mapped[str] = mapped_column(unique=False, nullable=False)
-    user: Mapped[User] = relationship(
-        "User", back_populates="categories", lazy="selectin"
-    )
-    tasks: Mapped["Task"] = relationship(
-        "Task", back_populates="category", cascade="all, delete", lazy="selectin"
+    user: Mapped[User] = relationship("User", back_populates="categories", lazy="raise")
+    tasks: Mapped[list["Task"]] = relationship(
+        "Task",
+        back_populates="category",
+        cascade="all, delete",
+        passive_deletes=True,
+        lazy="raise",
     )
 
 
 class Task(Base):
     __tablename__ = "task"
+    __table_args__ = (
+        Index("ix_task_user_oid_oid", "user_oid", "oid"),
+        Index("ix_task_category_oid", "category_oid"),
+        Index("ix_task_user_oid_category_oid_oid", "user_oid", "category_oid", "oid"),
+        Index(
+            "ix_task_user_oid_is_complete_deadline",
+            "user_oid",
+            "is_complete",
+            "deadline",
+        ),
+        Index(
+            "ix_task_incomplete_user_oid_deadline",
+            "user_oid",
+            "deadline",
+            postgresql_where=text("NOT is_complete"),
+        ),
+        {"schema": "public"},
+    )
     name: Mapped[str] = mapped_column(nullable=False)
     is_complete: Mapped[bool] = mapped_column(default=False, nullable=False)
     deadline: Mapped[datetime.datetime] = mapped_column(
@@ -50,7 +86,27 @@ class Task(Base):
         nullable=True,
         default=None,
     )
-    user: Mapped[User] = relationship("User", back_populates="tasks", lazy="selectin")
+    user: Mapped[User] = relationship("User", back_populates="tasks", lazy="raise")
     category: Mapped[Category] = relationship(
-        "Category", back_populates="tasks", lazy="selectin"
+        "Category", back_populates="tasks", lazy="raise"
+    )
+
+
+class OutboxEvent(Base):
+    """
+    Исходящее событие, oid совпадает с oid события
+    """
+
+    __tablename__ = "event_outbox"
+    position: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=True), unique=True, nullable=False
+    )
+    event_type: Mapped[str] = mapped_column(nullable=False)
+    payload: Mapped[bytes] = mapped_column(nullable=False)
+    attempts: Mapped[int] = mapped_column(server_default=text("0"), nullable=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=text("now()"), nullable=False
+    )
+    available_at: Mapped[datetime.datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=text("now()"), nullable=False
     )
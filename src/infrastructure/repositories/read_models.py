@@ -0,0 +1,23 @@
+import dataclasses
+import datetime
+import uuid
+
+
+@dataclasses.dataclass(slots=True)
+class TaskReadModel:
+    """
+    Задача для чтения: только колонки ответа, без объектов-значений и
+    валидации, собирается прямо из строки выборки
+    """
+
+    oid: uuid.UUID
+    name: str
+    category_oid: uuid.UUID | None
+    is_complete: bool
+    deadline: datetime.datetime | None
+
+
+@dataclasses.dataclass(slots=True)
+class CategoryReadModel:
+    oid: uuid.UUID
+    title: str
@@ -2,9 +2,10 @@ import abc
 import dataclasses
 import datetime
 import uuid
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 
 from domain.models.task import Task
+from infrastructure.repositories.read_models import TaskReadModel
 
 
 @dataclasses.dataclass
@@ -12,28 +13,57 @@ class BaseTaskRepository(abc.ABC):
     @abc.abstractmethod
     async def add_task(self, task: Task) -> None: ...
     @abc.abstractmethod
-    async def delete_task(self, task_oid: uuid.UUID) -> None: ...
+    async def add_tasks(self, tasks: Iterable[Task]) -> None: ...
+    @abc.abstractmethod
+    async def copy_tasks(self, tasks: Iterable[Task]) -> int: ...
+    @abc.abstractmethod
+    async def delete_task(
+        self, task_oid: uuid.UUID, user_oid: uuid.UUID
+    ) -> Task | None: ...
     @abc.abstractmethod
     async def update_task(
         self,
-        category_oid: uuid.UUID,
+        category_oid: uuid.UUID | None,
         name: str,
-        deadline: datetime.datetime,
+        deadline: datetime.datetime | None,
         task_oid: uuid.UUID,
-    ) -> None: ...
+        user_oid: uuid.UUID,
+    ) -> Task | None: ...
     @abc.abstractmethod
     async def change_category(
-        self, category_oid: uuid.UUID, task_oid: uuid.UUID
-    ) -> None: ...
+        self, category_oid: uuid.UUID, task_oid: uuid.UUID, user_oid: uuid.UUID
+    ) -> Task | None: ...
+    @abc.abstractmethod
+    async def complete_task(
+        self, task_oid: uuid.UUID, user_oid: uuid.UUID
+    ) -> Task | None: ...
     @abc.abstractmethod
-    async def complete_task(self, task_oid: uuid.UUID) -> None: ...
+    async def uncomplete_task(
+        self, task_oid: uuid.UUID, user_oid: uuid.UUID
+    ) -> Task | None: ...
     @abc.abstractmethod
-    async def uncomplete_task(self, task_oid: uuid.UUID) -> None: ...
+    async def complete_tasks(
+        self, task_oids: Iterable[uuid.UUID], user_oid: uuid.UUID
+    ) -> list[Task]: ...
     @abc.abstractmethod
-    async def get_tasks(self, user_oid: uuid.UUID) -> Iterable[Task] | None: ...
+    async def uncomplete_tasks(
+        self, task_oids: Iterable[uuid.UUID], user_oid: uuid.UUID
+    ) -> list[Task]: ...
     @abc.abstractmethod
-    async def get_tasks_by_category(
-        self, user_oid: uuid.UUID, category_oid: uuid.UUID
-    ) -> Iterable[Task] | None: ...
+    async def delete_tasks(
+        self, task_oids: Iterable[uuid.UUID], user_oid: uuid.UUID
+    ) -> list[Task]: ...
     @abc.abstractmethod
-    async def get_task_by_oid(self, task_oid: uuid.UUID) -> Task | None: ...
+    def stream_tasks(self, user_oid: uuid.UUID) -> AsyncIterator[Task]: ...
+    @abc.abstractmethod
+    async def get_task_read_models(
+        self, user_oid: uuid.UUID, limit: int, after_oid: uuid.UUID | None = None
+    ) -> list[TaskReadModel]: ...
+    @abc.abstractmethod
+    async def get_task_read_models_by_category(
+        self,
+        user_oid: uuid.UUID,
+        category_oid: uuid.UUID,
+        limit: int,
+        after_oid: uuid.UUID | None = None,
+    ) -> list[TaskReadModel]: ...
@@ -1,149 +1,316 @@
 import dataclasses
 import datetime
 import uuid
-from typing import Iterable
+from typing import AsyncIterator, ClassVar, Iterable
 
-from sqlalchemy import update, delete, select
+from sqlalchemy import (
+    Exists,
+    Select,
+    Update,
+    Uuid,
+    any_,
+    bindparam,
+    delete,
+    exists,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from domain.models.task import Task
 from infrastructure.repositories.base_sqlalchemy_repository import (
     BaseSQLAlchemyRepository,
+    keyset_page,
 )
 from infrastructure.repositories.converters import Converter
 from infrastructure.repositories.models import (
-    Task as SQLAlchemyTask,
-    User as SQLAlchemyUser,
     Category as SQLAlchemyCategory,
+    Task as SQLAlchemyTask,
 )
+from infrastructure.repositories.read_models import TaskReadModel
 from infrastructure.repositories.tasks.base import BaseTaskRepository
-from infrastructure.repositories.tasks.converters import (
-    convert_sqlalchemy_task_to_model,
-)
+from infrastructure.unit_of_work.sqlalchemy import track_aggregates
+
+_task_to_model = Converter.to_model(Task)
 
 
 @dataclasses.dataclass
 class SQLAlchemyTaskRepository(BaseSQLAlchemyRepository, BaseTaskRepository):
-    async def delete_task(self, task_oid: uuid.UUID) -> None:
-        async with self._async_session_maker() as async_session:
+    stream_batch_size: ClassVar[int] = 500
+    copy_columns: ClassVar[tuple[str, ...]] = (
+        "oid",
+        "user_oid",
+        "category_oid",
+        "name",
+        "is_complete",
+        "deadline",
+    )
+
+    async def delete_task(
+        self, task_oid: uuid.UUID, user_oid: uuid.UUID
+    ) -> Task | None:
+        async with self._session() as async_session:
             res = (
-                (
-                    await async_session.scalars(
-                        select(SQLAlchemyTask).filter(SQLAlchemyTask.oid == task_oid)
+                await async_session.scalars(
+                    delete(SQLAlchemyTask)
+                    .filter(
+                        SQLAlchemyTask.oid == task_oid,
+                        SQLAlchemyTask.user_oid == user_oid,
                     )
+                    .returning(SQLAlchemyTask)
                 )
-                .unique()
-                .one_or_none()
-            )
+            ).one_or_none()
             if res is None:
                 return None
-            await async_session.delete(res)
-            await async_session.commit()
+            task = _task_to_model(res)
+            track_aggregates(async_session, task)
+            await self._invalidate(async_session, "task", user_oid)
+            return task
 
     async def update_task(
         self,
-        category_oid: uuid.UUID,
+        category_oid: uuid.UUID | None,
         name: str,
-        deadline: datetime.datetime,
+        deadline: datetime.datetime | None,
         task_oid: uuid.UUID,
-    ) -> None:
-        async with self._async_session_maker() as async_session:
-            await async_session.scalars(
-                update(SQLAlchemyTask)
-                .filter(SQLAlchemyTask.oid == task_oid)
-                .values(name=name, deadline=deadline, category_oid=category_oid)
-                .returning(SQLAlchemyTask)
-            )
-            await async_session.commit()
+        user_oid: uuid.UUID,
+    ) -> Task | None:
+        query = update(SQLAlchemyTask).filter(
+            SQLAlchemyTask.oid == task_oid, SQLAlchemyTask.user_oid == user_oid
+        )
+        if category_oid is not None:
+            query = query.filter(self._owns_category(category_oid, user_oid))
+        return await self._update_returning(
+            query.values(name=name, deadline=deadline, category_oid=category_oid)
+        )
 
     async def change_category(
-        self, category_oid: uuid.UUID, task_oid: uuid.UUID
-    ) -> None:
-        async with self._async_session_maker() as async_session:
-            await async_session.scalars(
-                update(SQLAlchemyTask)
-                .filter(SQLAlchemyTask.oid == task_oid)
-                .values(category_oid=category_oid)
-                .returning(SQLAlchemyTask)
-            )
-            await async_session.commit()
-
-    async def complete_task(self, task_oid: uuid.UUID) -> None:
-        async with self._async_session_maker() as async_session:
-            await async_session.scalars(
-                update(SQLAlchemyTask)
-                .filter(SQLAlchemyTask.oid == task_oid)
-                .values(is_complete=True)
-                .returning(SQLAlchemyTask)
+        self, category_oid: uuid.UUID, task_oid: uuid.UUID, user_oid: uuid.UUID
+    ) -> Task | None:
+        return await self._update_returning(
+            update(SQLAlchemyTask)
+            .filter(
+                SQLAlchemyTask.oid == task_oid,
+                SQLAlchemyTask.user_oid == user_oid,
+                self._owns_category(category_oid, user_oid),
             )
-            await async_session.commit()
-
-    async def uncomplete_task(self, task_oid: uuid.UUID) -> None:
-        async with self._async_session_maker() as async_session:
-            await async_session.scalars(
-                update(SQLAlchemyTask)
-                .filter(SQLAlchemyTask.oid == task_oid)
-                .values(is_complete=False)
-                .returning(SQLAlchemyTask)
-            )
-            await async_session.commit()
+            .values(category_oid=category_oid)
+        )
 
-    async def get_tasks(self, user_oid: uuid.UUID) -> Iterable[Task]:
-        async with self._async_session_maker() as async_session:
-            res = (
-                (
-                    await async_session.scalars(
-                        select(SQLAlchemyTask)
-                        .select_from(SQLAlchemyUser)
-                        .join(
-                            SQLAlchemyTask,
-                            SQLAlchemyTask.user_oid == SQLAlchemyUser.oid,
-                        )
-                        .filter(SQLAlchemyUser.oid == user_oid)
-                    )
-                )
-                .unique()
-                .all()
-            )
-            return [convert_sqlalchemy_task_to_model(i) for i in res] if res else None
+    async def complete_task(
+        self, task_oid: uuid.UUID, user_oid: uuid.UUID
+    ) -> Task | None:
+        return await self._update_returning(
+            update(SQLAlchemyTask)
+            .filter(SQLAlchemyTask.oid == task_oid, SQLAlchemyTask.user_oid == user_oid)
+            .values(is_complete=True)
+        )
+
+    async def uncomplete_task(
+        self, task_oid: uuid.UUID, user_oid: uuid.UUID
+    ) -> Task | None:
+        return await self._update_returning(
+            update(SQLAlchemyTask)
+            .filter(SQLAlchemyTask.oid == task_oid, SQLAlchemyTask.user_oid == user_oid)
+            .values(is_complete=False)
+        )
 
-    async def get_tasks_by_category(
-        self, user_oid: uuid.UUID, category_oid: uuid.UUID
-    ) -> Iterable[Task]:
-        async with self._async_session_maker() as async_session:
+    async def complete_tasks(
+        self, task_oids: Iterable[uuid.UUID], user_oid: uuid.UUID
+    ) -> list[Task]:
+        return await self._update_many_returning(
+            update(SQLAlchemyTask)
+            .filter(self._oid_in(task_oids), SQLAlchemyTask.user_oid == user_oid)
+            .values(is_complete=True)
+        )
+
+    async def uncomplete_tasks(
+        self, task_oids: Iterable[uuid.UUID], user_oid: uuid.UUID
+    ) -> list[Task]:
+        return await self._update_many_returning(
+            update(SQLAlchemyTask)
+            .filter(self._oid_in(task_oids), SQLAlchemyTask.user_oid == user_oid)
+            .values(is_complete=False)
+        )
+
+    async def delete_tasks(
+        self, task_oids: Iterable[uuid.UUID], user_oid: uuid.UUID
+    ) -> list[Task]:
+        async with self._session() as async_session:
             res = (
-                (
-                    await async_session.scalars(
-                        select(SQLAlchemyTask)
-                        .select_from(SQLAlchemyUser)
-                        .join(
-                            SQLAlchemyTask,
-                            SQLAlchemyTask.user_oid == SQLAlchemyUser.oid,
-                        )
-                        .join(
-                            SQLAlchemyCategory,
-                            SQLAlchemyCategory.oid == SQLAlchemyTask.category_oid,
-                        )
+                await async_session.scalars(
+                    delete(SQLAlchemyTask)
+                    .filter(
+                        self._oid_in(task_oids), SQLAlchemyTask.user_oid == user_oid
                     )
+                    .returning(SQLAlchemyTask)
                 )
-                .unique()
-                .all()
-            )
-            return [convert_sqlalchemy_task_to_model(i) for i in res] if res else None
+            ).all()
+            tasks = [_task_to_model(i) for i in res]
+            track_aggregates(async_session, *tasks)
+            if tasks:
+                await self._invalidate(async_session, "task", tasks[0].user_oid)
+            return tasks
 
-    async def add_task(self, task: Task) -> None:
-        async with self._async_session_maker() as async_session:
-            async_session.add(Converter.convert_from_model_to_sqlalchemy(task))
-            await async_session.commit()
+    async def _update_many_returning(self, query: Update) -> list[Task]:
+        async with self._session() as async_session:
+            res = (await async_session.scalars(query.returning(SQLAlchemyTask))).all()
+            tasks = [_task_to_model(i) for i in res]
+            track_aggregates(async_session, *tasks)
+            if tasks:
+                await self._invalidate(async_session, "task", tasks[0].user_oid)
+            return tasks
 
-    async def get_task_by_oid(self, task_oid: uuid.UUID) -> Task | None:
-        async with self._async_session_maker() as async_session:
+    @staticmethod
+    def _oid_in(task_oids: Iterable[uuid.UUID]):
+        # Один параметр-массив вместо IN (...), чтобы текст запроса и
+        # подготовленное выражение не зависели от размера пачки
+        return SQLAlchemyTask.oid == any_(
+            bindparam("task_oids", list(task_oids), type_=ARRAY(Uuid))
+        )
+
+    async def _update_returning(self, query: Update) -> Task | None:
+        async with self._session() as async_session:
             res = (
-                await async_session.scalars(
-                    select(SQLAlchemyTask)
-                    .select_from(SQLAlchemyTask)
-                    .filter(SQLAlchemyTask.oid == task_oid)
-                )
+                await async_session.scalars(query.returning(SQLAlchemyTask))
             ).one_or_none()
             if res is None:
                 return None
-            return convert_sqlalchemy_task_to_model(res)
+            task = _task_to_model(res)
+            track_aggregates(async_session, task)
+            await self._invalidate(async_session, "task", task.user_oid)
+            return task
+
+    @staticmethod
+    def _owns_category(category_oid: uuid.UUID, user_oid: uuid.UUID) -> Exists:
+        return exists().where(
+            SQLAlchemyCategory.oid == category_oid,
+            SQLAlchemyCategory.user_oid == user_oid,
+        )
+
+    async def stream_tasks(self, user_oid: uuid.UUID) -> AsyncIterator[Task]:
+        async with self._session(read_only=True) as async_session:
+            res = await async_session.stream_scalars(
+                select(SQLAlchemyTask)
+                .filter(SQLAlchemyTask.user_oid == user_oid)
+                .order_by(SQLAlchemyTask.oid)
+                .execution_options(yield_per=self.stream_batch_size)
+            )
+            async for task in res:
+                yield _task_to_model(task)
+
+    async def get_task_read_models(
+        self, user_oid: uuid.UUID, limit: int, after_oid: uuid.UUID | None = None
+    ) -> list[TaskReadModel]:
+        return await self._fetch_read_models(
+            keyset_page(
+                self._select_read_models().filter(SQLAlchemyTask.user_oid == user_oid),
+                SQLAlchemyTask.oid,
+                limit,
+                after_oid,
+            )
+        )
+
+    async def get_task_read_models_by_category(
+        self,
+        user_oid: uuid.UUID,
+        category_oid: uuid.UUID,
+        limit: int,
+        after_oid: uuid.UUID | None = None,
+    ) -> list[TaskReadModel]:
+        return await self._fetch_read_models(
+            keyset_page(
+                self._select_read_models().filter(
+                    SQLAlchemyTask.user_oid == user_oid,
+                    SQLAlchemyTask.category_oid == category_oid,
+                ),
+                SQLAlchemyTask.oid,
+                limit,
+                after_oid,
+            )
+        )
+
+    @staticmethod
+    def _select_read_models() -> Select:
+        return select(
+            SQLAlchemyTask.oid,
+            SQLAlchemyTask.name,
+            SQLAlchemyTask.category_oid,
+            SQLAlchemyTask.is_complete,
+            SQLAlchemyTask.deadline,
+        )
+
+    async def _fetch_read_models(self, query: Select) -> list[TaskReadModel]:
+        async with self._session(read_only=True) as async_session:
+            connection = await async_session.connection()
+            res = await connection.execute(query)
+            return [TaskReadModel(*row) for row in res]
+
+    async def add_task(self, task: Task) -> None:
+        async with self._session() as async_session:
+            async_session.add(Converter.convert_from_model_to_sqlalchemy(task))
+            await async_session.flush()
+            track_aggregates(async_session, task)
+            await self._invalidate(async_session, "task", task.user_oid)
+
+    async def add_tasks(self, tasks: Iterable[Task]) -> None:
+        tasks = list(tasks)
+        rows = [
+            {
+                "oid": task.oid,
+                "user_oid": task.user_oid,
+                "category_oid": task.category_oid,
+                "name": task.name.as_generic_type(),
+                "is_complete": task.is_complete,
+                "deadline": task.deadline,
+            }
+            for task in tasks
+        ]
+        if not rows:
+            return
+        async with self._session() as async_session:
+            await async_session.execute(insert(SQLAlchemyTask).values(rows))
+            track_aggregates(async_session, *tasks)
+            for user_oid in {task.user_oid for task in tasks}:
+                await self._invalidate(async_session, "task", user_oid)
+
+    async def copy_tasks(self, tasks: Iterable[Task]) -> int:
+        """
+        Загружает задачи бинарным COPY во временную таблицу и переносит
+        их в task одним INSERT ... SELECT, возвращает число вставленных строк
+        """
+        records = [
+            (
+                task.oid,
+                task.user_oid,
+                task.category_oid,
+                task.name.as_generic_type(),
+                task.is_complete,
+                task.deadline,
+            )
+            for task in tasks
+        ]
+        if not records:
+            return 0
+        columns = ", ".join(self.copy_columns)
+        async with self._session() as async_session:
+            connection = await (await async_session.connection()).get_raw_connection()
+            driver_connection = connection.driver_connection
+            await driver_connection.execute(
+                "CREATE TEMPORARY TABLE IF NOT EXISTS task_import "
+                "(LIKE public.task INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            await driver_connection.copy_records_to_table(
+                "task_import", records=records, columns=self.copy_columns
+            )
+            status = await driver_connection.execute(
+                f"INSERT INTO public.task ({columns}) "
+                f"SELECT {columns} FROM task_import ON CONFLICT (oid) DO NOTHING"
+            )
+            await driver_connection.execute("TRUNCATE task_import")
+            inserted = int(status.rsplit(" ", 1)[-1])
+            if inserted:
+                for user_oid in {record[1] for record in records}:
+                    await self._invalidate(async_session, "task", user_oid)
+            return inserted
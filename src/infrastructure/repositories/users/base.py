@@ -10,10 +10,16 @@ class BaseUserRepository(abc.ABC):
     @abc.abstractmethod
     async def check_user_exists_by_email(self, email: str) -> bool: ...
     @abc.abstractmethod
+    async def check_user_exists(self, user_oid: uuid.UUID) -> bool: ...
+    @abc.abstractmethod
     async def get_user_by_oid(self, user_oid: uuid.UUID) -> User | None: ...
     @abc.abstractmethod
     async def add_user(self, user: User) -> None: ...
     @abc.abstractmethod
     async def delete_user(self, user_oid: uuid.UUID) -> None: ...
     @abc.abstractmethod
+    async def update_user_password(
+        self, user_oid: uuid.UUID, password: str
+    ) -> None: ...
+    @abc.abstractmethod
     async def check_user_by_email(self, email: str) -> tuple[str, str] | None: ...
@@ -1,7 +1,7 @@
 import dataclasses
 import uuid
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, exists, select, update
 
 from domain.models.user import User as DomainUser, User
 from infrastructure.repositories.base_sqlalchemy_repository import (
@@ -10,15 +10,15 @@ from infrastructure.repositories.base_sqlalchemy_repository import (
 from infrastructure.repositories.converters import Converter
 from infrastructure.repositories.users.base import BaseUserRepository
 from infrastructure.repositories.models import User as SQLAlchemyUser
-from infrastructure.repositories.users.converters import (
-    convert_sqlalchemy_user_to_model,
-)
+from infrastructure.unit_of_work.sqlalchemy import track_aggregates
+
+_user_to_model = Converter.to_model(DomainUser)
 
 
 @dataclasses.dataclass
 class SQLAlchemyUserRepository(BaseSQLAlchemyRepository, BaseUserRepository):
     async def check_user_exists_by_email(self, email: str) -> bool:
-        async with self._async_session_maker() as async_session:
+        async with self._session() as async_session:
             res = (
                 await async_session.scalars(
                     select(SQLAlchemyUser).filter(SQLAlchemyUser.email == email)
@@ -28,8 +28,14 @@ class SQLAlchemyUserRepository(BaseSQLAlchemyRepository, BaseUserRepository):
                 return False
             return True
 
+    async def check_user_exists(self, user_oid: uuid.UUID) -> bool:
+        async with self._session(read_only=True) as async_session:
+            return await async_session.scalar(
+                select(exists().where(SQLAlchemyUser.oid == user_oid))
+            )
+
     async def get_user_by_oid(self, user_oid: uuid.UUID) -> DomainUser | None:
-        async with self._async_session_maker() as async_session:
+        async with self._session(read_only=True) as async_session:
             res = (
                 await async_session.scalars(
                     select(SQLAlchemyUser).filter(SQLAlchemyUser.oid == user_oid)
@@ -37,22 +43,35 @@ class SQLAlchemyUserRepository(BaseSQLAlchemyRepository, BaseUserRepository):
             ).one_or_none()
             if res is None:
                 return None
-            return convert_sqlalchemy_user_to_model(res)
+            user = _user_to_model(res)
+            track_aggregates(async_session, user)
+            return user
 
     async def add_user(self, user: DomainUser) -> None:
-        async with self._async_session_maker() as async_session:
+        async with self._session() as async_session:
             async_session.add(Converter.convert_from_model_to_sqlalchemy(user))
-            await async_session.commit()
+            await async_session.flush()
+            track_aggregates(async_session, user)
+            await self._invalidate(async_session, "user", user.oid)
 
     async def delete_user(self, user_oid: uuid.UUID) -> None:
-        async with self._async_session_maker() as async_session:
-            await async_session.scalars(
+        async with self._session() as async_session:
+            await async_session.execute(
                 delete(SQLAlchemyUser).filter(SQLAlchemyUser.oid == user_oid)
             )
-            await async_session.commit()
+            await self._invalidate(async_session, "user", user_oid)
+
+    async def update_user_password(self, user_oid: uuid.UUID, password: str) -> None:
+        async with self._session() as async_session:
+            await async_session.execute(
+                update(SQLAlchemyUser)
+                .filter(SQLAlchemyUser.oid == user_oid)
+                .values(password=password)
+            )
+            await self._invalidate(async_session, "user", user_oid)
 
     async def check_user_by_email(self, email: str) -> tuple[str, str] | None:
-        async with self._async_session_maker() as async_session:
+        async with self._session(read_only=True) as async_session:
             res = (
                 await async_session.scalars(
                     select(SQLAlchemyUser).filter(SQLAlchemyUser.email == email)
@@ -0,0 +1,30 @@
+import abc
+import dataclasses
+import uuid
+
+from domain.events.base import BaseEvent
+
+
+@dataclasses.dataclass
+class BaseTransaction(abc.ABC):
+    # События агрегатов, собранные после успешной фиксации транзакции
+    events: list[BaseEvent] = dataclasses.field(
+        default_factory=list, init=False, kw_only=True
+    )
+
+    @abc.abstractmethod
+    async def __aenter__(self) -> None: ...
+    @abc.abstractmethod
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None: ...
+
+
+@dataclasses.dataclass
+class BaseUnitOfWork(abc.ABC):
+    @abc.abstractmethod
+    def transaction(
+        self, read_only: bool = False, user_oid: uuid.UUID | None = None
+    ) -> BaseTransaction:
+        """
+        user_oid - пользователь, от имени которого идет чтение: после
+        своей записи он читает с основного сервера, а не с реплики
+        """
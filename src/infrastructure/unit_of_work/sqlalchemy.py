@@ -0,0 +1,85 @@
+import dataclasses
+import uuid
+from contextvars import ContextVar, Token
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.models.base import Base as DomainBase
+from infrastructure.database import Database
+from infrastructure.outbox.base import BaseOutbox
+from infrastructure.unit_of_work.base import BaseTransaction, BaseUnitOfWork
+
+
+_current_session: ContextVar[AsyncSession | None] = ContextVar(
+    "current_session", default=None
+)
+
+
+def get_current_session() -> AsyncSession | None:
+    return _current_session.get()
+
+
+def track_aggregates(async_session: AsyncSession, *aggregates: DomainBase) -> None:
+    """
+    Запоминает агрегаты сессии, чтобы после фиксации собрать их события
+    """
+    async_session.info.setdefault("aggregates", []).extend(aggregates)
+
+
+@dataclasses.dataclass
+class SQLAlchemyTransaction(BaseTransaction):
+    _database: Database
+    _read_only: bool = False
+    # Без outbox события публикуются в процессе после фиксации
+    _outbox: BaseOutbox | None = None
+    # Чей запрос: недавно писавший пользователь читает с основного
+    _user_oid: uuid.UUID | None = None
+    _async_session: AsyncSession | None = dataclasses.field(default=None, init=False)
+    _token: Token | None = dataclasses.field(default=None, init=False)
+
+    async def __aenter__(self) -> None:
+        if _current_session.get() is not None:
+            # Вложенная команда выполняется в транзакции внешней
+            return
+        # Читающие команды уходят на реплику, пишущие и их чтения - на основной
+        async_session_maker = (
+            await self._database.read_session_maker(self._user_oid)
+            if self._read_only
+            else self._database.async_session_maker
+        )
+        self._async_session = async_session_maker()
+        self._token = _current_session.set(self._async_session)
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if self._async_session is None:
+            return
+        try:
+            if exc_type is None:
+                events = [
+                    event
+                    for aggregate in self._async_session.info.get("aggregates", ())
+                    for event in aggregate.pull_events()
+                ]
+                if self._outbox is not None and events:
+                    # События фиксируются вместе с изменениями, которые их породили
+                    await self._outbox.add(self._async_session, events)
+                    events = []
+                await self._async_session.commit()
+                self._database.track_writes(self._async_session)
+                self.events.extend(events)
+            else:
+                await self._async_session.rollback()
+        finally:
+            _current_session.reset(self._token)
+            await self._async_session.close()
+
+
+@dataclasses.dataclass
+class SQLAlchemyUnitOfWork(BaseUnitOfWork):
+    _database: Database
+    _outbox: BaseOutbox | None = None
+
+    def transaction(
+        self, read_only: bool = False, user_oid: uuid.UUID | None = None
+    ) -> SQLAlchemyTransaction:
+        return SQLAlchemyTransaction(self._database, read_only, self._outbox, user_oid)
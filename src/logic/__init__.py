@@ -1,19 +1,66 @@
 from functools import lru_cache
 from punq import Container, Scope
-from sqlalchemy import URL
-from sqlalchemy.ext.asyncio import create_async_engine
 
 from configs.config import ConfigSettings
+from domain.events.categories import (
+    CategoryDeleted,
+    CategoryUpdated,
+    NewCategoryCreated,
+)
+from domain.events.tasks import (
+    NewTaskCreated,
+    TaskCompleted,
+    TaskDeleted,
+    TasksCategoryChanged,
+    TasksImported,
+    TaskUnCompleted,
+    TaskUpdated,
+)
+from domain.events.users import UserDeleted
+from infrastructure.cache.base import BaseCacheBackend
+from infrastructure.cache.known_users import KnownUsersCache
+from infrastructure.cache.lru import LRUCacheBackend
+from infrastructure.cache.redis import RedisCacheBackend
+from infrastructure.cache.user_scoped import UserScopedCache
+from infrastructure.database import Database
+from infrastructure.invalidation.base import BaseInvalidationBus
+from infrastructure.invalidation.memory import InMemoryInvalidationBus
+from infrastructure.invalidation.postgres import PostgresInvalidationBus
+from infrastructure.email_deliverability.base import (
+    BaseEmailDeliverabilityChecker,
+    NoopEmailDeliverabilityChecker,
+)
+from infrastructure.email_deliverability.dns import DNSEmailDeliverabilityChecker
+from infrastructure.password_hashing.base import BasePasswordHasher
+from infrastructure.password_hashing.scrypt import ScryptPasswordHasher
 from infrastructure.repositories.categories.base import BaseCategoryRepository
 from infrastructure.repositories.categories.sqlalchemy import (
     SQLAlchemyCategoryRepository,
 )
-from infrastructure.repositories.models import Base
+from infrastructure.migrations.runner import MigrationRunner
+from infrastructure.outbox.base import BaseOutbox
+from infrastructure.outbox.sqlalchemy import SQLAlchemyOutbox
 from infrastructure.repositories.tasks.base import BaseTaskRepository
 from infrastructure.repositories.tasks.sqlalchemy import SQLAlchemyTaskRepository
 from infrastructure.repositories.users.base import BaseUserRepository
 from infrastructure.repositories.users.sqlalchemy import SQLAlchemyUserRepository
+from infrastructure.unit_of_work.base import BaseUnitOfWork
+from infrastructure.unit_of_work.sqlalchemy import SQLAlchemyUnitOfWork
+from logic.events.cache import (
+    ForgetKnownUserEventHandler,
+    InvalidateUserCacheEventHandler,
+)
 from logic.mediator.base import Mediator
+from logic.queries.categories import (
+    GetAllCategoriesQuery,
+    GetAllCategoriesQueryHandler,
+)
+from logic.queries.tasks import (
+    GetAllTasksQuery,
+    GetAllTasksQueryHandler,
+    GetTasksByCategoryQuery,
+    GetTasksByCategoryQueryHandler,
+)
 from logic.commands.users import (
     CreateUserCommand,
     CreateUserCommandHandler,
@@ -21,6 +68,7 @@ from logic.commands.users import (
     DeleteUserCommandHandler,
     SignInUserCommand,
     SignInUserCommandHandler,
+    UserExistenceChecker,
 )
 from logic.commands.categories import (
     CreateCategoryCommand,
@@ -29,8 +77,6 @@ from logic.commands.categories import (
     DeleteCategoryCommandHandler,
     UpdateCategoryCommand,
     UpdateCategoryCommandHandler,
-    GetAllCategoriesCommand,
-    GetAllCategoriesCommandHandler,
 )
 from logic.commands.tasks import (
     CreateTaskCommand,
@@ -45,8 +91,18 @@ from logic.commands.tasks import (
     UnCompleteTaskCommandHandler,
     ChangeCategoryTaskCommand,
     ChangeCategoryCommandHandler,
-    GetAllTasksCommand,
-    GetAllTasksCommandHandler,
+    ExportTasksCommand,
+    ExportTasksCommandHandler,
+    BatchCreateTasksCommand,
+    BatchCreateTasksCommandHandler,
+    BatchCompleteTasksCommand,
+    BatchCompleteTasksCommandHandler,
+    BatchUnCompleteTasksCommand,
+    BatchUnCompleteTasksCommandHandler,
+    BatchDeleteTasksCommand,
+    BatchDeleteTasksCommandHandler,
+    ImportTasksCommand,
+    ImportTasksCommandHandler,
 )
 
 
@@ -57,11 +113,11 @@ def init_container() -> Container:
     container.register(CreateUserCommandHandler)
     container.register(DeleteUserCommandHandler)
     container.register(SignInUserCommandHandler)
+    container.register(UserExistenceChecker)
 
     container.register(CreateCategoryCommandHandler)
     container.register(DeleteCategoryCommandHandler)
     container.register(UpdateCategoryCommandHandler)
-    container.register(GetAllCategoriesCommandHandler)
 
     container.register(CreateTaskCommandHandler)
     container.register(DeleteTaskCommandHandler)
@@ -69,12 +125,30 @@ def init_container() -> Container:
     container.register(CompleteTaskCommandHandler)
     container.register(UnCompleteTaskCommandHandler)
     container.register(ChangeCategoryCommandHandler)
-    container.register(GetAllTasksCommandHandler)
+    container.register(ExportTasksCommandHandler)
+    container.register(BatchCreateTasksCommandHandler)
+    container.register(BatchCompleteTasksCommandHandler)
+    container.register(BatchUnCompleteTasksCommandHandler)
+    container.register(BatchDeleteTasksCommandHandler)
+    container.register(ImportTasksCommandHandler)
+
+    container.register(GetAllCategoriesQueryHandler)
+    container.register(GetAllTasksQueryHandler)
+    container.register(GetTasksByCategoryQueryHandler)
+
+    container.register(InvalidateUserCacheEventHandler)
+    container.register(ForgetKnownUserEventHandler)
 
     container.register(ConfigSettings, instance=ConfigSettings(), scope=Scope.singleton)
 
     def init_mediator() -> Mediator:
-        mediator = Mediator()
+        config: ConfigSettings = container.resolve(ConfigSettings)
+        mediator = Mediator(
+            unit_of_work=container.resolve(BaseUnitOfWork),
+            publish_concurrency=config.event_publish_concurrency,
+            handler_timeout=config.event_handler_timeout,
+            background_queue_size=config.event_queue_size,
+        )
 
         # Users
         mediator.register_command(
@@ -97,9 +171,6 @@ def init_container() -> Container:
         mediator.register_command(
             UpdateCategoryCommand, [container.resolve(UpdateCategoryCommandHandler)]
         )
-        mediator.register_command(
-            GetAllCategoriesCommand, [container.resolve(GetAllCategoriesCommandHandler)]
-        )
 
         # Tasks
         mediator.register_command(
@@ -121,33 +192,96 @@ def init_container() -> Container:
             ChangeCategoryTaskCommand, [container.resolve(ChangeCategoryCommandHandler)]
         )
         mediator.register_command(
-            GetAllTasksCommand, [container.resolve(GetAllTasksCommandHandler)]
+            ExportTasksCommand, [container.resolve(ExportTasksCommandHandler)]
+        )
+        mediator.register_command(
+            BatchCreateTasksCommand,
+            [container.resolve(BatchCreateTasksCommandHandler)],
+        )
+        mediator.register_command(
+            BatchCompleteTasksCommand,
+            [container.resolve(BatchCompleteTasksCommandHandler)],
+        )
+        mediator.register_command(
+            BatchUnCompleteTasksCommand,
+            [container.resolve(BatchUnCompleteTasksCommandHandler)],
+        )
+        mediator.register_command(
+            BatchDeleteTasksCommand,
+            [container.resolve(BatchDeleteTasksCommandHandler)],
+        )
+        mediator.register_command(
+            ImportTasksCommand, [container.resolve(ImportTasksCommandHandler)]
+        )
+
+        # Queries
+        mediator.register_query(
+            GetAllCategoriesQuery, container.resolve(GetAllCategoriesQueryHandler)
+        )
+        mediator.register_query(
+            GetAllTasksQuery, container.resolve(GetAllTasksQueryHandler)
+        )
+        mediator.register_query(
+            GetTasksByCategoryQuery, container.resolve(GetTasksByCategoryQueryHandler)
+        )
+
+        # Events
+        # Кэши процесса сбрасывают и сами репозитории через шину инвалидации.
+        # Обработчики ниже нужны только при доставке в том же процессе:
+        # в воркере outbox они сбрасывали бы кэши воркера, а не API
+        if config.event_delivery != "inline":
+            return mediator
+        invalidate_user_cache = container.resolve(InvalidateUserCacheEventHandler)
+        for event in (
+            NewTaskCreated,
+            TaskCompleted,
+            TaskUnCompleted,
+            TaskUpdated,
+            TasksCategoryChanged,
+            TaskDeleted,
+            TasksImported,
+            NewCategoryCreated,
+            CategoryUpdated,
+            CategoryDeleted,
+            UserDeleted,
+        ):
+            mediator.register_event(event, [invalidate_user_cache])
+        mediator.register_event(
+            UserDeleted, [container.resolve(ForgetKnownUserEventHandler)]
         )
 
         return mediator
 
+    def init_database() -> Database:
+        return Database.from_config(container.resolve(ConfigSettings))
+
+    container.register(Database, factory=init_database, scope=Scope.singleton)
+
+    def init_migration_runner() -> MigrationRunner:
+        return MigrationRunner(container.resolve(Database))
+
+    container.register(MigrationRunner, factory=init_migration_runner)
+
     async def migrate_db():
-        config: ConfigSettings = container.resolve(ConfigSettings)
-        async with create_async_engine(
-            URL.create(
-                drivername="postgresql+asyncpg",
-                host=config.db_host,
-                port=config.db_port,
-                username=config.db_username,
-                password=config.db_password,
-                database=config.db_database,
-            )
-        ).begin() as connection:
-            await connection.run_sync(Base.metadata.create_all)
+        await container.resolve(MigrationRunner).upgrade()
+
+    def init_invalidation_bus() -> BaseInvalidationBus:
+        if container.resolve(ConfigSettings).cache_invalidation_bus == "memory":
+            invalidation_bus = InMemoryInvalidationBus()
+        else:
+            invalidation_bus = PostgresInvalidationBus(container.resolve(Database))
+        invalidation_bus.subscribe(container.resolve(UserScopedCache).on_invalidation)
+        invalidation_bus.subscribe(container.resolve(KnownUsersCache).on_invalidation)
+        invalidation_bus.subscribe(container.resolve(Database).on_invalidation)
+        return invalidation_bus
+
+    container.register(
+        BaseInvalidationBus, factory=init_invalidation_bus, scope=Scope.singleton
+    )
 
     def init_user_sqlalchemy_repository():
-        config: ConfigSettings = container.resolve(ConfigSettings)
         return SQLAlchemyUserRepository(
-            config.db_host,
-            config.db_port,
-            config.db_username,
-            config.db_password,
-            config.db_database,
+            container.resolve(Database), container.resolve(BaseInvalidationBus)
         )
 
     container.register(
@@ -157,13 +291,8 @@ def init_container() -> Container:
     )
 
     def init_category_sqlalchemy_repository():
-        config: ConfigSettings = container.resolve(ConfigSettings)
         return SQLAlchemyCategoryRepository(
-            config.db_host,
-            config.db_port,
-            config.db_username,
-            config.db_password,
-            config.db_database,
+            container.resolve(Database), container.resolve(BaseInvalidationBus)
         )
 
     container.register(
@@ -173,13 +302,8 @@ def init_container() -> Container:
     )
 
     def init_task_sqlalchemy_repository():
-        config: ConfigSettings = container.resolve(ConfigSettings)
         return SQLAlchemyTaskRepository(
-            config.db_host,
-            config.db_port,
-            config.db_username,
-            config.db_password,
-            config.db_database,
+            container.resolve(Database), container.resolve(BaseInvalidationBus)
         )
 
     container.register(
@@ -188,6 +312,83 @@ def init_container() -> Container:
         scope=Scope.singleton,
     )
 
-    container.register(Mediator, factory=init_mediator)
+    def init_email_deliverability_checker() -> BaseEmailDeliverabilityChecker:
+        config = container.resolve(ConfigSettings)
+        if not config.email_check_deliverability:
+            return NoopEmailDeliverabilityChecker()
+        return DNSEmailDeliverabilityChecker(
+            _cache_ttl=config.email_deliverability_cache_ttl,
+            _timeout=config.email_deliverability_timeout,
+        )
+
+    container.register(
+        BaseEmailDeliverabilityChecker,
+        factory=init_email_deliverability_checker,
+        scope=Scope.singleton,
+    )
+
+    def init_password_hasher() -> BasePasswordHasher:
+        config = container.resolve(ConfigSettings)
+        return ScryptPasswordHasher(
+            _n=config.password_scrypt_n, _max_workers=config.password_hash_workers
+        )
+
+    container.register(
+        BasePasswordHasher, factory=init_password_hasher, scope=Scope.singleton
+    )
+
+    def init_cache_backend() -> BaseCacheBackend:
+        config = container.resolve(ConfigSettings)
+        if config.cache_backend == "redis":
+            return RedisCacheBackend.from_url(config.cache_redis_url)
+        return LRUCacheBackend(_max_size=config.list_cache_max_size)
+
+    container.register(
+        BaseCacheBackend, factory=init_cache_backend, scope=Scope.singleton
+    )
+
+    def init_list_cache() -> UserScopedCache:
+        return UserScopedCache(
+            container.resolve(BaseCacheBackend),
+            _ttl=container.resolve(ConfigSettings).list_cache_ttl,
+        )
+
+    container.register(UserScopedCache, factory=init_list_cache, scope=Scope.singleton)
+
+    def init_known_users_cache() -> KnownUsersCache:
+        config = container.resolve(ConfigSettings)
+        return KnownUsersCache(
+            _max_size=config.known_users_cache_max_size,
+            _ttl=config.known_users_cache_ttl,
+        )
+
+    container.register(
+        KnownUsersCache, factory=init_known_users_cache, scope=Scope.singleton
+    )
+
+    def init_outbox() -> BaseOutbox:
+        config = container.resolve(ConfigSettings)
+        return SQLAlchemyOutbox(
+            container.resolve(Database),
+            _batch_size=config.outbox_batch_size,
+            _max_attempts=config.outbox_max_attempts,
+        )
+
+    container.register(BaseOutbox, factory=init_outbox, scope=Scope.singleton)
+
+    def init_sqlalchemy_unit_of_work():
+        if container.resolve(ConfigSettings).event_delivery == "inline":
+            return SQLAlchemyUnitOfWork(container.resolve(Database))
+        return SQLAlchemyUnitOfWork(
+            container.resolve(Database), container.resolve(BaseOutbox)
+        )
+
+    container.register(
+        BaseUnitOfWork,
+        factory=init_sqlalchemy_unit_of_work,
+        scope=Scope.singleton,
+    )
+
+    container.register(Mediator, factory=init_mediator, scope=Scope.singleton)
 
     return container
@@ -1,10 +1,16 @@
 from dataclasses import dataclass
 import abc
-from typing import Any
+from typing import Any, ClassVar
 
 
 @dataclass(frozen=True)
-class BaseCommand(abc.ABC): ...
+class BaseCommand(abc.ABC):
+    # Команда только читает и может выполняться на реплике
+    read_only: ClassVar[bool] = False
+    # Обработчик сам открывает короткие транзакции через unit of work, чтобы
+    # не держать соединение, пока занят не базой. Медиатор транзакцию не
+    # открывает и событий не публикует
+    own_transactions: ClassVar[bool] = False
 
 
 @dataclass(frozen=True)
@@ -4,34 +4,11 @@ from dataclasses import dataclass
 from domain.models.category import Category
 from domain.values.category_title import CategoryTitle
 from infrastructure.repositories.categories.base import BaseCategoryRepository
-from infrastructure.repositories.users.base import BaseUserRepository
 from logic.commands.base import BaseCommand, CommandHandler
-from logic.exceptions.users import UserNotFoundException
+from logic.commands.users import UserExistenceChecker
 from logic.exceptions.categories import CategoryNotFoundException
 
 
-@dataclass(frozen=True)
-class GetAllCategoriesCommand(BaseCommand):
-    user_oid: uuid.UUID
-
-
-@dataclass(frozen=True)
-class GetAllCategoriesCommandHandler(
-    CommandHandler[GetAllCategoriesCommand, list[Category]]
-):
-    category_repository: BaseCategoryRepository
-    user_repository: BaseUserRepository
-
-    async def handle(self, command: GetAllCategoriesCommand) -> list[Category]:
-        user = await self.user_repository.get_user_by_oid(command.user_oid)
-        if user is None:
-            raise UserNotFoundException(command.user_oid)
-        categories = await self.category_repository.get_categories(command.user_oid)
-        if categories is None:
-            return []
-        return list(categories)
-
-
 @dataclass(frozen=True)
 class CreateCategoryCommand(BaseCommand):
     user_oid: uuid.UUID
@@ -41,16 +18,13 @@ class CreateCategoryCommand(BaseCommand):
 @dataclass(frozen=True)
 class CreateCategoryCommandHandler(CommandHandler[CreateCategoryCommand, Category]):
     category_repository: BaseCategoryRepository
-    user_repository: BaseUserRepository
+    user_existence_checker: UserExistenceChecker
 
     async def handle(self, command: CreateCategoryCommand) -> Category:
-        user = await self.user_repository.get_user_by_oid(command.user_oid)
-        if user is None:
-            raise UserNotFoundException(command.user_oid)
-        category = Category(
+        await self.user_existence_checker.ensure_exists(command.user_oid)
+        category = Category.create_category(
             user_oid=command.user_oid, title=CategoryTitle(command.title)
         )
-        user.create_new_category(category=category)
         await self.category_repository.add_category(category=category)
         return category
 
@@ -66,11 +40,13 @@ class UpdateCategoryCommandHandler(CommandHandler[UpdateCategoryCommand, Categor
     category_repository: BaseCategoryRepository
 
     async def handle(self, command: UpdateCategoryCommand):
+        title = CategoryTitle(command.new_title)
         category = await self.category_repository.update_category(
-            command.category_oid, command.new_title
+            command.category_oid, title.as_generic_type()
         )
         if category is None:
             raise CategoryNotFoundException(command.category_oid)
+        category.update_category(title)
         return category
 
 
@@ -92,3 +68,4 @@ class DeleteCategoryCommandHandler(CommandHandler[DeleteCategoryCommand, None]):
         await self.category_repository.delete_category(
             category_oid=command.category_oid
         )
+        category.delete_category()
@@ -1,7 +1,11 @@
 import datetime
+import heapq
+import itertools
 import uuid
 from dataclasses import dataclass
+from typing import AsyncIterable, AsyncIterator, Callable, ClassVar, NoReturn
 
+from domain.exceptions.base import ApplicationException
 from domain.models.category import Category
 from domain.models.task import Task
 from domain.values.task_name import TaskName
@@ -10,29 +14,35 @@ from infrastructure.repositories.tasks.base import BaseTaskRepository
 from infrastructure.repositories.users.base import BaseUserRepository
 
 from logic.commands.base import BaseCommand, CommandHandler
+from logic.commands.users import UserExistenceChecker
 from logic.exceptions.categories import CategoryNotFoundException
 from logic.exceptions.users import UserNotFoundException
-from logic.exceptions.tasks import TaskNotFoundException
+from logic.exceptions.tasks import (
+    ImportTooManyRowsException,
+    InvalidTaskImportFieldException,
+    MalformedTaskImportRowException,
+    TaskNotFoundException,
+)
 
 
 @dataclass(frozen=True)
-class GetAllTasksCommand(BaseCommand):
+class ExportTasksCommand(BaseCommand):
+    read_only: ClassVar[bool] = True
     user_oid: uuid.UUID
 
 
 @dataclass(frozen=True)
-class GetAllTasksCommandHandler(CommandHandler[GetAllTasksCommand, list[Task]]):
+class ExportTasksCommandHandler(
+    CommandHandler[ExportTasksCommand, AsyncIterator[Task]]
+):
     task_repository: BaseTaskRepository
-    user_repository: BaseUserRepository
+    user_existence_checker: UserExistenceChecker
 
-    async def handle(self, command: GetAllTasksCommand) -> list[Task]:
-        user = await self.user_repository.get_user_by_oid(command.user_oid)
-        if user is None:
-            raise UserNotFoundException(command.user_oid)
-        tasks = await self.task_repository.get_tasks(command.user_oid)
-        if tasks is None:
-            return []
-        return list(tasks)
+    async def handle(self, command: ExportTasksCommand) -> AsyncIterator[Task]:
+        await self.user_existence_checker.ensure_exists(command.user_oid)
+        # Строки читаются серверным курсором в отдельной сессии уже во время
+        # отправки ответа, а не внутри транзакции команды
+        return self.task_repository.stream_tasks(command.user_oid)
 
 
 @dataclass(frozen=True)
@@ -47,22 +57,20 @@ class CreateTaskCommand(BaseCommand):
 @dataclass(frozen=True)
 class CreateTaskCommandHandler(CommandHandler[CreateTaskCommand, Task]):
     task_repository: BaseTaskRepository
-    user_repository: BaseUserRepository
+    user_existence_checker: UserExistenceChecker
     category_repository: BaseCategoryRepository
 
     async def handle(self, command: CreateTaskCommand) -> Task:
         category: Category | None = None
         if command.category_oid is not None:
             category = await self.category_repository.get_category_by_oid(
-                command.category_oid
+                command.category_oid, user_oid=command.user_oid
             )
             if category is None:
                 raise CategoryNotFoundException(command.category_oid)
-        user = await self.user_repository.get_user_by_oid(command.user_oid)
-        if user is None:
-            raise UserNotFoundException(command.user_oid)
-        task = Task(
-            user_oid=user.oid,
+        await self.user_existence_checker.ensure_exists(command.user_oid)
+        task = Task.create_task(
+            user_oid=command.user_oid,
             category_oid=category.oid if category else None,
             name=TaskName(command.name),
             is_complete=command.is_complete,
@@ -72,7 +80,6 @@ class CreateTaskCommandHandler(CommandHandler[CreateTaskCommand, Task]):
                 else None
             ),
         )
-        user.create_new_task(task=task)
         await self.task_repository.add_task(task=task)
         return task
 
@@ -80,6 +87,7 @@ class CreateTaskCommandHandler(CommandHandler[CreateTaskCommand, Task]):
 @dataclass(frozen=True)
 class CompleteTaskCommand(BaseCommand):
     task_oid: uuid.UUID
+    user_oid: uuid.UUID
 
 
 @dataclass(frozen=True)
@@ -87,16 +95,18 @@ class CompleteTaskCommandHandler(CommandHandler[CompleteTaskCommand, None]):
     task_repository: BaseTaskRepository
 
     async def handle(self, command: CompleteTaskCommand):
-        task = await self.task_repository.get_task_by_oid(command.task_oid)
+        task = await self.task_repository.complete_task(
+            command.task_oid, user_oid=command.user_oid
+        )
         if task is None:
             raise TaskNotFoundException(command.task_oid)
         task.complete_task()
-        await self.task_repository.complete_task(command.task_oid)
 
 
 @dataclass(frozen=True)
 class UnCompleteTaskCommand(BaseCommand):
     task_oid: uuid.UUID
+    user_oid: uuid.UUID
 
 
 @dataclass(frozen=True)
@@ -104,16 +114,18 @@ class UnCompleteTaskCommandHandler(CommandHandler[UnCompleteTaskCommand, None]):
     task_repository: BaseTaskRepository
 
     async def handle(self, command: UnCompleteTaskCommand):
-        task = await self.task_repository.get_task_by_oid(command.task_oid)
+        task = await self.task_repository.uncomplete_task(
+            command.task_oid, user_oid=command.user_oid
+        )
         if task is None:
             raise TaskNotFoundException(command.task_oid)
         task.uncomplete_task()
-        await self.task_repository.uncomplete_task(command.task_oid)
 
 
 @dataclass(frozen=True)
 class DeleteTaskCommand(BaseCommand):
     task_oid: uuid.UUID
+    user_oid: uuid.UUID
 
 
 @dataclass(frozen=True)
@@ -121,16 +133,19 @@ class DeleteTaskCommandHandler(CommandHandler[DeleteTaskCommand, None]):
     task_repository: BaseTaskRepository
 
     async def handle(self, command: DeleteTaskCommand):
-        task = await self.task_repository.get_task_by_oid(command.task_oid)
+        task = await self.task_repository.delete_task(
+            command.task_oid, user_oid=command.user_oid
+        )
         if task is None:
             raise TaskNotFoundException(command.task_oid)
-        await self.task_repository.delete_task(command.task_oid)
+        task.delete_task()
 
 
 @dataclass(frozen=True)
 class ChangeCategoryTaskCommand(BaseCommand):
     task_oid: uuid.UUID
     category_oid: uuid.UUID
+    user_oid: uuid.UUID
 
 
 @dataclass(frozen=True)
@@ -139,44 +154,357 @@ class ChangeCategoryCommandHandler(CommandHandler[ChangeCategoryTaskCommand, Non
     category_repository: BaseCategoryRepository
 
     async def handle(self, command: ChangeCategoryTaskCommand):
-        category = await self.category_repository.get_category_by_oid(
-            command.category_oid
+        task = await self.task_repository.change_category(
+            category_oid=command.category_oid,
+            task_oid=command.task_oid,
+            user_oid=command.user_oid,
         )
-        if category is None:
-            raise CategoryNotFoundException(command.category_oid)
-        task = await self.task_repository.get_task_by_oid(command.task_oid)
         if task is None:
-            raise TaskNotFoundException(command.task_oid)
+            await _raise_not_found(self.category_repository, command)
         task.change_category(command.category_oid)
-        await self.task_repository.change_category(
-            category_oid=command.category_oid, task_oid=command.task_oid
-        )
 
 
 @dataclass(frozen=True)
 class UpdateTaskCommand(BaseCommand):
     task_oid: uuid.UUID
-    category_oid: uuid.UUID
+    category_oid: uuid.UUID | None
     name: str
-    deadline: datetime.datetime
+    deadline: datetime.datetime | None
+    user_oid: uuid.UUID
 
 
 @dataclass(frozen=True)
 class UpdateTaskCommandHandler(CommandHandler[UpdateTaskCommand, None]):
     task_repository: BaseTaskRepository
+    category_repository: BaseCategoryRepository
 
     async def handle(self, command: UpdateTaskCommand):
-        task = await self.task_repository.get_task_by_oid(command.task_oid)
+        name = TaskName(command.name)
+        Task.check_deadline(command.deadline)
+        task = await self.task_repository.update_task(
+            task_oid=command.task_oid,
+            category_oid=command.category_oid,
+            name=command.name,
+            deadline=command.deadline,
+            user_oid=command.user_oid,
+        )
         if task is None:
-            raise TaskNotFoundException(command.task_oid)
+            await _raise_not_found(self.category_repository, command)
         task.update_task(
-            new_name=TaskName(command.name),
+            new_name=name,
             new_deadline=command.deadline,
             new_category=command.category_oid,
         )
-        await self.task_repository.update_task(
-            task_oid=command.task_oid,
-            category_oid=command.category_oid,
-            name=command.name,
-            deadline=command.deadline,
+
+
+@dataclass(frozen=True)
+class BatchTaskResult:
+    task_oid: uuid.UUID | None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchCreateTaskItem:
+    category_oid: uuid.UUID | None
+    name: str
+    deadline: datetime.datetime | None
+
+
+@dataclass(frozen=True)
+class BatchCreateTasksCommand(BaseCommand):
+    user_oid: uuid.UUID
+    tasks: tuple[BatchCreateTaskItem, ...]
+
+
+@dataclass(frozen=True)
+class BatchCreateTasksCommandHandler(
+    CommandHandler[BatchCreateTasksCommand, list[BatchTaskResult]]
+):
+    task_repository: BaseTaskRepository
+    user_existence_checker: UserExistenceChecker
+    category_repository: BaseCategoryRepository
+
+    async def handle(self, command: BatchCreateTasksCommand) -> list[BatchTaskResult]:
+        await self.user_existence_checker.ensure_exists(command.user_oid)
+        category_oids = {
+            item.category_oid for item in command.tasks if item.category_oid is not None
+        }
+        owned_category_oids = (
+            await self.category_repository.get_owned_category_oids(
+                category_oids, user_oid=command.user_oid
+            )
+            if category_oids
+            else set()
+        )
+        results: list[BatchTaskResult] = []
+        tasks: list[Task] = []
+        for item in command.tasks:
+            try:
+                if (
+                    item.category_oid is not None
+                    and item.category_oid not in owned_category_oids
+                ):
+                    raise CategoryNotFoundException(item.category_oid)
+                task = Task.create_task(
+                    user_oid=command.user_oid,
+                    category_oid=item.category_oid,
+                    name=TaskName(item.name),
+                    is_complete=False,
+                    deadline=(
+                        item.deadline.astimezone(datetime.timezone.utc)
+                        if item.deadline
+                        else None
+                    ),
+                )
+            except ApplicationException as exception:
+                results.append(BatchTaskResult(task_oid=None, error=exception.message))
+                continue
+            tasks.append(task)
+            results.append(BatchTaskResult(task_oid=task.oid))
+        await self.task_repository.add_tasks(tasks)
+        return results
+
+
+@dataclass(frozen=True)
+class BatchCompleteTasksCommand(BaseCommand):
+    user_oid: uuid.UUID
+    task_oids: tuple[uuid.UUID, ...]
+
+
+@dataclass(frozen=True)
+class BatchCompleteTasksCommandHandler(
+    CommandHandler[BatchCompleteTasksCommand, list[BatchTaskResult]]
+):
+    task_repository: BaseTaskRepository
+
+    async def handle(self, command: BatchCompleteTasksCommand) -> list[BatchTaskResult]:
+        tasks = await self.task_repository.complete_tasks(
+            command.task_oids, user_oid=command.user_oid
+        )
+        for task in tasks:
+            task.complete_task()
+        return _batch_results(command.task_oids, tasks)
+
+
+@dataclass(frozen=True)
+class BatchUnCompleteTasksCommand(BaseCommand):
+    user_oid: uuid.UUID
+    task_oids: tuple[uuid.UUID, ...]
+
+
+@dataclass(frozen=True)
+class BatchUnCompleteTasksCommandHandler(
+    CommandHandler[BatchUnCompleteTasksCommand, list[BatchTaskResult]]
+):
+    task_repository: BaseTaskRepository
+
+    async def handle(
+        self, command: BatchUnCompleteTasksCommand
+    ) -> list[BatchTaskResult]:
+        tasks = await self.task_repository.uncomplete_tasks(
+            command.task_oids, user_oid=command.user_oid
+        )
+        for task in tasks:
+            task.uncomplete_task()
+        return _batch_results(command.task_oids, tasks)
+
+
+@dataclass(frozen=True)
+class BatchDeleteTasksCommand(BaseCommand):
+    user_oid: uuid.UUID
+    task_oids: tuple[uuid.UUID, ...]
+
+
+@dataclass(frozen=True)
+class BatchDeleteTasksCommandHandler(
+    CommandHandler[BatchDeleteTasksCommand, list[BatchTaskResult]]
+):
+    task_repository: BaseTaskRepository
+
+    async def handle(self, command: BatchDeleteTasksCommand) -> list[BatchTaskResult]:
+        tasks = await self.task_repository.delete_tasks(
+            command.task_oids, user_oid=command.user_oid
+        )
+        for task in tasks:
+            task.delete_task()
+        return _batch_results(command.task_oids, tasks)
+
+
+def _batch_results(
+    task_oids: tuple[uuid.UUID, ...], tasks: list[Task]
+) -> list[BatchTaskResult]:
+    affected = {task.oid for task in tasks}
+    return [
+        (
+            BatchTaskResult(task_oid=task_oid)
+            if task_oid in affected
+            else BatchTaskResult(
+                task_oid=task_oid, error=TaskNotFoundException(task_oid).message
+            )
+        )
+        for task_oid in task_oids
+    ]
+
+
+@dataclass(frozen=True)
+class ImportTaskRow:
+    line: int
+    name: str | None
+    category_oid: str | None = None
+    is_complete: str | bool | None = None
+    deadline: str | None = None
+    malformed: bool = False
+
+
+@dataclass(frozen=True)
+class ImportTaskRejection:
+    line: int
+    error: str
+
+
+@dataclass(frozen=True)
+class ImportTasksResult:
+    imported: int
+    rejected_count: int
+    rejected: list[ImportTaskRejection]
+
+
+@dataclass(frozen=True)
+class ImportTasksCommand(BaseCommand):
+    user_oid: uuid.UUID
+    rows: AsyncIterable[ImportTaskRow]
+
+
+@dataclass(frozen=True)
+class ImportTasksCommandHandler(CommandHandler[ImportTasksCommand, ImportTasksResult]):
+    task_repository: BaseTaskRepository
+    user_repository: BaseUserRepository
+    category_repository: BaseCategoryRepository
+    chunk_size: ClassVar[int] = 5000
+    max_rows: ClassVar[int] = 50000
+    max_rejected: ClassVar[int] = 1000
+
+    async def handle(self, command: ImportTasksCommand) -> ImportTasksResult:
+        # Тело запроса читается и проверяется до первого обращения к базе:
+        # иначе соединение простаивало бы в транзакции, пока медленный
+        # клиент досылает загрузку. Поэтому число строк ограничено, а из
+        # отклоненных хранятся только первые max_rejected
+        parsed: list[tuple[int, Task]] = []
+        rejected: list[ImportTaskRejection] = []
+        rejected_count = 0
+        rows = 0
+        async for row in command.rows:
+            rows += 1
+            if rows > self.max_rows:
+                raise ImportTooManyRowsException(self.max_rows)
+            try:
+                parsed.append((row.line, _build_imported_task(row, command.user_oid)))
+            except ApplicationException as exception:
+                rejected_count += 1
+                if len(rejected) < self.max_rejected:
+                    rejected.append(ImportTaskRejection(row.line, exception.message))
+        user = await self.user_repository.get_user_by_oid(command.user_oid)
+        if user is None:
+            raise UserNotFoundException(command.user_oid)
+        owned_categories: set[uuid.UUID] = set()
+        for category_oids in itertools.batched(
+            {task.category_oid for _, task in parsed if task.category_oid is not None},
+            self.chunk_size,
+        ):
+            owned_categories |= await self.category_repository.get_owned_category_oids(
+                category_oids, user_oid=user.oid
+            )
+        tasks: list[Task] = []
+        unknown_categories: list[ImportTaskRejection] = []
+        for line, task in parsed:
+            if task.category_oid is None or task.category_oid in owned_categories:
+                tasks.append(task)
+                continue
+            rejected_count += 1
+            if len(unknown_categories) < self.max_rejected:
+                unknown_categories.append(
+                    ImportTaskRejection(
+                        line, CategoryNotFoundException(task.category_oid).message
+                    )
+                )
+        imported = 0
+        for chunk in itertools.batched(tasks, self.chunk_size):
+            imported += await self.task_repository.copy_tasks(chunk)
+        if imported:
+            user.import_tasks(imported)
+        # Оба списка уже идут по номерам строк
+        return ImportTasksResult(
+            imported=imported,
+            rejected_count=rejected_count,
+            rejected=list(
+                itertools.islice(
+                    heapq.merge(
+                        rejected,
+                        unknown_categories,
+                        key=lambda rejection: rejection.line,
+                    ),
+                    self.max_rejected,
+                )
+            ),
+        )
+
+
+_IMPORT_TRUE_VALUES = frozenset({"1", "true", "yes"})
+_IMPORT_FALSE_VALUES = frozenset({"", "0", "false", "no"})
+
+
+def _build_imported_task(row: ImportTaskRow, user_oid: uuid.UUID) -> Task:
+    if row.malformed:
+        raise MalformedTaskImportRowException(row.line)
+    category_oid = _parse_import_field("category_oid", row.category_oid, uuid.UUID)
+    deadline = _parse_import_field(
+        "deadline", row.deadline, datetime.datetime.fromisoformat
+    )
+    return Task(
+        user_oid=user_oid,
+        category_oid=category_oid,
+        name=TaskName(row.name or ""),
+        is_complete=_parse_import_flag(row.is_complete),
+        deadline=deadline.astimezone(datetime.timezone.utc) if deadline else None,
+    )
+
+
+def _parse_import_field[T](
+    field: str, value: str | None, parser: Callable[[str], T]
+) -> T | None:
+    if value is None or value == "":
+        return None
+    try:
+        return parser(value)
+    except ValueError:
+        raise InvalidTaskImportFieldException(field, value)
+
+
+def _parse_import_flag(value: str | bool | None) -> bool:
+    if value is None or isinstance(value, bool):
+        return bool(value)
+    normalized = value.strip().lower()
+    if normalized in _IMPORT_TRUE_VALUES:
+        return True
+    if normalized in _IMPORT_FALSE_VALUES:
+        return False
+    raise InvalidTaskImportFieldException("is_complete", value)
+
+
+async def _raise_not_found(
+    category_repository: BaseCategoryRepository,
+    command: ChangeCategoryTaskCommand | UpdateTaskCommand,
+) -> NoReturn:
+    """
+    Изменение задачи не затронуло ни одной строки: задача не найдена или
+    принадлежит другому пользователю, либо не найдена новая категория.
+    Дополнительный запрос выполняется только на этом пути
+    """
+    if command.category_oid is not None and (
+        await category_repository.get_category_by_oid(
+            command.category_oid, user_oid=command.user_oid
         )
+        is None
+    ):
+        raise CategoryNotFoundException(command.category_oid)
+    raise TaskNotFoundException(command.task_oid)
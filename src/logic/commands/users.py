@@ -1,22 +1,45 @@
 import uuid
 from dataclasses import dataclass
-import hashlib
+from typing import ClassVar
 from joserfc import jwt
 import datetime
 
 from domain.models.user import User
 from domain.values.access_token import AccessToken
 from domain.values.email import Email
-from domain.values.password import Password
+from domain.values.password import HashedPassword, Password
+from infrastructure.cache.known_users import KnownUsersCache
+from infrastructure.email_deliverability.base import BaseEmailDeliverabilityChecker
+from infrastructure.password_hashing.base import BasePasswordHasher
 from infrastructure.repositories.users.base import BaseUserRepository
+from infrastructure.unit_of_work.base import BaseUnitOfWork
 from logic.commands.base import BaseCommand, CommandHandler
 from logic.exceptions.users import (
     UserWithThatEmailAlreadyExistsException,
+    EmailUndeliverableException,
     UserNotFoundException,
     UserNotAuthorizedException,
 )
 
 
+@dataclass(frozen=True)
+class UserExistenceChecker:
+    """
+    Проверка, что пользователь из токена существует. Подтвержденные oid
+    кэшируются, чтобы не делать отдельный SELECT на каждый запрос
+    """
+
+    user_repository: BaseUserRepository
+    known_users: KnownUsersCache
+
+    async def ensure_exists(self, user_oid: uuid.UUID) -> None:
+        if user_oid in self.known_users:
+            return
+        if not await self.user_repository.check_user_exists(user_oid):
+            raise UserNotFoundException(user_oid)
+        self.known_users.add(user_oid)
+
+
 @dataclass(frozen=True)
 class CreateUserCommand(BaseCommand):
     email: str
@@ -26,13 +49,21 @@ class CreateUserCommand(BaseCommand):
 @dataclass(frozen=True)
 class CreateUserCommandHandler(CommandHandler[CreateUserCommand, User]):
     user_repository: BaseUserRepository
+    email_deliverability_checker: BaseEmailDeliverabilityChecker
+    password_hasher: BasePasswordHasher
 
     async def handle(self, command: CreateUserCommand) -> User:
+        email = Email(value=command.email)
+        password = Password(command.password)
+        # DNS и хэш считаются до первого запроса, чтобы не держать соединение
+        if not await self.email_deliverability_checker.is_deliverable(command.email):
+            raise EmailUndeliverableException(command.email)
+        hashed_password = HashedPassword(
+            await self.password_hasher.hash(password.as_generic_type())
+        )
         if await self.user_repository.check_user_exists_by_email(email=command.email):
             raise UserWithThatEmailAlreadyExistsException(command.email)
-        new_user = User.create_user(
-            email=Email(value=command.email), password=Password(command.password)
-        )
+        new_user = User.create_user(email=email, password=hashed_password)
         await self.user_repository.add_user(new_user)
         return new_user
 
@@ -58,20 +89,35 @@ class DeleteUserCommandHandler(CommandHandler[DeleteUserCommand, None]):
 class SignInUserCommand(BaseCommand):
     email: str
     password: str
+    own_transactions: ClassVar[bool] = True
 
 
 @dataclass(frozen=True)
 class SignInUserCommandHandler(CommandHandler[SignInUserCommand, AccessToken]):
     user_repository: BaseUserRepository
+    password_hasher: BasePasswordHasher
+    unit_of_work: BaseUnitOfWork
 
     async def handle(self, command: SignInUserCommand) -> AccessToken:
-        user = await self.user_repository.check_user_by_email(command.email)
-        if (
-            user is None
-            or user[0] is None
-            or user[1] != hashlib.sha256(command.password.encode("utf8")).hexdigest()
-        ):
-            raise UserNotAuthorizedException(command.email, command.password)
+        # Хэш читается в короткой транзакции, а проверяется уже без
+        # соединения: при наплыве входов пул базы не ждет пул процессов
+        async with self.unit_of_work.transaction(read_only=True):
+            user = await self.user_repository.check_user_by_email(command.email)
+        if user is None or user[0] is None:
+            # Неизвестный email проверяется так же долго, как известный,
+            # иначе по времени ответа можно перебирать адреса
+            await self.password_hasher.verify(
+                command.password, self.password_hasher.dummy_hash
+            )
+            raise UserNotAuthorizedException(command.email)
+        if not await self.password_hasher.verify(command.password, user[1]):
+            raise UserNotAuthorizedException(command.email)
+        if self.password_hasher.needs_rehash(user[1]):
+            password = await self.password_hasher.hash(command.password)
+            async with self.unit_of_work.transaction():
+                await self.user_repository.update_user_password(
+                    user_oid=user[0], password=password
+                )
         return AccessToken(
             jwt.encode(
                 {"alg": "HS256"},
@@ -7,4 +7,5 @@ from domain.events.base import BaseEvent
 
 @dataclass
 class EventHandler[ET: BaseEvent, ER: Any](abc.ABC):
-    def handle(self, event: ET) -> ER: ...
+    @abc.abstractmethod
+    async def handle(self, event: ET) -> ER: ...
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from domain.events.base import BaseEvent
+from domain.events.users import UserDeleted
+from infrastructure.cache.known_users import KnownUsersCache
+from infrastructure.cache.user_scoped import UserScopedCache
+from logic.events.base import EventHandler
+
+
+@dataclass
+class InvalidateUserCacheEventHandler(EventHandler[BaseEvent, None]):
+    """
+    Сбрасывает закэшированные ответы со списками пользователя, чьи задачи
+    или категории изменились, для событий с полем user_oid
+    """
+
+    list_cache: UserScopedCache
+
+    async def handle(self, event: BaseEvent) -> None:
+        await self.list_cache.invalidate(event.user_oid)
+
+
+@dataclass
+class ForgetKnownUserEventHandler(EventHandler[UserDeleted, None]):
+    known_users: KnownUsersCache
+
+    async def handle(self, event: UserDeleted) -> None:
+        self.known_users.discard(event.user_oid)
@@ -11,3 +11,50 @@ class TaskNotFoundException(LogicException):
     @property
     def message(self):
         return f"Задача с oid <{self.task_oid}> не найдена"
+
+
+@dataclass(frozen=True, eq=False)
+class InvalidTaskImportFieldException(LogicException):
+    field: str
+    value: str
+
+    @property
+    def message(self):
+        return f"Некорректное значение <{self.value}> в поле <{self.field}>"
+
+
+@dataclass(frozen=True, eq=False)
+class MalformedTaskImportRowException(LogicException):
+    line: int
+
+    @property
+    def message(self):
+        return f"Не удалось разобрать строку <{self.line}>"
+
+
+@dataclass(frozen=True, eq=False)
+class ImportLineTooLongException(LogicException):
+    line: int
+    limit: int
+
+    @property
+    def message(self):
+        return f"Строка <{self.line}> длиннее {self.limit} символов"
+
+
+@dataclass(frozen=True, eq=False)
+class ImportTooLargeException(LogicException):
+    limit: int
+
+    @property
+    def message(self):
+        return f"Загрузка больше {self.limit} байт"
+
+
+@dataclass(frozen=True, eq=False)
+class ImportTooManyRowsException(LogicException):
+    limit: int
+
+    @property
+    def message(self):
+        return f"В загрузке больше {self.limit} строк"
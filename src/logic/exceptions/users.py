@@ -13,6 +13,15 @@ class UserWithThatEmailAlreadyExistsException(LogicException):
         return f"Пользователь с почтой <{self.email}> уже существует"
 
 
+@dataclass(frozen=True, eq=False)
+class EmailUndeliverableException(LogicException):
+    email: str
+
+    @property
+    def message(self):
+        return f"Почтовый адрес <{self.email}> не принимает письма"
+
+
 @dataclass(frozen=True, eq=False)
 class UserNotFoundException(LogicException):
     user_oid: uuid.UUID
@@ -25,7 +34,6 @@ class UserNotFoundException(LogicException):
 @dataclass(frozen=True, eq=False)
 class UserNotAuthorizedException(LogicException):
     email: str
-    password: str
 
     @property
     def message(self):
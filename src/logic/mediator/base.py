@@ -1,24 +1,49 @@
+import asyncio
+import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any, Iterable, Type
 
 from domain.events.base import BaseEvent
+from infrastructure.unit_of_work.base import BaseUnitOfWork
 from logic.commands.base import BaseCommand, CommandHandler
 from logic.events.base import EventHandler
 from logic.exceptions.mediator import (
-    EventHandlersNotRegisteredException,
     CommandHandlersNotRegisteredException,
+    QueryHandlerNotRegisteredException,
 )
+from logic.queries.base import BaseQuery, QueryHandler
+
+logger = logging.getLogger(__name__)
+
+# Результат обработчика, завершившегося ошибкой или по таймауту
+_FAILED = object()
 
 
 @dataclass
-class Mediator[ET: BaseEvent, ER: Any, CT: BaseCommand, CR: Any]:
+class Mediator[
+    ET: BaseEvent, ER: Any, CT: BaseCommand, CR: Any, QT: BaseQuery, QR: Any
+]:
+    unit_of_work: BaseUnitOfWork = field(kw_only=True)
     events_map: dict[ET, list[EventHandler]] = field(
         default_factory=lambda: defaultdict(list), kw_only=True
     )
     commands_map: dict[CT, list[CommandHandler]] = field(
         default_factory=lambda: defaultdict(list), kw_only=True
     )
+    queries_map: dict[QT, QueryHandler] = field(default_factory=dict, kw_only=True)
+    # Сколько обработчиков событий выполняется одновременно
+    publish_concurrency: int = field(default=10, kw_only=True)
+    # Секунд на один обработчик события, None - без ограничения
+    handler_timeout: float | None = field(default=5.0, kw_only=True)
+    # Сколько событий ждут фоновой обработки, дальше publish ждет места
+    background_queue_size: int = field(default=1000, kw_only=True)
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+    _queue: asyncio.Queue | None = field(default=None, init=False, repr=False)
+    _worker: asyncio.Task | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self._semaphore = asyncio.Semaphore(self.publish_concurrency)
 
     def register_event(self, event: ET, event_handlers: Iterable[EventHandler[ET, ER]]):
         self.events_map[event].extend(event_handlers)
@@ -28,19 +53,137 @@ class Mediator[ET: BaseEvent, ER: Any, CT: BaseCommand, CR: Any]:
     ):
         self.commands_map[command].extend(command_handlers)
 
-    async def publish(self, events: Iterable[ET]) -> Iterable[ER]:
-        handlers = self.events_map.get(events[0].__class__)
-        if not handlers:
-            raise EventHandlersNotRegisteredException(events[0].__class__)
-        result = []
+    def register_query(self, query: QT, query_handler: QueryHandler[QT, QR]):
+        self.queries_map[query] = query_handler
+
+    async def publish(
+        self,
+        events: Iterable[ET],
+        wait: bool = True,
+        failed: list[ET] | None = None,
+    ) -> Iterable[ER]:
+        """
+        Обработчики всех событий выполняются конкурентно, не больше
+        publish_concurrency одновременно. Ошибка или таймаут одного
+        обработчика не мешают остальным: он пишется в лог и не попадает
+        в результат. С wait=False события уходят в фоновую очередь,
+        а publish сразу возвращает пустой результат. В failed, если он
+        передан, попадают события, хотя бы один обработчик которых не
+        отработал, - по ним доставку можно повторить.
+        События без обработчиков пропускаются: агрегаты регистрируют
+        больше событий, чем на них подписано
+        """
+        if not wait:
+            await self._enqueue(events)
+            return []
+        calls = [
+            (event, handler)
+            for event in events
+            for handler in self.events_map.get(event.__class__, ())
+        ]
+        if not calls:
+            return []
+        if len(calls) == 1:
+            results = [await self._handle_event(calls[0][1], calls[0][0])]
+        else:
+            results = await asyncio.gather(
+                *(self._handle_event(handler, event) for event, handler in calls)
+            )
+        if failed is not None:
+            failed.extend(
+                {
+                    id(event): event
+                    for (event, _), result in zip(calls, results)
+                    if result is _FAILED
+                }.values()
+            )
+        return [result for result in results if result is not _FAILED]
+
+    async def _handle_event(self, handler: EventHandler, event: ET) -> ER:
+        async with self._semaphore:
+            try:
+                return await asyncio.wait_for(
+                    handler.handle(event), self.handler_timeout
+                )
+            except TimeoutError:
+                logger.error(
+                    "Обработчик %s события %s не уложился в %s с",
+                    type(handler).__name__,
+                    type(event).__name__,
+                    self.handler_timeout,
+                )
+            except Exception:
+                logger.exception(
+                    "Обработчик %s события %s завершился ошибкой",
+                    type(handler).__name__,
+                    type(event).__name__,
+                )
+            return _FAILED
+
+    async def _enqueue(self, events: Iterable[ET]) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.background_queue_size)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._work(self._queue))
         for event in events:
-            handlers: Iterable[EventHandler] = self.events_map[event.__class__]
-            result.extend([await handler.handle(event) for handler in handlers])
-        return result
+            await self._queue.put(event)
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        # Все накопившиеся события уходят одной публикацией: их обработчики
+        # выполняются конкурентно, а не по одному событию за раз
+        while True:
+            events = [await queue.get()]
+            while not queue.empty():
+                events.append(queue.get_nowait())
+            try:
+                await self.publish(events)
+            finally:
+                for _ in events:
+                    queue.task_done()
+
+    async def close(self, timeout: float | None = None) -> None:
+        """
+        Дожидается фоновой обработки уже отданных событий и останавливает
+        обработчик очереди
+        """
+        if self._worker is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except TimeoutError:
+            pass
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
 
     async def handle_command(self, command: BaseCommand) -> Iterable[CR]:
         command_type = command.__class__
         handlers: list[CommandHandler] = self.commands_map.get(command_type)
         if not handlers:
             raise CommandHandlersNotRegisteredException(command_type)
-        return [await handler.handle(command=command) for handler in handlers]
+        if command.own_transactions:
+            return [await handler.handle(command=command) for handler in handlers]
+        transaction = self.unit_of_work.transaction(
+            read_only=command.read_only, user_oid=getattr(command, "user_oid", None)
+        )
+        async with transaction:
+            result = [await handler.handle(command=command) for handler in handlers]
+        # Публикуются только события зафиксированной транзакции
+        await self.publish(transaction.events)
+        return result
+
+    async def handle_query(self, query: BaseQuery) -> QR:
+        """
+        У запроса ровно один обработчик, он только читает: транзакция
+        уходит на реплику, событий нет
+        """
+        handler: QueryHandler | None = self.queries_map.get(query.__class__)
+        if handler is None:
+            raise QueryHandlerNotRegisteredException(query.__class__)
+        async with self.unit_of_work.transaction(
+            read_only=True, user_oid=getattr(query, "user_oid", None)
+        ):
+            return await handler.handle(query)
@@ -0,0 +1,42 @@
+import base64
+import binascii
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+from logic.exceptions.pagination import InvalidCursorException
+
+
+@dataclass(frozen=True)
+class Page[T]:
+    items: list[T]
+    next_cursor: str | None
+
+
+def encode_cursor(oid: uuid.UUID) -> str:
+    return base64.urlsafe_b64encode(oid.bytes).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str | None) -> uuid.UUID | None:
+    if cursor is None:
+        return None
+    try:
+        return uuid.UUID(
+            bytes=base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+    except (binascii.Error, ValueError):
+        raise InvalidCursorException(cursor)
+
+
+def build_page[T](
+    items: Sequence[T] | None, limit: int, key: Callable[[T], uuid.UUID]
+) -> Page[T]:
+    """
+    Репозиторий запрашивается с limit + 1, лишняя строка означает, что
+    есть следующая страница
+    """
+    items = list(items or [])
+    if len(items) <= limit:
+        return Page(items=items, next_cursor=None)
+    items = items[:limit]
+    return Page(items=items, next_cursor=encode_cursor(key(items[-1])))
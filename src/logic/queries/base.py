@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+import abc
+from typing import Any
+
+
+@dataclass(frozen=True)
+class BaseQuery(abc.ABC):
+    pass
+
+
+@dataclass(frozen=True)
+class QueryHandler[QT: BaseQuery, QR: Any](abc.ABC):
+    @abc.abstractmethod
+    async def handle(self, query: QT) -> QR: ...
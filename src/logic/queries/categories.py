@@ -0,0 +1,31 @@
+import uuid
+from dataclasses import dataclass
+
+from infrastructure.repositories.categories.base import BaseCategoryRepository
+from infrastructure.repositories.read_models import CategoryReadModel
+from logic.commands.users import UserExistenceChecker
+from logic.pagination import Page, build_page, decode_cursor
+from logic.queries.base import BaseQuery, QueryHandler
+
+
+@dataclass(frozen=True)
+class GetAllCategoriesQuery(BaseQuery):
+    user_oid: uuid.UUID
+    limit: int = 100
+    cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class GetAllCategoriesQueryHandler(
+    QueryHandler[GetAllCategoriesQuery, Page[CategoryReadModel]]
+):
+    category_repository: BaseCategoryRepository
+    user_existence_checker: UserExistenceChecker
+
+    async def handle(self, query: GetAllCategoriesQuery) -> Page[CategoryReadModel]:
+        after_oid = decode_cursor(query.cursor)
+        await self.user_existence_checker.ensure_exists(query.user_oid)
+        categories = await self.category_repository.get_category_read_models(
+            query.user_oid, limit=query.limit + 1, after_oid=after_oid
+        )
+        return build_page(categories, query.limit, key=lambda category: category.oid)
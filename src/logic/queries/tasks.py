@@ -0,0 +1,56 @@
+import uuid
+from dataclasses import dataclass
+
+from infrastructure.repositories.read_models import TaskReadModel
+from infrastructure.repositories.tasks.base import BaseTaskRepository
+from logic.commands.users import UserExistenceChecker
+from logic.pagination import Page, build_page, decode_cursor
+from logic.queries.base import BaseQuery, QueryHandler
+
+
+@dataclass(frozen=True)
+class GetAllTasksQuery(BaseQuery):
+    user_oid: uuid.UUID
+    limit: int = 100
+    cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class GetAllTasksQueryHandler(QueryHandler[GetAllTasksQuery, Page[TaskReadModel]]):
+    task_repository: BaseTaskRepository
+    user_existence_checker: UserExistenceChecker
+
+    async def handle(self, query: GetAllTasksQuery) -> Page[TaskReadModel]:
+        after_oid = decode_cursor(query.cursor)
+        await self.user_existence_checker.ensure_exists(query.user_oid)
+        tasks = await self.task_repository.get_task_read_models(
+            query.user_oid, limit=query.limit + 1, after_oid=after_oid
+        )
+        return build_page(tasks, query.limit, key=lambda task: task.oid)
+
+
+@dataclass(frozen=True)
+class GetTasksByCategoryQuery(BaseQuery):
+    user_oid: uuid.UUID
+    category_oid: uuid.UUID
+    limit: int = 100
+    cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class GetTasksByCategoryQueryHandler(
+    QueryHandler[GetTasksByCategoryQuery, Page[TaskReadModel]]
+):
+    task_repository: BaseTaskRepository
+    user_existence_checker: UserExistenceChecker
+
+    async def handle(self, query: GetTasksByCategoryQuery) -> Page[TaskReadModel]:
+        after_oid = decode_cursor(query.cursor)
+        await self.user_existence_checker.ensure_exists(query.user_oid)
+        tasks = await self.task_repository.get_task_read_models_by_category(
+            query.user_oid,
+            query.category_oid,
+            limit=query.limit + 1,
+            after_oid=after_oid,
+        )
+        return build_page(tasks, query.limit, key=lambda task: task.oid)
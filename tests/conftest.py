@@ -0,0 +1,11 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
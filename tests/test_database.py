@@ -0,0 +1,46 @@
+import uuid
+
+import pytest
+from sqlalchemy import make_url
+
+from infrastructure.database import Database
+from infrastructure.invalidation.base import Invalidation
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def database():
+    # Движки подключаются лениво, поэтому базы за адресами не нужны
+    database = Database(
+        make_url("postgresql+asyncpg://primary/todo"),
+        _replica_urls=(make_url("postgresql+asyncpg://replica/todo"),),
+        _replica_max_lag=None,
+    )
+    yield database
+    await database.dispose()
+
+
+class _Session:
+    def __init__(self, *user_oids: uuid.UUID):
+        self.info = {
+            "invalidations": {Invalidation("task", user_oid) for user_oid in user_oids}
+        }
+
+
+async def test_writer_reads_from_primary(database: Database):
+    writer, reader = uuid.uuid4(), uuid.uuid4()
+    assert await database.read_session_maker(writer) is not database.async_session_maker
+    database.track_writes(_Session(writer))
+    assert await database.read_session_maker(writer) is database.async_session_maker
+    assert await database.read_session_maker(reader) is not database.async_session_maker
+
+
+async def test_writes_from_other_processes(database: Database):
+    writer, reader = uuid.uuid4(), uuid.uuid4()
+    await database.on_invalidation(Invalidation("category", writer))
+    assert await database.read_session_maker(writer) is database.async_session_maker
+    assert await database.read_session_maker(reader) is not database.async_session_maker
+    # Уведомления могли потеряться: все читают с основного
+    await database.on_invalidation(None)
+    assert await database.read_session_maker(reader) is database.async_session_maker
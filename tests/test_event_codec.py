@@ -0,0 +1,35 @@
+import datetime
+import uuid
+
+import pytest
+
+from domain.events.tasks import NewTaskCreated, TaskUpdated
+from infrastructure.codecs.events import EventCodec
+
+NAIVE = datetime.datetime(2030, 1, 2, 3, 4, 5, 6)
+AWARE = NAIVE.replace(tzinfo=datetime.timezone(datetime.timedelta(hours=3)))
+
+
+@pytest.mark.parametrize("deadline", [NAIVE, AWARE, None])
+def test_round_trip_keeps_timezone_awareness(deadline: datetime.datetime | None):
+    events = (
+        NewTaskCreated(
+            user_oid=uuid.uuid4(),
+            category_oid=None,
+            name="задача",
+            is_complete=False,
+            deadline=deadline,
+        ),
+        TaskUpdated(
+            task_oid=uuid.uuid4(),
+            user_oid=uuid.uuid4(),
+            category_oid=uuid.uuid4(),
+            name="задача",
+            deadline=deadline,
+        ),
+    )
+    for event in events:
+        decoded = EventCodec.decode(EventCodec.encode(event))
+        assert decoded == event
+        if deadline is not None:
+            assert (decoded.deadline.tzinfo is None) == (deadline.tzinfo is None)
@@ -0,0 +1,94 @@
+import dataclasses
+import uuid
+from typing import ClassVar
+
+import pytest
+
+from domain.models.user import User
+from domain.values.email import Email
+from domain.values.password import HashedPassword
+from logic.commands.tasks import (
+    ImportTaskRow,
+    ImportTasksCommand,
+    ImportTasksCommandHandler,
+)
+from logic.exceptions.tasks import ImportTooManyRowsException
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclasses.dataclass
+class _Users:
+    user: User
+
+    async def get_user_by_oid(self, user_oid: uuid.UUID) -> User | None:
+        return self.user if user_oid == self.user.oid else None
+
+
+@dataclasses.dataclass
+class _Categories:
+    owned: set[uuid.UUID]
+
+    async def get_owned_category_oids(self, category_oids, user_oid):
+        return self.owned & set(category_oids)
+
+
+@dataclasses.dataclass
+class _Tasks:
+    copied: list = dataclasses.field(default_factory=list)
+
+    async def copy_tasks(self, tasks) -> int:
+        self.copied.extend(tasks)
+        return len(tasks)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Handler(ImportTasksCommandHandler):
+    max_rows: ClassVar[int] = 10
+    max_rejected: ClassVar[int] = 3
+
+
+async def _rows(*rows: ImportTaskRow):
+    for row in rows:
+        yield row
+
+
+@pytest.fixture
+def user() -> User:
+    return User(Email("import@example.com"), HashedPassword("test"))
+
+
+async def test_rejections_counted_but_bounded(user: User):
+    owned, unknown = uuid.uuid4(), uuid.uuid4()
+    tasks = _Tasks()
+    handler = _Handler(tasks, _Users(user), _Categories({owned}))
+    result = await handler.handle(
+        ImportTasksCommand(
+            user_oid=user.oid,
+            rows=_rows(
+                ImportTaskRow(line=1, name="ok", category_oid=str(owned)),
+                ImportTaskRow(line=2, name="unknown", category_oid=str(unknown)),
+                ImportTaskRow(line=3, name=None, malformed=True),
+                ImportTaskRow(line=4, name="bad", is_complete="maybe"),
+                ImportTaskRow(line=5, name="unknown", category_oid=str(unknown)),
+                ImportTaskRow(line=6, name=None, malformed=True),
+                ImportTaskRow(line=7, name="ok"),
+            ),
+        )
+    )
+    assert result.imported == len(tasks.copied) == 2
+    assert result.rejected_count == 5
+    assert [rejection.line for rejection in result.rejected] == [2, 3, 4]
+
+
+async def test_too_many_rows(user: User):
+    tasks = _Tasks()
+    handler = _Handler(tasks, _Users(user), _Categories(set()))
+    with pytest.raises(ImportTooManyRowsException):
+        await handler.handle(
+            ImportTasksCommand(
+                user_oid=user.oid,
+                rows=_rows(*(ImportTaskRow(line=i, name="t") for i in range(11))),
+            )
+        )
+    assert tasks.copied == []
@@ -0,0 +1,57 @@
+import pytest
+
+from application.api.tasks.importers import iter_lines, parse_csv, parse_ndjson
+from logic.exceptions.tasks import (
+    ImportLineTooLongException,
+    ImportTooLargeException,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def _chunks(data: bytes, size: int = 7):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+async def _collect(rows) -> list:
+    return [row async for row in rows]
+
+
+async def test_csv_quoted_field_spans_lines():
+    data = (
+        'name,is_complete\r\n"first\r\nsecond, ""quoted""",true\r\n\r\nplain,0\r\n'
+    ).encode()
+    rows = await _collect(parse_csv(_chunks(data)))
+    assert [(row.line, row.name, row.is_complete) for row in rows] == [
+        (2, 'first\nsecond, "quoted"', "true"),
+        (5, "plain", "0"),
+    ]
+
+
+async def test_csv_unterminated_quote_is_malformed():
+    rows = await _collect(parse_csv(_chunks(b'name\nok\n"broken\nrest\n')))
+    assert [(row.line, row.name, row.malformed) for row in rows] == [
+        (2, "ok", False),
+        (3, None, True),
+    ]
+
+
+async def test_ndjson_rows():
+    data = b'{"name": "a", "is_complete": true}\n[1]\n\n{"name": "b"}'
+    rows = await _collect(parse_ndjson(_chunks(data)))
+    assert [(row.line, row.name, row.malformed) for row in rows] == [
+        (1, "a", False),
+        (2, None, True),
+        (4, "b", False),
+    ]
+
+
+async def test_line_without_newline_is_bounded():
+    with pytest.raises(ImportLineTooLongException):
+        await _collect(iter_lines(_chunks(b"x" * 100, size=10), max_line_length=50))
+
+
+async def test_upload_size_is_bounded():
+    with pytest.raises(ImportTooLargeException):
+        await _collect(iter_lines(_chunks(b"line\n" * 20, size=10), max_size=50))
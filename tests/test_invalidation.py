@@ -0,0 +1,83 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.invalidation.base import Invalidation
+from infrastructure.invalidation.memory import InMemoryInvalidationBus
+
+pytestmark = pytest.mark.anyio
+
+
+def _subscribed_bus() -> tuple[InMemoryInvalidationBus, list]:
+    bus = InMemoryInvalidationBus()
+    received = []
+
+    async def subscriber(invalidation: Invalidation | None) -> None:
+        received.append(invalidation)
+
+    bus.subscribe(subscriber)
+    return bus, received
+
+
+async def _settle(bus: InMemoryInvalidationBus) -> None:
+    # Подписчики вызываются отдельными задачами
+    await asyncio.gather(*bus._deliveries)
+
+
+def test_invalidation_round_trip():
+    invalidation = Invalidation(entity="task", user_oid=uuid.uuid4())
+    assert Invalidation.decode(invalidation.encode()) == invalidation
+
+
+async def test_delivered_after_commit():
+    bus, received = _subscribed_bus()
+    invalidation = Invalidation(entity="task", user_oid=uuid.uuid4())
+    async with AsyncSession() as async_session:
+        async with async_session.begin():
+            await bus.publish(async_session, invalidation)
+            await asyncio.sleep(0)
+            assert received == []
+        # Доставляется один раз
+        async with async_session.begin():
+            pass
+        await async_session.rollback()
+    await _settle(bus)
+    assert received == [invalidation]
+
+
+async def test_not_delivered_after_rollback():
+    bus, received = _subscribed_bus()
+    async with AsyncSession() as async_session:
+        with pytest.raises(RuntimeError):
+            async with async_session.begin():
+                await bus.publish(
+                    async_session, Invalidation(entity="task", user_oid=uuid.uuid4())
+                )
+                raise RuntimeError
+        # Следующая фиксация в той же сессии не доставляет отмененное
+        async with async_session.begin():
+            pass
+    await _settle(bus)
+    assert received == []
+
+
+async def test_delivered_to_every_subscriber():
+    bus, received = _subscribed_bus()
+    other = []
+
+    async def other_subscriber(invalidation: Invalidation | None) -> None:
+        other.append(invalidation)
+
+    bus.subscribe(other_subscriber)
+    invalidations = [
+        Invalidation(entity=entity, user_oid=uuid.uuid4())
+        for entity in ("task", "category")
+    ]
+    async with AsyncSession() as async_session:
+        async with async_session.begin():
+            for invalidation in invalidations:
+                await bus.publish(async_session, invalidation)
+    await _settle(bus)
+    assert received == other == invalidations
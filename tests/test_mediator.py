@@ -0,0 +1,103 @@
+import asyncio
+import dataclasses
+import uuid
+
+import pytest
+
+from domain.events.tasks import TaskCompleted, TaskDeleted
+from logic.events.base import EventHandler
+from logic.mediator.base import Mediator
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclasses.dataclass
+class _Handler(EventHandler):
+    delay: float = 0
+    error: bool = False
+    handled: list = dataclasses.field(default_factory=list)
+
+    async def handle(self, event):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise RuntimeError("сбой обработчика")
+        self.handled.append(event)
+        return event.task_oid
+
+
+def _mediator(**kwargs) -> Mediator:
+    # Публикация событий не ходит в базу
+    return Mediator(unit_of_work=None, **kwargs)
+
+
+def _completed() -> TaskCompleted:
+    return TaskCompleted(task_oid=uuid.uuid4(), user_oid=uuid.uuid4())
+
+
+async def test_publish_returns_results_of_all_handlers():
+    mediator = _mediator()
+    first, second = _Handler(), _Handler()
+    mediator.register_event(TaskCompleted, [first, second])
+    events = [_completed(), _completed()]
+    results = await mediator.publish(events)
+    assert sorted(results) == sorted([i.task_oid for i in events] * 2)
+    assert first.handled == second.handled == events
+
+
+async def test_events_without_handlers_are_skipped():
+    mediator = _mediator()
+    event = TaskDeleted(task_oid=uuid.uuid4(), user_oid=uuid.uuid4())
+    failed = []
+    assert await mediator.publish([event], failed=failed) == []
+    assert failed == []
+
+
+async def test_failed_and_timed_out_handlers():
+    mediator = _mediator(handler_timeout=0.05)
+    working = _Handler()
+    mediator.register_event(TaskCompleted, [working])
+    mediator.register_event(TaskDeleted, [_Handler(delay=1), _Handler(error=True)])
+    completed = _completed()
+    deleted = TaskDeleted(task_oid=uuid.uuid4(), user_oid=uuid.uuid4())
+    failed = []
+    results = await mediator.publish([completed, deleted], failed=failed)
+    # Сбои не мешают остальным обработчикам и не попадают в результат
+    assert results == [completed.task_oid]
+    assert working.handled == [completed]
+    # Событие с двумя сбойными обработчиками попадает в failed один раз
+    assert failed == [deleted]
+
+
+async def test_publish_concurrency():
+    mediator = _mediator(publish_concurrency=2)
+    running = maximum = 0
+
+    @dataclasses.dataclass
+    class Counting(EventHandler):
+        async def handle(self, event):
+            nonlocal running, maximum
+            running += 1
+            maximum = max(maximum, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    mediator.register_event(TaskCompleted, [Counting()])
+    await mediator.publish([_completed() for _ in range(6)])
+    assert maximum == 2
+
+
+async def test_background_queue():
+    mediator = _mediator(background_queue_size=2)
+    handler = _Handler(delay=0.01)
+    mediator.register_event(TaskCompleted, [handler])
+    events = [_completed() for _ in range(5)]
+    # Очередь меньше числа событий: publish ждет места, но не обработки
+    assert await mediator.publish(events, wait=False) == []
+    assert len(handler.handled) < len(events)
+    await mediator.close(timeout=1)
+    assert handler.handled == events
+    assert mediator._worker is None
+
+
+async def test_close_without_background_events():
+    await _mediator().close()
@@ -0,0 +1,46 @@
+import uuid
+
+import pytest
+
+from logic.exceptions.pagination import InvalidCursorException
+from logic.pagination import Page, build_page, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    oid = uuid.uuid4()
+    cursor = encode_cursor(oid)
+    # Без паддинга и символов, которые надо экранировать в URL
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+    assert decode_cursor(cursor) == oid
+
+
+def test_no_cursor():
+    assert decode_cursor(None) is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "не base64",
+        "abc",
+        encode_cursor(uuid.uuid4())[:-2],
+        encode_cursor(uuid.uuid4()) + "AAAA",
+    ],
+)
+def test_invalid_cursor_is_rejected(cursor: str):
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor)
+
+
+def test_last_page():
+    oids = [uuid.uuid4() for _ in range(3)]
+    assert build_page(oids, 3, lambda oid: oid) == Page(items=oids, next_cursor=None)
+    assert build_page(None, 3, lambda oid: oid) == Page(items=[], next_cursor=None)
+
+
+def test_next_page_cursor_points_at_last_item():
+    oids = sorted(uuid.uuid4() for _ in range(4))
+    page = build_page(oids, 3, lambda oid: oid)
+    assert page.items == oids[:3]
+    assert decode_cursor(page.next_cursor) == oids[2]
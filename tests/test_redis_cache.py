@@ -0,0 +1,108 @@
+import uuid
+
+import pytest
+
+from configs.config import ConfigSettings
+from infrastructure.cache.base import CacheBackendError, CacheStats
+from infrastructure.cache.lru import LRUCacheBackend
+from infrastructure.cache.redis import RedisCacheBackend
+from infrastructure.cache.user_scoped import UserScopedCache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def backend():
+    # Свой префикс на тест, чтобы не задеть чужие ключи на сервере
+    backend = RedisCacheBackend.from_url(
+        ConfigSettings().cache_redis_url, prefix=f"test:{uuid.uuid4().hex}:"
+    )
+    try:
+        await backend.get("ping")
+    except CacheBackendError:
+        await backend.close()
+        pytest.skip("Redis недоступен")
+    yield backend
+    await backend.clear()
+    await backend.close()
+
+
+async def _load_counter():
+    loads = 0
+
+    async def load() -> bytes:
+        nonlocal loads
+        loads += 1
+        return b"%d" % loads
+
+    return load
+
+
+async def test_get_set_delete(backend: RedisCacheBackend):
+    assert await backend.get("key") is None
+    await backend.set("key", b"value", 10)
+    assert await backend.get("key") == b"value"
+    await backend.delete("key")
+    assert await backend.get("key") is None
+
+
+async def test_clear_only_own_prefix(backend: RedisCacheBackend):
+    other = RedisCacheBackend.from_url(
+        ConfigSettings().cache_redis_url, prefix=f"test:{uuid.uuid4().hex}:"
+    )
+    # Ключей больше, чем удаляется за одну пачку
+    for i in range(2500):
+        await backend.set(f"key:{i}", b"value", 10)
+    await other.set("key", b"value", 10)
+    await backend.clear()
+    assert [await backend.get(f"key:{i}") for i in (0, 1000, 2499)] == [None] * 3
+    assert await other.get("key") == b"value"
+    await other.clear()
+    await other.close()
+
+
+async def test_evictions(backend: RedisCacheBackend):
+    assert await backend.evictions() >= 0
+
+
+async def test_unavailable_server():
+    backend = RedisCacheBackend.from_url("redis://127.0.0.1:1/0", timeout=0.5)
+    with pytest.raises(CacheBackendError):
+        await backend.get("key")
+    with pytest.raises(CacheBackendError):
+        await backend.clear()
+    await backend.close()
+
+
+async def test_user_scoped_cache_stats(backend: RedisCacheBackend):
+    cache = UserScopedCache(backend)
+    load = await _load_counter()
+    assert await cache.get_or_load("user", "tasks", load) == b"1"
+    assert await cache.get_or_load("user", "tasks", load) == b"1"
+    await cache.invalidate("user")
+    assert await cache.get_or_load("user", "tasks", load) == b"2"
+    stats = await cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+async def test_user_scoped_cache_evictions():
+    cache = UserScopedCache(LRUCacheBackend(_max_size=2))
+    load = await _load_counter()
+    for key in ("first", "second", "third"):
+        await cache.get_or_load("user", key, load)
+    # Третья запись вытесняет первую
+    assert await cache.get_or_load("user", "first", load) == b"4"
+    assert await cache.stats() == CacheStats(hits=0, misses=4, evictions=2)
+
+
+async def test_user_scoped_cache_without_server():
+    backend = RedisCacheBackend.from_url("redis://127.0.0.1:1/0", timeout=0.5)
+    cache = UserScopedCache(backend)
+
+    async def load() -> bytes:
+        return b"value"
+
+    # Хранилище недоступно: данные читаются из источника, запрос не падает
+    assert await cache.get_or_load("user", "tasks", load) == b"value"
+    assert await cache.stats() == CacheStats(hits=0, misses=1, evictions=0)
+    await backend.close()
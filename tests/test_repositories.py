@@ -0,0 +1,188 @@
+import contextlib
+import time
+
+import pytest
+from sqlalchemy import event
+
+from configs.config import ConfigSettings
+from domain.models.category import Category
+from domain.models.task import Task
+from domain.models.user import User
+from domain.values.category_title import CategoryTitle
+from domain.values.email import Email
+from domain.values.password import HashedPassword
+from domain.values.task_name import TaskName
+from infrastructure.database import Database
+from infrastructure.repositories.categories.sqlalchemy import (
+    SQLAlchemyCategoryRepository,
+)
+from infrastructure.repositories.tasks.sqlalchemy import SQLAlchemyTaskRepository
+from infrastructure.repositories.users.sqlalchemy import SQLAlchemyUserRepository
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def database():
+    # Только основной сервер, чтобы все запросы шли через один движок
+    database = Database.from_config(ConfigSettings(DB_REPLICA_DSNS=[]))
+    try:
+        async with database.async_engine.connect():
+            pass
+    except OSError:
+        await database.dispose()
+        pytest.skip("база недоступна")
+    yield database
+    await database.dispose()
+
+
+@pytest.fixture
+async def user(database: Database):
+    user = User.create_user(
+        Email(f"statements-{time.time_ns()}@example.com"), HashedPassword("test")
+    )
+    repository = SQLAlchemyUserRepository(database)
+    await repository.add_user(user)
+    yield user
+    await repository.delete_user(user.oid)
+
+
+@contextlib.contextmanager
+def count_statements(database: Database):
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = database.async_engine.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _selects(statements: list[str]) -> list[str]:
+    return [i for i in statements if i.lstrip().upper().startswith("SELECT")]
+
+
+def _kinds(statements: list[str]) -> list[str]:
+    return [i.split(None, 1)[0].upper() for i in statements]
+
+
+@pytest.fixture
+async def category(database: Database, user: User) -> Category:
+    category = Category(user_oid=user.oid, title=CategoryTitle("statements"))
+    await SQLAlchemyCategoryRepository(database).add_category(category)
+    return category
+
+
+@pytest.fixture
+async def tasks(database: Database, user: User, category: Category) -> list[Task]:
+    tasks = [
+        Task(
+            user_oid=user.oid,
+            name=TaskName(f"statements {i}"),
+            is_complete=False,
+            category_oid=category.oid if i % 2 else None,
+        )
+        for i in range(20)
+    ]
+    await SQLAlchemyTaskRepository(database).add_tasks(tasks)
+    return tasks
+
+
+async def test_get_user_by_oid_single_select(database: Database, user: User):
+    repository = SQLAlchemyUserRepository(database)
+    with count_statements(database) as statements:
+        assert (await repository.get_user_by_oid(user.oid)).oid == user.oid
+    # Связи не подгружаются: ни selectin по задачам и категориям, ни lazy load
+    assert len(_selects(statements)) == 1
+
+
+async def test_get_category_by_oid_single_select(database: Database, user: User):
+    category = Category(user_oid=user.oid, title=CategoryTitle("statements"))
+    repository = SQLAlchemyCategoryRepository(database)
+    await repository.add_category(category)
+    with count_statements(database) as statements:
+        assert (
+            await repository.get_category_by_oid(category.oid, user.oid)
+        ).oid == category.oid
+    assert len(_selects(statements)) == 1
+
+
+async def test_read_models_single_select(
+    database: Database, user: User, category: Category, tasks: list[Task]
+):
+    task_repository = SQLAlchemyTaskRepository(database)
+    category_repository = SQLAlchemyCategoryRepository(database)
+    reads = (
+        (lambda: task_repository.get_task_read_models(user.oid, limit=100), 20),
+        (lambda: task_repository.get_task_read_models(user.oid, limit=5), 5),
+        (
+            lambda: task_repository.get_task_read_models_by_category(
+                user.oid, category.oid, limit=100
+            ),
+            10,
+        ),
+        (lambda: category_repository.get_category_read_models(user.oid, limit=100), 1),
+    )
+    for read, rows in reads:
+        with count_statements(database) as statements:
+            assert len(await read()) == rows
+        assert _kinds(statements) == ["SELECT"]
+
+
+async def test_stream_tasks_single_select(
+    database: Database, user: User, tasks: list[Task]
+):
+    repository = SQLAlchemyTaskRepository(database)
+    with count_statements(database) as statements:
+        assert len([i async for i in repository.stream_tasks(user.oid)]) == 20
+    assert _kinds(statements) == ["SELECT"]
+
+
+async def test_mutations_single_statement(
+    database: Database, user: User, category: Category, tasks: list[Task]
+):
+    repository = SQLAlchemyTaskRepository(database)
+    task_oids = tuple(task.oid for task in tasks)
+    mutations = (
+        (lambda: repository.complete_task(task_oids[0], user.oid), "UPDATE"),
+        (lambda: repository.uncomplete_task(task_oids[0], user.oid), "UPDATE"),
+        (
+            lambda: repository.change_category(category.oid, task_oids[0], user.oid),
+            "UPDATE",
+        ),
+        (
+            lambda: repository.update_task(
+                category.oid, "renamed", None, task_oids[0], user.oid
+            ),
+            "UPDATE",
+        ),
+        (lambda: repository.complete_tasks(task_oids[:10], user.oid), "UPDATE"),
+        (lambda: repository.uncomplete_tasks(task_oids[:10], user.oid), "UPDATE"),
+        (lambda: repository.delete_task(task_oids[0], user.oid), "DELETE"),
+        (lambda: repository.delete_tasks(task_oids[1:], user.oid), "DELETE"),
+        (
+            lambda: SQLAlchemyCategoryRepository(database).update_category(
+                category.oid, "renamed"
+            ),
+            "UPDATE",
+        ),
+    )
+    for mutate, kind in mutations:
+        with count_statements(database) as statements:
+            assert await mutate()
+        # UPDATE/DELETE ... RETURNING без чтения до и после
+        assert _kinds(statements) == [kind]
+
+
+async def test_batch_insert_single_statement(database: Database, user: User):
+    tasks = [
+        Task(user_oid=user.oid, name=TaskName(f"batch {i}"), is_complete=False)
+        for i in range(50)
+    ]
+    with count_statements(database) as statements:
+        await SQLAlchemyTaskRepository(database).add_tasks(tasks)
+    assert _kinds(statements) == ["INSERT"]